@@ -1,10 +1,13 @@
 """Base API client for Apigee Hybrid with authentication and error handling."""
 
 import asyncio
-import json
+import logging
+import time
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 import aiohttp
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 
@@ -24,15 +27,125 @@ logger = get_logger(__name__)
 MAX_RESPONSE_LOG_LENGTH = 500  # Maximum characters to log from error responses
 MAX_RESPONSE_DETAIL_LENGTH = 200  # Maximum characters for error details
 
+# Token lifetime states: fresh -> stale (refresh in background) -> expired (refresh inline)
+TOKEN_STALE_MARGIN = 300  # Seconds before expiry at which a background refresh starts
+TOKEN_EXPIRY_MARGIN = 60  # Seconds before expiry at which a cached token is no longer used
+TOKEN_DEFAULT_LIFETIME = 3600  # Assumed lifetime of a token whose expiry is not reported
+
+# Constants for the shared connection pool
+CONNECTOR_LIMIT_PER_HOST = 64  # Maximum concurrent connections to apigee.googleapis.com
+CONNECTOR_DNS_CACHE_TTL = 600  # Seconds to cache resolved DNS entries
+CONNECTOR_KEEPALIVE_TIMEOUT = 120  # Seconds to keep idle connections open for reuse
+
+# Maximum in-flight requests for batched helpers such as batch_get
+MAX_BATCH_CONCURRENCY = 32
+
+# Process-wide HTTP session, created lazily and closed at application shutdown
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+# Process-wide API client on the shared session, so the token cache, rate
+# limiter and circuit breaker persist across tool calls
+_shared_client: Optional["ApigeeClient"] = None
+
+
+def get_shared_session(settings: Settings) -> aiohttp.ClientSession:
+    """Get the process-wide HTTP session, creating it on first use.
+
+    Reusing one session keeps TCP/TLS connections to the Apigee API alive
+    across tool calls instead of paying a new handshake per request.
+    Must be called from within a running event loop.
+
+    Args:
+        settings: Application settings used to size the connection pool
+
+    Returns:
+        Shared aiohttp client session
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(
+            # aiodns resolves without a thread pool; results are cached for the TTL
+            resolver=aiohttp.AsyncResolver(),
+            limit=settings.rate_limit_requests * 2,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+            keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+        )
+        _shared_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.request_timeout),
+        )
+    return _shared_session
+
+
+def get_shared_client(settings: Settings) -> "ApigeeClient":
+    """Get the process-wide API client, creating it on first use.
+
+    The client uses the shared HTTP session and is rebuilt only if that
+    session has been replaced. Must be called from within a running event
+    loop.
+
+    Args:
+        settings: Application settings used to configure the client
+
+    Returns:
+        Shared Apigee API client
+    """
+    global _shared_client
+    session = get_shared_session(settings)
+    if _shared_client is None or _shared_client.session is not session:
+        _shared_client = ApigeeClient(settings, session=session)
+    return _shared_client
+
+
+async def close_shared_session() -> None:
+    """Close the process-wide HTTP session if it has been created.
+
+    Also drops the shared API client. Intended to be called once at
+    application shutdown.
+    """
+    global _shared_session, _shared_client
+    _shared_client = None
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+
+
+async def _read_prefix(stream: aiohttp.StreamReader, size: int) -> bytes:
+    """Read up to ``size`` bytes from a response body stream.
+
+    A single ``read`` returns whatever is buffered, which may be less than
+    requested even though more of the body is on its way.
+
+    Args:
+        stream: Response body stream
+        size: Maximum number of bytes to read
+
+    Returns:
+        The first ``size`` bytes of the body, or all of it if shorter
+    """
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining > 0:
+        chunk = await stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
 
 # Keep legacy exception for backward compatibility
-class ApigeeAPIError(Exception):
+class ApigeeAPIError(AppError):
     """Base exception for Apigee API errors.
 
     Deprecated: Use exceptions from apigee_hybrid_mcp.exceptions instead.
-    This class is maintained for backward compatibility only.
+    This class is maintained for backward compatibility only and is a thin
+    AppError subclass, so it is handled like any other application error.
     """
 
+    __slots__ = ("response_body", "status_code")
+
     def __init__(
         self, message: str, status_code: Optional[int] = None, response_body: Optional[str] = None
     ):
@@ -43,25 +156,66 @@ class ApigeeAPIError(Exception):
             status_code: HTTP status code if available
             response_body: Response body if available
         """
-        self.message = message
+        super().__init__(
+            message=message,
+            code="APIGEE_API_ERROR",
+            status=status_code or 502,
+            details={"status": status_code} if status_code else None,
+        )
         self.status_code = status_code
         self.response_body = response_body
-        super().__init__(self.message)
 
 
 class ApigeeClient:
     """Base client for interacting with Apigee Hybrid APIs."""
 
-    def __init__(self, settings: Settings):
+    __slots__ = (
+        "_base_headers",
+        "_guarded_request",
+        "_log",
+        "_org_prefix",
+        "_owns_session",
+        "_raw_prefix",
+        "_refresh_lock",
+        "_refresh_task",
+        "_request_headers",
+        "_token_cache",
+        "base_url",
+        "circuit_breaker",
+        "credentials",
+        "organization",
+        "rate_limiter",
+        "session",
+        "settings",
+    )
+
+    def __init__(self, settings: Settings, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Apigee client.
 
         Args:
             settings: Application settings
+            session: Externally owned HTTP session (e.g. from get_shared_session).
+                If omitted, the client creates and closes its own session.
         """
         self.settings = settings
         self.base_url = settings.apigee_api_base_url
         self.organization = settings.apigee_organization
-        self.session: Optional[aiohttp.ClientSession] = None
+        # URL prefixes precomputed (and cached on the frozen settings) so
+        # _build_url is a single concatenation
+        self._raw_prefix = settings.api_base_prefix
+        self._org_prefix = settings.organization_prefix
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        # Logger with per-client context bound once rather than on every call
+        self._log = logger.bind(service="apigee_api", organization=self.organization)
+        # Cached (token, monotonic expiry) pair to skip credential checks per request
+        self._token_cache: Optional[tuple[str, float]] = None
+        # Ensures only one token refresh is in flight across concurrent requests
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        # Header template reused across requests; rebuilt only when the token rotates
+        self._base_headers = {"Content-Type": "application/json"}
+        self._request_headers: dict[str, str] = self._base_headers
         self.credentials: Optional[service_account.Credentials] = None
         self.rate_limiter = RateLimiter(
             settings.rate_limit_requests,
@@ -72,6 +226,8 @@ class ApigeeClient:
             timeout_duration=settings.circuit_breaker_timeout,
             name="apigee_api",
         )
+        # Wrap the transport call once instead of decorating a closure per request
+        self._guarded_request = self.circuit_breaker(self._raw_request)
 
         # Initialize credentials
         if settings.google_credentials_path:
@@ -82,21 +238,96 @@ class ApigeeClient:
 
     async def __aenter__(self) -> "ApigeeClient":
         """Async context manager entry."""
-        timeout = aiohttp.ClientTimeout(total=self.settings.request_timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        if self._owns_session:
+            timeout = aiohttp.ClientTimeout(total=self.settings.request_timeout)
+            self.session = aiohttp.ClientSession(timeout=timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self.session:
+        """Async context manager exit.
+
+        Externally owned sessions are left open for reuse.
+        """
+        if self._owns_session and self.session:
             await self.session.close()
 
-    def _get_auth_token(self) -> str:
+    async def _get_auth_token(self) -> str:
         """Get authentication token.
 
+        Cached tokens move through three states based on remaining lifetime:
+        fresh tokens are returned directly, stale tokens (within
+        TOKEN_STALE_MARGIN of expiry) are returned while a single background
+        task refreshes them, and expired tokens (within TOKEN_EXPIRY_MARGIN)
+        block on a refresh. Refreshes run in a worker thread and are
+        serialized so concurrent requests share one.
+
         Returns:
             Bearer token for API requests
 
+        Raises:
+            AuthenticationError: If credentials are not configured or invalid
+        """
+        if self._token_cache is not None:
+            token, expires_at = self._token_cache
+            remaining = expires_at - time.monotonic()
+            if remaining > TOKEN_STALE_MARGIN:
+                return token
+            if remaining > TOKEN_EXPIRY_MARGIN:
+                self._schedule_background_refresh()
+                return token
+
+        async with self._refresh_lock:
+            # Another request may have refreshed the token while we waited
+            cached = self._cached_token()
+            if cached is not None:
+                return cached
+            return await self._refresh_token()
+
+    def _cached_token(self) -> Optional[str]:
+        """Return the cached token if it has not entered the expiry margin.
+
+        Returns:
+            Cached token, or None if a refresh is required
+        """
+        if self._token_cache is not None:
+            token, expires_at = self._token_cache
+            if time.monotonic() < expires_at - TOKEN_EXPIRY_MARGIN:
+                return token
+        return None
+
+    def _schedule_background_refresh(self) -> None:
+        """Start a background token refresh unless one is already pending."""
+        if self._refresh_task is None and not self._refresh_lock.locked():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+
+    def _clear_refresh_task(self, task: "asyncio.Task[None]") -> None:
+        """Forget the completed background refresh task.
+
+        Args:
+            task: The finished refresh task
+        """
+        self._refresh_task = None
+
+    async def _background_refresh(self) -> None:
+        """Refresh a stale token without blocking the requests that use it."""
+        async with self._refresh_lock:
+            if self._token_cache is not None:
+                _, expires_at = self._token_cache
+                if expires_at - time.monotonic() > TOKEN_STALE_MARGIN:
+                    return
+            try:
+                await self._refresh_token()
+            except AuthenticationError as e:
+                # The expired path will retry inline and surface the error
+                self._log.warning("background_token_refresh_failed", error=e.message)
+
+    async def _refresh_token(self) -> str:
+        """Refresh credentials off the event loop and update the token cache.
+
+        Returns:
+            Newly issued bearer token
+
         Raises:
             AuthenticationError: If credentials are not configured or invalid
         """
@@ -107,8 +338,8 @@ class ApigeeClient:
             )
 
         try:
-            if not self.credentials.valid:
-                self.credentials.refresh(Request())
+            # credentials.refresh performs a blocking HTTPS call
+            await asyncio.to_thread(self.credentials.refresh, Request())
         except Exception as e:
             raise AuthenticationError(
                 message="Failed to refresh authentication token",
@@ -121,8 +352,32 @@ class ApigeeClient:
                 message="Failed to obtain authentication token",
                 details={"reason": "token_is_none"},
             )
+        self._token_cache = self._cache_token(str(token))
+        self._request_headers = self._base_headers | {"Authorization": f"Bearer {token}"}
         return str(token)
 
+    def _cache_token(self, token: str) -> tuple[str, float]:
+        """Build a cache entry for a freshly refreshed token.
+
+        Tokens without a reported expiry are assumed to last
+        TOKEN_DEFAULT_LIFETIME, the standard Google access token lifetime,
+        so they are not refreshed on every request.
+
+        Args:
+            token: The access token
+
+        Returns:
+            (token, monotonic expiry) pair
+        """
+        expiry = getattr(self.credentials, "expiry", None)
+        if not isinstance(expiry, datetime):
+            return token, time.monotonic() + TOKEN_DEFAULT_LIFETIME
+        # google-auth reports expiry as a naive UTC datetime
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+        return token, time.monotonic() + remaining
+
     def _build_url(self, path: str) -> str:
         """Build full API URL.
 
@@ -135,11 +390,48 @@ class ApigeeClient:
         # Remove leading slash if present
         path = path.lstrip("/")
 
-        # If path doesn't start with organizations, prepend it
-        if not path.startswith("organizations/"):
-            path = f"organizations/{self.organization}/{path}"
+        # If path doesn't start with organizations, prepend the org prefix
+        if path.startswith("organizations/"):
+            return self._raw_prefix + path
+        return self._org_prefix + path
+
+    async def _raw_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        body: Optional[bytes],
+        headers: dict[str, str],
+    ) -> aiohttp.ClientResponse:
+        """Send a request on the HTTP session without any resilience handling.
 
-        return f"{self.base_url}/{path}"
+        Called through the circuit breaker by _request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            body: Serialized JSON request body
+            headers: Request headers
+
+        Returns:
+            The unread HTTP response
+
+        Raises:
+            ExternalServiceError: If the session is not initialized
+        """
+        if self.session is None:
+            raise ExternalServiceError(
+                service="apigee_client",
+                message="Client session not initialized",
+            )
+        return await self.session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=body,
+            headers=headers,
+        )
 
     async def _request(
         self,
@@ -149,7 +441,7 @@ class ApigeeClient:
         json_data: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
     ) -> dict[str, Any]:
-        """Make an authenticated API request with resilience patterns.
+        """Make an authenticated API request and parse the JSON response.
 
         Args:
             method: HTTP method
@@ -161,6 +453,45 @@ class ApigeeClient:
         Returns:
             Response JSON data
 
+        Raises:
+            AuthenticationError: If authentication fails
+            ExternalServiceError: If API request fails or returns invalid JSON
+            AppTimeoutError: If request times out
+        """
+        response_body = await self._request_bytes(method, path, params, json_data, headers)
+        if not response_body:
+            return {}
+        try:
+            parsed: dict[str, Any] = orjson.loads(response_body)
+        except orjson.JSONDecodeError as e:
+            self._log.error("unexpected_error", error=str(e), url=self._build_url(path))
+            raise ExternalServiceError(
+                service="apigee_api",
+                message=f"Unexpected error: {str(e)}",
+                details={"error_type": type(e).__name__},
+            )
+        return parsed
+
+    async def _request_bytes(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> bytes:
+        """Make an authenticated API request with resilience patterns.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            params: Query parameters
+            json_data: JSON request body
+            headers: Additional headers
+
+        Returns:
+            Raw response body (empty if the API returned no content)
+
         Raises:
             AuthenticationError: If authentication fails
             ExternalServiceError: If API request fails
@@ -172,59 +503,42 @@ class ApigeeClient:
                 message="Client session not initialized. Use async context manager.",
             )
 
-        # Rate limiting
-        if not self.rate_limiter.acquire():
-            logger.warning("rate_limit_exceeded", path=path)
-            raise ExternalServiceError(
-                service="apigee_api",
-                message="Rate limit exceeded. Please try again later.",
-                status=429,
-            )
+        # Rate limiting: wait for a slot instead of rejecting bursts
+        await self.rate_limiter.wait()
 
         url = self._build_url(path)
+        # Serialize with orjson; Content-Type is already set by the header template
+        body = orjson.dumps(json_data) if json_data is not None else None
 
-        # Prepare headers
-        request_headers = {
-            "Authorization": f"Bearer {self._get_auth_token()}",
-            "Content-Type": "application/json",
-        }
-        if headers:
-            request_headers.update(headers)
+        # Prepare headers (the template is rebuilt whenever the token rotates)
+        await self._get_auth_token()
+        request_headers = self._request_headers | headers if headers else self._request_headers
 
-        logger.info(
-            "api_request",
-            method=method,
-            url=url,
-            params=params,
-        )
+        if params:
+            self._log.info("api_request", method=method, url=url, params=params)
+        else:
+            self._log.info("api_request", method=method, url=url)
 
         try:
-            # Circuit breaker pattern - returns a coroutine that returns a ClientResponse
-            @self.circuit_breaker
-            async def make_request_with_circuit_breaker() -> aiohttp.ClientResponse:
-                if self.session is None:
-                    raise ExternalServiceError(
-                        service="apigee_client",
-                        message="Client session not initialized",
-                    )
-                return await self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    headers=request_headers,
-                )
-
             # Execute the request through circuit breaker
-            async with await make_request_with_circuit_breaker() as response:
-                response_text = await response.text()
-
+            async with await self._guarded_request(
+                method, url, params, body, request_headers
+            ) as response:
                 if response.status >= 400:
-                    logger.error(
-                        "api_error",
-                        status=response.status,
-                        url=url,
-                        response=response_text[:MAX_RESPONSE_LOG_LENGTH],
+                    # Only a prefix of the error body is logged, so don't download the rest;
+                    # leaving the context manager releases the connection
+                    snippet = await _read_prefix(response.content, MAX_RESPONSE_LOG_LENGTH)
+                    # Skip decoding the log snippet when error logging is filtered out
+                    if self._log.is_enabled_for(logging.ERROR):
+                        self._log.error(
+                            "api_error",
+                            status=response.status,
+                            url=url,
+                            response=snippet.decode("utf-8", errors="replace"),
+                        )
+                    # Slice the bytes before decoding so only the detail prefix is decoded
+                    response_detail = snippet[:MAX_RESPONSE_DETAIL_LENGTH].decode(
+                        "utf-8", errors="replace"
                     )
 
                     # Map HTTP status to appropriate exception
@@ -244,7 +558,7 @@ class ApigeeClient:
                             resource_id=path,
                             details={
                                 "status": response.status,
-                                "response": response_text[:MAX_RESPONSE_DETAIL_LENGTH],
+                                "response": response_detail,
                             },
                         )
                     else:
@@ -255,47 +569,80 @@ class ApigeeClient:
                             details={
                                 "status": response.status,
                                 "url": url,
-                                "response": response_text[:MAX_RESPONSE_DETAIL_LENGTH],
+                                "response": response_detail,
                             },
                         )
 
-                # Parse JSON response
-                if response_text:
-                    parsed: dict[str, Any] = json.loads(response_text)
-                    return parsed
-                return {}
+                content: bytes = await response.read()
+                return content
 
+        except AppError:
+            # Errors raised above are already mapped; re-raise them untouched
+            raise
         except asyncio.TimeoutError as e:
-            logger.error("request_timeout", error=str(e), url=url)
+            self._log.error("request_timeout", error=str(e), url=url)
             raise AppTimeoutError(
                 operation=f"{method} {path}",
                 timeout_seconds=self.settings.request_timeout,
             )
         except aiohttp.ClientError as e:
-            logger.error("client_error", error=str(e), url=url)
+            self._log.error("client_error", error=str(e), url=url)
             raise ExternalServiceError(
                 service="apigee_api",
                 message=f"Request failed: {str(e)}",
                 details={"error_type": type(e).__name__},
             )
-        except (
-            AuthenticationError,
-            ExternalServiceError,
-            AppTimeoutError,
-        ):
-            # Re-raise our custom exceptions
-            raise
-        except AppError:
-            # Re-raise any other AppError subclasses (like ResourceNotFoundError)
-            raise
         except Exception as e:
-            logger.error("unexpected_error", error=str(e), url=url)
+            self._log.error("unexpected_error", error=str(e), url=url)
             raise ExternalServiceError(
                 service="apigee_api",
                 message=f"Unexpected error: {str(e)}",
                 details={"error_type": type(e).__name__},
             )
 
+    async def batch_get(
+        self,
+        paths: list[str],
+        concurrency: int = MAX_BATCH_CONCURRENCY,
+    ) -> list[dict[str, Any]]:
+        """Make GET requests for several paths concurrently.
+
+        Requests overlap on the connection pool instead of running one after
+        another; at most ``concurrency`` are in flight at once. Rate limiting
+        and circuit breaking still apply to each request.
+
+        Args:
+            paths: API endpoint paths to fetch
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Response JSON data for each path, in the same order as paths
+
+        Raises:
+            AppError: The first error raised by any of the requests
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(path: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get(path)
+
+        return list(await asyncio.gather(*(fetch(path) for path in paths)))
+
+    async def get_raw(self, path: str, params: Optional[dict[str, Any]] = None) -> bytes:
+        """Make a GET request and return the response body without parsing it.
+
+        For callers that pass the API's JSON through unchanged.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Raw response body (empty if the API returned no content)
+        """
+        return await self._request_bytes("GET", path, params=params)
+
     async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """Make a GET request.
 
@@ -8,8 +8,15 @@ Environment Variables:
     APIGEE_MCP_GOOGLE_CREDENTIALS_PATH: Path to service account JSON
     APIGEE_MCP_APIGEE_ORGANIZATION: Apigee organization name
     APIGEE_MCP_LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR)
+    APIGEE_MCP_LOG_BUFFER_SIZE: Log records to buffer before writing (0 disables)
     APIGEE_MCP_MAX_RETRIES: Maximum retry attempts for failed requests
     APIGEE_MCP_REQUEST_TIMEOUT: Request timeout in seconds
+    APIGEE_MCP_PRETTY_JSON: Indent JSON in tool responses (default: only on a terminal)
+    APIGEE_MCP_LARGE_RESPONSE_THRESHOLD: Store longer JSON responses for paged reads (0 disables)
+    APIGEE_MCP_TOOL_CACHE_TTL: Seconds to cache read-only tool responses (0 disables)
+    APIGEE_MCP_TOOL_CACHE_SIZE: Maximum number of cached tool responses
+    APIGEE_MCP_TOOL_CACHE_STALE_TTL: Seconds past expiry a cached response may be
+        served while the Apigee API is failing (0 disables)
 
 Example:
     from apigee_hybrid_mcp.config import get_settings
@@ -18,6 +25,7 @@ Example:
     print(f"Organization: {settings.apigee_organization}")
 """
 
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -29,7 +37,7 @@ class Settings(BaseSettings):
 
     This class uses Pydantic for type-safe configuration management.
     All settings can be overridden via environment variables with
-    the APIGEE_MCP_ prefix.
+    the APIGEE_MCP_ prefix. Instances are frozen (immutable and hashable).
     """
 
     # Google Cloud Configuration
@@ -65,6 +73,11 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     )
+    log_buffer_size: int = Field(
+        default=0,
+        ge=0,
+        description="Log records to buffer before writing (0 disables; ERROR flushes)",
+    )
 
     # Resilience Configuration
     max_retries: int = Field(
@@ -88,6 +101,40 @@ class Settings(BaseSettings):
         description="Circuit breaker timeout in seconds before retry",
     )
 
+    pretty_json: Optional[bool] = Field(
+        default=None,
+        description="Indent JSON in tool responses (unset: only when stdout is a terminal)",
+    )
+
+    large_response_threshold: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Store response JSON longer than this many characters for paged retrieval "
+            "with fetch-cached-response instead of inlining it (0 disables)"
+        ),
+    )
+
+    # Response Caching
+    tool_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds to cache list-*/get-* tool responses (0 disables)",
+    )
+    tool_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of cached tool responses",
+    )
+    tool_cache_stale_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Seconds past expiry a cached tool response may be served while the "
+            "Apigee API is failing (0 disables)"
+        ),
+    )
+
     # Rate Limiting
     rate_limit_requests: int = Field(
         default=100,
@@ -103,14 +150,35 @@ class Settings(BaseSettings):
         case_sensitive=False,
         env_file=".env",
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
+    @cached_property
+    def api_base_prefix(self) -> str:
+        """Apigee API base URL with exactly one trailing slash.
+
+        Returns:
+            URL prefix for organization-qualified paths
+        """
+        return f"{self.apigee_api_base_url.rstrip('/')}/"
+
+    @cached_property
+    def organization_prefix(self) -> str:
+        """URL prefix for resources in the configured organization.
+
+        Returns:
+            URL prefix ending in ``organizations/{apigee_organization}/``
+        """
+        return f"{self.api_base_prefix}organizations/{self.apigee_organization}/"
+
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings instance.
 
-    This function creates and returns a configured Settings object.
-    Settings are loaded from environment variables and .env file.
+    Settings are loaded from environment variables and .env file on the
+    first call and cached for the lifetime of the process. Call
+    ``get_settings.cache_clear()`` to force a reload.
 
     Returns:
         Settings: Configured settings instance with all parameters
@@ -5,17 +5,51 @@ appropriate HTTP status codes and JSON responses. It ensures consistent
 error formatting across all endpoints.
 """
 
+import logging
 import traceback
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from mcp.types import TextContent
 
-from apigee_hybrid_mcp.exceptions import AppError, ExternalServiceError
+from apigee_hybrid_mcp.exceptions import (
+    AppError,
+    ExternalServiceError,
+    InvalidParameterError,
+    ResourceAlreadyExistsError,
+    ResourceNotFoundError,
+)
+from apigee_hybrid_mcp.repository.team_repository import (
+    TeamAlreadyExistsError,
+    TeamNotFoundError,
+)
 from apigee_hybrid_mcp.utils.logging import get_logger
 from apigee_hybrid_mcp.validation import redact_sensitive_fields
 
 logger = get_logger(__name__)
 
+# Structured log event names
+_EVENT_APP_ERROR = "app_error_occurred"
+_EVENT_UNEXPECTED_ERROR = "unexpected_error"
+
+# Exception class -> class name, filled on first use
+_class_names: Dict[type, str] = {}
+
+
+def _class_name(error: BaseException) -> str:
+    """Return the class name of an exception, cached per class.
+
+    Args:
+        error: Exception instance
+
+    Returns:
+        The exception's class name
+    """
+    error_class = type(error)
+    name = _class_names.get(error_class)
+    if name is None:
+        name = _class_names[error_class] = error_class.__name__
+    return name
+
 
 def format_error_response(
     error: Exception,
@@ -30,67 +64,75 @@ def format_error_response(
     Args:
         error: The exception to format
         operation: Name of the operation that failed
-        include_traceback: Whether to include stack trace (for unexpected errors)
+        include_traceback: Whether to include stack trace (for unexpected errors).
+            AppError instances never pay for traceback formatting.
 
     Returns:
         List of TextContent with formatted error information
     """
     if isinstance(error, AppError):
-        # Use structured error information from AppError
-        log_level = "warning" if error.status < 500 else "error"
-
-        # Log with appropriate level
-        log_data = {
-            "operation": operation,
-            "error_code": error.code,
-            "error_message": error.message,
-            "status": error.status,
-            "correlation_id": error.correlation_id,
-            "details": redact_sensitive_fields(error.details),
-        }
-
-        if log_level == "error":
-            logger.error("app_error_occurred", **log_data)
-        else:
-            logger.warning("app_error_occurred", **log_data)
+        # Log with appropriate level; skip building the record if it would be filtered
+        level = logging.WARNING if error.status < 500 else logging.ERROR
+        if logger.is_enabled_for(level):
+            logger.log(
+                level,
+                _EVENT_APP_ERROR,
+                operation=operation,
+                error_code=error.code,
+                error_message=error.message,
+                status=error.status,
+                correlation_id=error.correlation_id,
+                details=redact_sensitive_fields(error.details),
+            )
 
         # Format response
-        response_text = f"""Error in {operation}
-
-Error Code: {error.code}
-Status: {error.status}
-Message: {error.message}
-Correlation ID: {error.correlation_id}
-
-Details:
-{_format_details(error.details)}"""
+        response_text = "\n".join(
+            (
+                "Error in " + operation,
+                "",
+                "Error Code: " + error.code,
+                "Status: " + str(error.status),
+                "Message: " + error.message,
+                "Correlation ID: " + error.correlation_id,
+                "",
+                "Details:",
+                _format_details(error.details),
+            )
+        )
 
     else:
         # Handle unexpected generic exceptions
         error_message = str(error)
-        error_type = type(error).__name__
+        error_type = _class_name(error)
+
+        # Format the stack trace once and reuse it for the log and the response
+        traceback_text = "".join(traceback.format_exception(error)) if include_traceback else None
 
         # Log unexpected error with stack trace
-        logger.error(
-            "unexpected_error",
-            operation=operation,
-            error_type=error_type,
-            error_message=error_message,
-            traceback=traceback.format_exc() if include_traceback else None,
-        )
+        if logger.is_enabled_for(logging.ERROR):
+            logger.error(
+                _EVENT_UNEXPECTED_ERROR,
+                operation=operation,
+                error_type=error_type,
+                error_message=error_message,
+                traceback=traceback_text,
+            )
 
         # Format response
-        response_text = f"""Unexpected Error in {operation}
-
-Error Type: {error_type}
-Message: {error_message}
-
-This is an unexpected error. Please contact support with the details above."""
-
-        if include_traceback:
-            response_text += f"\n\nStack Trace:\n{traceback.format_exc()}"
-
-    return [TextContent(type="text", text=response_text)]
+        parts = [
+            "Unexpected Error in " + operation,
+            "",
+            "Error Type: " + error_type,
+            "Message: " + error_message,
+            "",
+            "This is an unexpected error. Please contact support with the details above.",
+        ]
+        if traceback_text is not None:
+            parts += ("", "Stack Trace:", traceback_text)
+        response_text = "\n".join(parts)
+
+    # Response text is generated here, so skip re-validating it
+    return [TextContent.model_construct(type="text", text=response_text)]
 
 
 def _format_details(details: Dict[str, Any], indent: int = 0) -> str:
@@ -103,23 +145,37 @@ def _format_details(details: Dict[str, Any], indent: int = 0) -> str:
     Returns:
         Formatted string representation
     """
+    lines: List[str] = []
+    _append_details(lines, details, indent)
+    return "\n".join(lines)
+
+
+def _append_details(lines: List[str], details: Dict[str, Any], indent: int) -> None:
+    """Append formatted detail lines to a shared buffer.
+
+    Nested dictionaries write into the same buffer, so the text is joined
+    once by the caller instead of once per nesting level.
+
+    Args:
+        lines: Output buffer of formatted lines
+        details: Dictionary of error details
+        indent: Indentation level for nested items
+    """
     if not details:
-        return "  (none)"
+        lines.append("  (none)")
+        return
 
-    lines = []
     prefix = "  " * indent
 
     for key, value in details.items():
         if isinstance(value, dict):
             lines.append(f"{prefix}{key}:")
-            lines.append(_format_details(value, indent + 1))
+            _append_details(lines, value, indent + 1)
         elif isinstance(value, list):
-            lines.append(f"{prefix}{key}: [{', '.join(str(v) for v in value)}]")
+            lines.append(f"{prefix}{key}: [{', '.join(map(str, value))}]")
         else:
             lines.append(f"{prefix}{key}: {value}")
 
-    return "\n".join(lines)
-
 
 def handle_external_api_error(
     error: Exception,
@@ -147,7 +203,7 @@ def handle_external_api_error(
     service_error = ExternalServiceError(
         service=service,
         message=str(error),
-        details={"original_error": type(error).__name__},
+        details={"original_error": _class_name(error)},
     )
 
     return format_error_response(service_error, operation)
@@ -170,8 +226,6 @@ def create_validation_error_response(
     Returns:
         Formatted validation error response
     """
-    from apigee_hybrid_mcp.exceptions import InvalidParameterError
-
     error = InvalidParameterError(parameter=parameter, value="", reason=reason)
     return format_error_response(error, operation)
 
@@ -224,6 +278,19 @@ class ErrorContext:
         return False
 
 
+# Repository exception type -> AppError factory, dispatched on the exact type
+_REPOSITORY_ERROR_MAP: Dict[type, Callable[[Any], AppError]] = {
+    TeamNotFoundError: lambda error: ResourceNotFoundError(
+        resource_type="team",
+        resource_id=error.team_id,
+    ),
+    TeamAlreadyExistsError: lambda error: ResourceAlreadyExistsError(
+        resource_type="team",
+        resource_id=error.team_name,
+    ),
+}
+
+
 def map_repository_error(error: Exception) -> AppError:
     """Map repository-specific errors to AppError hierarchy.
 
@@ -236,28 +303,18 @@ def map_repository_error(error: Exception) -> AppError:
     Returns:
         Mapped AppError instance
     """
-    from apigee_hybrid_mcp.exceptions import ResourceAlreadyExistsError, ResourceNotFoundError
-    from apigee_hybrid_mcp.repository.team_repository import (
-        TeamAlreadyExistsError,
-        TeamNotFoundError,
-    )
-
-    if isinstance(error, TeamNotFoundError):
-        return ResourceNotFoundError(
-            resource_type="team",
-            resource_id=error.team_id,
-        )
-    elif isinstance(error, TeamAlreadyExistsError):
-        return ResourceAlreadyExistsError(
-            resource_type="team",
-            resource_id=error.team_name,
-        )
-    elif isinstance(error, AppError):
+    handler = _REPOSITORY_ERROR_MAP.get(type(error))
+    if handler is not None:
+        return handler(error)
+    if isinstance(error, AppError):
         return error
-    else:
-        # Wrap unknown errors
-        return ExternalServiceError(
-            service="repository",
-            message=str(error),
-            details={"error_type": type(error).__name__},
-        )
+    # Subclasses of repository errors fall back to the nearest mapped base
+    for error_type, handler in _REPOSITORY_ERROR_MAP.items():
+        if isinstance(error, error_type):
+            return handler(error)
+    # Wrap unknown errors
+    return ExternalServiceError(
+        service="repository",
+        message=str(error),
+        details={"error_type": _class_name(error)},
+    )
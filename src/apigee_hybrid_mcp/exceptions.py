@@ -22,12 +22,28 @@ Each exception includes:
     - Machine-readable error code
     - Human-readable message
     - Optional details dictionary
-    - Correlation ID for tracking
+    - Correlation ID for tracking (opaque 32-character hex token)
 """
 
-import uuid
+import secrets
 from typing import Any, Dict, Optional
 
+# Correlation IDs are opaque tokens; nothing parses them as RFC 4122 UUIDs.
+_new_correlation_id = secrets.token_hex
+
+# Machine-readable error codes, shared by every instance of each exception type.
+_CODE_APP_ERROR = "APP_ERROR"
+_CODE_VALIDATION_ERROR = "VALIDATION_ERROR"
+_CODE_INVALID_PARAMETER = "INVALID_PARAMETER"
+_CODE_MISSING_PARAMETER = "MISSING_PARAMETER"
+_CODE_EXPIRED_PARAMETER = "EXPIRED_PARAMETER"
+_CODE_AUTHENTICATION_ERROR = "AUTHENTICATION_ERROR"
+_CODE_AUTHORIZATION_ERROR = "AUTHORIZATION_ERROR"
+_CODE_RESOURCE_NOT_FOUND = "RESOURCE_NOT_FOUND"
+_CODE_RESOURCE_ALREADY_EXISTS = "RESOURCE_ALREADY_EXISTS"
+_CODE_TIMEOUT_ERROR = "TIMEOUT_ERROR"
+_CODE_EXTERNAL_SERVICE_ERROR = "EXTERNAL_SERVICE_ERROR"
+
 
 class AppError(Exception):
     """Base exception for all application errors.
@@ -43,10 +59,12 @@ class AppError(Exception):
         correlation_id: Unique identifier for error tracking
     """
 
+    __slots__ = ("code", "correlation_id", "details", "message", "status")
+
     def __init__(
         self,
         message: str,
-        code: str = "APP_ERROR",
+        code: str = _CODE_APP_ERROR,
         status: int = 500,
         details: Optional[Dict[str, Any]] = None,
         correlation_id: Optional[str] = None,
@@ -65,7 +83,7 @@ class AppError(Exception):
         self.code = code
         self.status = status
         self.details = details or {}
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self.correlation_id = correlation_id or _new_correlation_id(16)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON serialization.
@@ -94,10 +112,12 @@ class ValidationError(AppError):
     Raised when input validation fails. Status code is 422 (Unprocessable Entity).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
-        code: str = "VALIDATION_ERROR",
+        code: str = _CODE_VALIDATION_ERROR,
         details: Optional[Dict[str, Any]] = None,
         correlation_id: Optional[str] = None,
     ):
@@ -125,6 +145,8 @@ class InvalidParameterError(ValidationError):
     (e.g., wrong format, out of range, invalid type).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parameter: str,
@@ -142,13 +164,14 @@ class InvalidParameterError(ValidationError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details.update({"parameter": parameter, "reason": reason})
+        error_details = {"parameter": parameter, "reason": reason}
+        if details:
+            error_details = {**details, **error_details}
         # Don't include value in details to avoid leaking sensitive data
         message = f"Invalid parameter '{parameter}': {reason}"
         super().__init__(
             message=message,
-            code="INVALID_PARAMETER",
+            code=_CODE_INVALID_PARAMETER,
             details=error_details,
             correlation_id=correlation_id,
         )
@@ -160,6 +183,8 @@ class MissingParameterError(ValidationError):
     Used when a mandatory parameter is not provided in the request.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parameter: str,
@@ -173,12 +198,13 @@ class MissingParameterError(ValidationError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details.update({"parameter": parameter})
+        error_details = {"parameter": parameter}
+        if details:
+            error_details = {**details, **error_details}
         message = f"Missing required parameter: '{parameter}'"
         super().__init__(
             message=message,
-            code="MISSING_PARAMETER",
+            code=_CODE_MISSING_PARAMETER,
             details=error_details,
             correlation_id=correlation_id,
         )
@@ -191,6 +217,8 @@ class ExpiredParameterError(ValidationError):
     their validity period.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parameter: str,
@@ -206,14 +234,15 @@ class ExpiredParameterError(ValidationError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details.update({"parameter": parameter})
+        error_details = {"parameter": parameter}
         if expired_at:
             error_details["expired_at"] = expired_at
+        if details:
+            error_details = {**details, **error_details}
         message = f"Parameter '{parameter}' has expired"
         super().__init__(
             message=message,
-            code="EXPIRED_PARAMETER",
+            code=_CODE_EXPIRED_PARAMETER,
             details=error_details,
             correlation_id=correlation_id,
         )
@@ -226,6 +255,8 @@ class AuthenticationError(AppError):
     Status code is 401 (Unauthorized).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -241,7 +272,7 @@ class AuthenticationError(AppError):
         """
         super().__init__(
             message=message,
-            code="AUTHENTICATION_ERROR",
+            code=_CODE_AUTHENTICATION_ERROR,
             status=401,
             details=details,
             correlation_id=correlation_id,
@@ -255,6 +286,8 @@ class AuthorizationError(AppError):
     Status code is 403 (Forbidden).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Access denied",
@@ -270,12 +303,12 @@ class AuthorizationError(AppError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
+        error_details = dict(details) if details else {}
         if resource:
             error_details["resource"] = resource
         super().__init__(
             message=message,
-            code="AUTHORIZATION_ERROR",
+            code=_CODE_AUTHORIZATION_ERROR,
             status=403,
             details=error_details,
             correlation_id=correlation_id,
@@ -288,6 +321,8 @@ class ResourceNotFoundError(AppError):
     Status code is 404 (Not Found).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource_type: str,
@@ -303,12 +338,13 @@ class ResourceNotFoundError(AppError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details.update({"resource_type": resource_type, "resource_id": resource_id})
+        error_details = {"resource_type": resource_type, "resource_id": resource_id}
+        if details:
+            error_details = {**details, **error_details}
         message = f"{resource_type.capitalize()} not found: {resource_id}"
         super().__init__(
             message=message,
-            code="RESOURCE_NOT_FOUND",
+            code=_CODE_RESOURCE_NOT_FOUND,
             status=404,
             details=error_details,
             correlation_id=correlation_id,
@@ -321,6 +357,8 @@ class ResourceAlreadyExistsError(AppError):
     Status code is 409 (Conflict).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource_type: str,
@@ -336,12 +374,13 @@ class ResourceAlreadyExistsError(AppError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details.update({"resource_type": resource_type, "resource_id": resource_id})
+        error_details = {"resource_type": resource_type, "resource_id": resource_id}
+        if details:
+            error_details = {**details, **error_details}
         message = f"{resource_type.capitalize()} already exists: {resource_id}"
         super().__init__(
             message=message,
-            code="RESOURCE_ALREADY_EXISTS",
+            code=_CODE_RESOURCE_ALREADY_EXISTS,
             status=409,
             details=error_details,
             correlation_id=correlation_id,
@@ -354,6 +393,8 @@ class TimeoutError(AppError):
     Status code is 408 (Request Timeout).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         operation: str,
@@ -369,14 +410,15 @@ class TimeoutError(AppError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details["operation"] = operation
+        error_details: Dict[str, Any] = {"operation": operation}
         if timeout_seconds:
             error_details["timeout_seconds"] = timeout_seconds
+        if details:
+            error_details = {**details, **error_details}
         message = f"Operation timed out: {operation}"
         super().__init__(
             message=message,
-            code="TIMEOUT_ERROR",
+            code=_CODE_TIMEOUT_ERROR,
             status=408,
             details=error_details,
             correlation_id=correlation_id,
@@ -390,6 +432,8 @@ class ExternalServiceError(AppError):
     Status code is 502 (Bad Gateway) or 503 (Service Unavailable).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         service: str,
@@ -407,12 +451,13 @@ class ExternalServiceError(AppError):
             details: Additional context
             correlation_id: Unique error tracking ID
         """
-        error_details = details or {}
-        error_details["service"] = service
+        error_details = {"service": service}
+        if details:
+            error_details = {**details, **error_details}
         full_message = f"{service}: {message}"
         super().__init__(
             message=full_message,
-            code="EXTERNAL_SERVICE_ERROR",
+            code=_CODE_EXTERNAL_SERVICE_ERROR,
             status=status,
             details=error_details,
             correlation_id=correlation_id,
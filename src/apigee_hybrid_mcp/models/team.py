@@ -9,9 +9,18 @@ This is a custom implementation for organizational purposes.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+
+def _utcnow() -> datetime:
+    """Return the current timezone-aware UTC time.
+
+    Returns:
+        Current UTC datetime
+    """
+    return datetime.now(timezone.utc)
 
 
 class TeamBase(BaseModel):
@@ -23,12 +32,17 @@ class TeamBase(BaseModel):
         members: List of member identifiers (email addresses or user IDs)
     """
 
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False, extra="ignore")
+
     name: str = Field(
         ...,
         min_length=3,
         max_length=255,
-        pattern=r"^[a-zA-Z0-9\-_]+$",
-        description="Team name (alphanumeric, hyphens, underscores only)",
+        pattern=r"^[a-zA-Z0-9][a-zA-Z0-9\-_]*[a-zA-Z0-9]$",
+        description=(
+            "Team name (alphanumeric, hyphens, underscores only; "
+            "must start and end with an alphanumeric character)"
+        ),
     )
     description: Optional[str] = Field(None, max_length=1000, description="Team description")
     members: List[str] = Field(
@@ -36,26 +50,6 @@ class TeamBase(BaseModel):
         description="List of team member identifiers (emails or user IDs)",
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, value: str) -> str:
-        """Validate team name follows conventions.
-
-        Args:
-            value: The team name to validate
-
-        Returns:
-            The validated team name
-
-        Raises:
-            ValueError: If name is invalid
-        """
-        if value.startswith("-") or value.endswith("-"):
-            raise ValueError("Team name cannot start or end with hyphen")
-        if value.startswith("_") or value.endswith("_"):
-            raise ValueError("Team name cannot start or end with underscore")
-        return value
-
     @field_validator("members")
     @classmethod
     def validate_members(cls, value: List[str]) -> List[str]:
@@ -70,7 +64,7 @@ class TeamBase(BaseModel):
         Raises:
             ValueError: If members list is invalid
         """
-        if len(value) != len(set(value)):
+        if len(value) > 1 and len(value) != len(set(value)):
             raise ValueError("Duplicate members not allowed")
         return value
 
@@ -112,7 +106,7 @@ class TeamUpdate(BaseModel):
         Raises:
             ValueError: If members list is invalid
         """
-        if value is not None and len(value) != len(set(value)):
+        if value is not None and len(value) > 1 and len(value) != len(set(value)):
             raise ValueError("Duplicate members not allowed")
         return value
 
@@ -120,7 +114,8 @@ class TeamUpdate(BaseModel):
 class Team(TeamBase):
     """Complete Team entity with metadata.
 
-    This is the full representation returned by the API.
+    This is the full representation returned by the API. Instances are
+    frozen; repositories produce updated copies with ``model_copy``.
 
     Attributes:
         id: Unique team identifier (generated server-side)
@@ -131,15 +126,42 @@ class Team(TeamBase):
         updated_at: Timestamp when team was last updated
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique team identifier")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp"
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Last update timestamp"
-    )
+    created_at: datetime = Field(default_factory=_utcnow, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=_utcnow, description="Last update timestamp")
+
+    # (timestamp, isoformat) pairs; keyed by identity so model_copy updates
+    # invalidate them automatically.
+    _created_iso: Tuple[Optional[datetime], str] = PrivateAttr(default=(None, ""))
+    _updated_iso: Tuple[Optional[datetime], str] = PrivateAttr(default=(None, ""))
+
+    @property
+    def created_at_iso(self) -> str:
+        """ISO 8601 creation timestamp, formatted once per value.
+
+        Returns:
+            The creation timestamp as an ISO 8601 string
+        """
+        cached_at, text = self._created_iso
+        if cached_at is not self.created_at:
+            text = self.created_at.isoformat()
+            self._created_iso = (self.created_at, text)
+        return text
 
-    model_config = {"from_attributes": True}
+    @property
+    def updated_at_iso(self) -> str:
+        """ISO 8601 update timestamp, formatted once per value.
+
+        Returns:
+            The last update timestamp as an ISO 8601 string
+        """
+        cached_at, text = self._updated_iso
+        if cached_at is not self.updated_at:
+            text = self.updated_at.isoformat()
+            self._updated_iso = (self.updated_at, text)
+        return text
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert team to dictionary representation.
@@ -152,6 +174,11 @@ class Team(TeamBase):
             "name": self.name,
             "description": self.description,
             "members": self.members,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at_iso,
+            "updated_at": self.updated_at_iso,
         }
+
+
+# Bound validators for request payloads; dispatch straight into the compiled core schema
+team_create_validate = TeamCreate.model_validate
+team_update_validate = TeamUpdate.model_validate
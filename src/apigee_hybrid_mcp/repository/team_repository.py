@@ -5,16 +5,25 @@ and provides an in-memory implementation for development/testing.
 Production implementations could use Cloud Datastore, Firestore, etc.
 """
 
+import sys
+import threading
 import uuid
-from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+
+import orjson
 
 from apigee_hybrid_mcp.models.team import Team, TeamCreate, TeamUpdate
 
 
 class TeamNotFoundError(Exception):
-    """Exception raised when a team is not found."""
+    """Exception raised when a team is not found.
+
+    The message is only formatted when the exception is rendered; the
+    repository layer usually maps it to an AppError using ``team_id``.
+    """
+
+    __slots__ = ("team_id",)
 
     def __init__(self, team_id: str):
         """Initialize exception.
@@ -22,12 +31,22 @@ class TeamNotFoundError(Exception):
         Args:
             team_id: ID of the team that was not found
         """
+        super().__init__(team_id)
         self.team_id = team_id
-        super().__init__(f"Team not found: {team_id}")
+
+    def __str__(self) -> str:
+        """Human-readable error message."""
+        return f"Team not found: {self.team_id}"
 
 
 class TeamAlreadyExistsError(Exception):
-    """Exception raised when attempting to create a team that already exists."""
+    """Exception raised when attempting to create a team that already exists.
+
+    The message is only formatted when the exception is rendered; the
+    repository layer usually maps it to an AppError using ``team_name``.
+    """
+
+    __slots__ = ("team_name",)
 
     def __init__(self, team_name: str):
         """Initialize exception.
@@ -35,19 +54,36 @@ class TeamAlreadyExistsError(Exception):
         Args:
             team_name: Name of the team that already exists
         """
+        super().__init__(team_name)
         self.team_name = team_name
-        super().__init__(f"Team already exists: {team_name}")
+
+    def __str__(self) -> str:
+        """Human-readable error message."""
+        return f"Team already exists: {self.team_name}"
 
 
-class TeamRepository(ABC):
-    """Abstract base class for Team repositories.
+def _name_key(name: str) -> str:
+    """Normalize a team name for case-insensitive indexing.
+
+    Args:
+        name: Team name as supplied by the caller
+
+    Returns:
+        Case-folded, interned name used as the index key
+    """
+    return sys.intern(name.casefold())
+
+
+class TeamRepository(Protocol):
+    """Protocol for Team repositories.
 
     This interface defines the contract for team data persistence.
     Implementations can use different storage backends (in-memory,
-    Cloud Datastore, Firestore, PostgreSQL, etc.).
+    Cloud Datastore, Firestore, PostgreSQL, etc.). Conformance is
+    structural; backends that subclass the protocol explicitly also
+    inherit the default bulk operations.
     """
 
-    @abstractmethod
     async def create(self, team_data: TeamCreate) -> Team:
         """Create a new team.
 
@@ -60,9 +96,8 @@ class TeamRepository(ABC):
         Raises:
             TeamAlreadyExistsError: If team with same name exists
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_id(self, team_id: str) -> Optional[Team]:
         """Get team by ID.
 
@@ -72,9 +107,8 @@ class TeamRepository(ABC):
         Returns:
             Team if found, None otherwise
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Team]:
         """Get team by name.
 
@@ -84,18 +118,38 @@ class TeamRepository(ABC):
         Returns:
             Team if found, None otherwise
         """
-        pass
+        ...
 
-    @abstractmethod
     async def list_all(self) -> List[Team]:
         """List all teams.
 
         Returns:
             List of all teams
         """
-        pass
+        ...
+
+    async def list_all_json(self) -> bytes:
+        """List all teams as a JSON array.
+
+        The default implementation encodes :meth:`list_all`; backends can
+        override it to reuse an encoding between writes.
+
+        Returns:
+            UTF-8 JSON array of :meth:`Team.to_dict` objects
+        """
+        return orjson.dumps([team.to_dict() for team in await self.list_all()])
+
+    async def get_by_member(self, member_id: str) -> List[Team]:
+        """List teams that include a member.
+
+        Args:
+            member_id: Member identifier (email address or user ID)
+
+        Returns:
+            Teams whose members include member_id
+        """
+        ...
 
-    @abstractmethod
     async def update(self, team_id: str, team_data: TeamUpdate) -> Team:
         """Update an existing team.
 
@@ -109,9 +163,8 @@ class TeamRepository(ABC):
         Raises:
             TeamNotFoundError: If team not found
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete(self, team_id: str) -> bool:
         """Delete a team.
 
@@ -121,9 +174,8 @@ class TeamRepository(ABC):
         Returns:
             True if deleted, False if not found
         """
-        pass
+        ...
 
-    @abstractmethod
     async def exists_by_name(self, name: str) -> bool:
         """Check if a team with given name exists.
 
@@ -133,11 +185,44 @@ class TeamRepository(ABC):
         Returns:
             True if exists, False otherwise
         """
-        pass
+        ...
+
+    async def bulk_create(self, items: List[TeamCreate]) -> List[Team]:
+        """Create several teams.
+
+        The default implementation calls :meth:`create` once per item;
+        backends can override it to amortize per-call costs.
+
+        Args:
+            items: Team creation data, in insertion order
+
+        Returns:
+            Created teams in the same order as items
+
+        Raises:
+            TeamAlreadyExistsError: If any team name already exists
+        """
+        return [await self.create(team_data) for team_data in items]
 
+    async def bulk_get_by_ids(self, team_ids: List[str]) -> Dict[str, Team]:
+        """Get several teams by ID.
 
-class InMemoryTeamRepository(TeamRepository):
-    """In-memory implementation of TeamRepository.
+        Args:
+            team_ids: Team identifiers
+
+        Returns:
+            Mapping of found team IDs to teams; missing IDs are omitted
+        """
+        teams: Dict[str, Team] = {}
+        for team_id in team_ids:
+            team = await self.get_by_id(team_id)
+            if team is not None:
+                teams[team_id] = team
+        return teams
+
+
+class InMemoryTeamRepository:
+    """In-memory implementation of the TeamRepository protocol.
 
     This implementation stores teams in memory and is suitable for:
     - Development and testing
@@ -147,53 +232,204 @@ class InMemoryTeamRepository(TeamRepository):
     For production with multiple instances, use a persistent storage
     backend like Cloud Datastore or Firestore.
 
+    Team names are unique case-insensitively: ``Admins`` and ``admins`` are
+    the same team for lookups and duplicate checks, while ``Team.name``
+    keeps the spelling it was created with.
+
+    Every operation also has a synchronous ``*_sync`` variant. The async
+    methods delegate to them, and in-process callers in tight loops can call
+    them directly to avoid a coroutine per operation.
+
     Attributes:
         _teams: Dictionary mapping team IDs to Team objects
-        _teams_by_name: Dictionary mapping team names to team IDs (for quick lookup)
+        _teams_by_name: Dictionary mapping case-folded team names to Team objects
+        _teams_by_member: Dictionary mapping member identifiers to team IDs
+            (insertion-ordered dicts used as sets)
+        _list_cache: Snapshot of all teams in creation order, rebuilt after writes
+        _list_json_cache: JSON encoding of the team listing, rebuilt after writes
+        _revision: Write counter, incremented by every create, update and delete
+        _write_lock: Serializes writers across threads; reads take no lock
     """
 
-    def __init__(self) -> None:
-        """Initialize the repository with empty storage."""
+    def __init__(self, use_uuid: bool = True) -> None:
+        """Initialize the repository with empty storage.
+
+        Args:
+            use_uuid: Generate random UUID hex IDs. When False, IDs come from a
+                per-repository counter (``team-1``, ``team-2``, ...), which is
+                cheaper for bulk seeding and tests.
+        """
+        self._use_uuid = use_uuid
+        self._id_counter = 0
         self._teams: Dict[str, Team] = {}
-        self._teams_by_name: Dict[str, str] = {}
+        self._teams_by_name: Dict[str, Team] = {}
+        self._teams_by_member: Dict[str, Dict[str, None]] = {}
+        self._list_cache: Optional[Tuple[Team, ...]] = None
+        self._list_json_cache: Optional[bytes] = None
+        self._revision = 0
+        self._write_lock = threading.Lock()
 
-    async def create(self, team_data: TeamCreate) -> Team:
-        """Create a new team.
+    @property
+    def revision(self) -> int:
+        """Generation number of the stored data.
 
-        Args:
-            team_data: Team creation data
+        Callers that cache reads can stamp them with this value and reuse
+        them for as long as it is unchanged.
 
         Returns:
-            Created team with generated ID and timestamps
+            Number of writes applied so far
+        """
+        return self._revision
 
-        Raises:
-            TeamAlreadyExistsError: If team with same name exists
+    def _changed(self) -> None:
+        """Drop derived snapshots and advance the revision after a write."""
+        self._list_cache = None
+        self._list_json_cache = None
+        self._revision += 1
+
+    def _now(self) -> datetime:
+        """Return the timestamp to stamp on created or updated teams.
+
+        Kept as a single hook so tests can pin time and batch operations can
+        take one timestamp for a whole batch.
+
+        Returns:
+            Current timezone-aware UTC datetime
         """
-        # Check for duplicate name
-        if await self.exists_by_name(team_data.name):
-            raise TeamAlreadyExistsError(team_data.name)
+        return datetime.now(timezone.utc)
 
-        # Generate ID and timestamps
-        team_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
+    def _new_id(self) -> str:
+        """Generate an identifier for a new team.
 
-        # Create team entity
+        Returns:
+            UUID hex string, or the next counter ID when UUIDs are disabled
+        """
+        if self._use_uuid:
+            return uuid.uuid4().hex
+        self._id_counter += 1
+        return f"team-{self._id_counter}"
+
+    def _store(self, team_data: TeamCreate, now: datetime) -> Team:
+        """Build a team and add it to every index.
+
+        Callers check for duplicate names and reset the list snapshot.
+
+        Args:
+            team_data: Team creation data
+            now: Creation timestamp
+
+        Returns:
+            The stored team
+        """
+        team_id = self._new_id()
         team = Team(
             id=team_id,
             name=team_data.name,
             description=team_data.description,
-            members=team_data.members.copy(),
+            members=team_data.members,
             created_at=now,
             updated_at=now,
         )
-
-        # Store team
         self._teams[team_id] = team
-        self._teams_by_name[team_data.name] = team_id
-
+        self._teams_by_name[_name_key(team.name)] = team
+        self._index_members(team_id, team.members)
         return team
 
-    async def get_by_id(self, team_id: str) -> Optional[Team]:
+    def _index_members(self, team_id: str, members: Iterable[str]) -> None:
+        """Add a team to the member index.
+
+        Args:
+            team_id: Team identifier
+            members: Members to index the team under
+        """
+        for member in members:
+            self._teams_by_member.setdefault(member, {})[team_id] = None
+
+    def _unindex_members(self, team_id: str, members: Iterable[str]) -> None:
+        """Remove a team from the member index.
+
+        Args:
+            team_id: Team identifier
+            members: Members the team was indexed under
+        """
+        for member in members:
+            team_ids = self._teams_by_member.get(member)
+            if team_ids is not None:
+                team_ids.pop(team_id, None)
+                if not team_ids:
+                    del self._teams_by_member[member]
+
+    def create_sync(self, team_data: TeamCreate) -> Team:
+        """Create a new team.
+
+        Args:
+            team_data: Team creation data
+
+        Returns:
+            Created team with generated ID and timestamps
+
+        Raises:
+            TeamAlreadyExistsError: If team with same name exists
+        """
+        with self._write_lock:
+            # Check for duplicate name
+            if _name_key(team_data.name) in self._teams_by_name:
+                raise TeamAlreadyExistsError(team_data.name)
+
+            team = self._store(team_data, self._now())
+            self._changed()
+
+            return team
+
+    def bulk_create_sync(self, items: List[TeamCreate]) -> List[Team]:
+        """Create several teams in one pass.
+
+        All names are checked before anything is stored, so a duplicate
+        leaves the repository unchanged. Every team shares one timestamp.
+
+        Args:
+            items: Team creation data, in insertion order
+
+        Returns:
+            Created teams in the same order as items
+
+        Raises:
+            TeamAlreadyExistsError: If a name already exists or repeats in items
+        """
+        with self._write_lock:
+            seen = set()
+            for team_data in items:
+                key = _name_key(team_data.name)
+                if key in self._teams_by_name or key in seen:
+                    raise TeamAlreadyExistsError(team_data.name)
+                seen.add(key)
+
+            now = self._now()
+            teams = [self._store(team_data, now) for team_data in items]
+            if teams:
+                self._changed()
+
+            return teams
+
+    def bulk_get_by_ids_sync(self, team_ids: List[str]) -> Dict[str, Team]:
+        """Get several teams by ID.
+
+        Args:
+            team_ids: Team identifiers
+
+        Returns:
+            Mapping of found team IDs to teams; missing IDs are omitted
+        """
+        # Single get per ID: a writer may remove a team between a check and a lookup
+        teams = self._teams
+        found: Dict[str, Team] = {}
+        for team_id in team_ids:
+            team = teams.get(team_id)
+            if team is not None:
+                found[team_id] = team
+        return found
+
+    def get_by_id_sync(self, team_id: str) -> Optional[Team]:
         """Get team by ID.
 
         Args:
@@ -204,7 +440,7 @@ class InMemoryTeamRepository(TeamRepository):
         """
         return self._teams.get(team_id)
 
-    async def get_by_name(self, name: str) -> Optional[Team]:
+    def get_by_name_sync(self, name: str) -> Optional[Team]:
         """Get team by name.
 
         Args:
@@ -213,22 +449,70 @@ class InMemoryTeamRepository(TeamRepository):
         Returns:
             Team if found, None otherwise
         """
-        team_id = self._teams_by_name.get(name)
-        if team_id:
-            return self._teams.get(team_id)
-        return None
+        return self._teams_by_name.get(_name_key(name))
 
-    async def list_all(self) -> List[Team]:
+    def list_all_sync(self) -> List[Team]:
         """List all teams.
 
         Returns:
             List of all teams sorted by creation date
         """
-        teams = list(self._teams.values())
-        teams.sort(key=lambda t: t.created_at)
-        return teams
+        # Dicts keep insertion order and update() reassigns existing keys in
+        # place, so iteration order is already creation order.
+        snapshot = self._list_cache
+        if snapshot is None:
+            revision = self._revision
+            snapshot = tuple(self._teams.values())
+            # Only publish the snapshot if no writer finished in the meantime
+            if revision == self._revision:
+                self._list_cache = snapshot
+        return list(snapshot)
+
+    def list_all_json_sync(self) -> bytes:
+        """List all teams as a JSON array.
+
+        The encoded bytes are cached until the next write, so repeated
+        listings skip per-team serialization entirely.
 
-    async def update(self, team_id: str, team_data: TeamUpdate) -> Team:
+        Returns:
+            UTF-8 JSON array of :meth:`Team.to_dict` objects in creation order
+        """
+        encoded = self._list_json_cache
+        if encoded is None:
+            revision = self._revision
+            encoded = orjson.dumps([team.to_dict() for team in self.list_all_sync()])
+            # Only publish the encoding if no writer finished in the meantime
+            if revision == self._revision:
+                self._list_json_cache = encoded
+        return encoded
+
+    def list_all_versioned_sync(self) -> Tuple[int, List[Team]]:
+        """List all teams together with the revision they reflect.
+
+        Returns:
+            Tuple of the current revision and all teams in creation order
+        """
+        return self._revision, self.list_all_sync()
+
+    def get_by_member_sync(self, member_id: str) -> List[Team]:
+        """List teams that include a member.
+
+        Uses the member index, so the cost is proportional to the number of
+        matching teams rather than to the size of the repository.
+
+        Args:
+            member_id: Member identifier (email address or user ID)
+
+        Returns:
+            Teams whose members include member_id, in the order they gained
+            the member
+        """
+        # Snapshot the IDs, since writers update the index and _teams in separate steps
+        team_ids = tuple(self._teams_by_member.get(member_id, ()))
+        teams = self._teams
+        return [team for team in map(teams.get, team_ids) if team is not None]
+
+    def update_sync(self, team_id: str, team_data: TeamUpdate) -> Team:
         """Update an existing team.
 
         Args:
@@ -241,27 +525,38 @@ class InMemoryTeamRepository(TeamRepository):
         Raises:
             TeamNotFoundError: If team not found
         """
-        team = await self.get_by_id(team_id)
-        if not team:
-            raise TeamNotFoundError(team_id)
-
-        # Update fields
-        updated_fields: Dict[str, Any] = {}
-        if team_data.description is not None:
-            updated_fields["description"] = team_data.description
-        if team_data.members is not None:
-            updated_fields["members"] = team_data.members.copy()
-
-        # Set update timestamp
-        updated_fields["updated_at"] = datetime.now(timezone.utc)
-
-        # Create updated team (immutable pattern)
-        updated_team = team.model_copy(update=updated_fields)
-        self._teams[team_id] = updated_team
-
-        return updated_team
-
-    async def delete(self, team_id: str) -> bool:
+        with self._write_lock:
+            team = self._teams.get(team_id)
+            if team is None:
+                raise TeamNotFoundError(team_id)
+
+            # Update fields
+            updated_fields: Dict[str, Any] = {}
+            if team_data.description is not None:
+                updated_fields["description"] = team_data.description
+            if team_data.members is not None:
+                # Validation already built a fresh list owned by team_data
+                updated_fields["members"] = team_data.members
+
+            # Set update timestamp
+            updated_fields["updated_at"] = self._now()
+
+            # Create updated team (immutable pattern). model_copy is a shallow copy
+            # that does not re-run validation, and it beats model_construct here;
+            # mutating in place would change Team objects already handed to callers.
+            updated_team = team.model_copy(update=updated_fields)
+            self._teams[team_id] = updated_team
+            self._teams_by_name[_name_key(updated_team.name)] = updated_team
+            if team_data.members is not None:
+                old_members = set(team.members)
+                new_members = set(updated_team.members)
+                self._unindex_members(team_id, old_members - new_members)
+                self._index_members(team_id, new_members - old_members)
+            self._changed()
+
+            return updated_team
+
+    def delete_sync(self, team_id: str) -> bool:
         """Delete a team.
 
         Args:
@@ -270,17 +565,19 @@ class InMemoryTeamRepository(TeamRepository):
         Returns:
             True if deleted, False if not found
         """
-        team = await self.get_by_id(team_id)
-        if not team:
-            return False
+        with self._write_lock:
+            team = self._teams.pop(team_id, None)
+            if team is None:
+                return False
 
-        # Remove from both indices
-        del self._teams[team_id]
-        del self._teams_by_name[team.name]
+            # Remove from the name index as well
+            del self._teams_by_name[_name_key(team.name)]
+            self._unindex_members(team_id, team.members)
+            self._changed()
 
-        return True
+            return True
 
-    async def exists_by_name(self, name: str) -> bool:
+    def exists_by_name_sync(self, name: str) -> bool:
         """Check if a team with given name exists.
 
         Args:
@@ -289,4 +586,88 @@ class InMemoryTeamRepository(TeamRepository):
         Returns:
             True if exists, False otherwise
         """
-        return name in self._teams_by_name
+        return _name_key(name) in self._teams_by_name
+
+    async def create(self, team_data: TeamCreate) -> Team:
+        """Create a new team.
+
+        Delegates to :meth:`create_sync`.
+        """
+        return self.create_sync(team_data)
+
+    async def bulk_create(self, items: List[TeamCreate]) -> List[Team]:
+        """Create several teams in one pass.
+
+        Delegates to :meth:`bulk_create_sync`.
+        """
+        return self.bulk_create_sync(items)
+
+    async def bulk_get_by_ids(self, team_ids: List[str]) -> Dict[str, Team]:
+        """Get several teams by ID.
+
+        Delegates to :meth:`bulk_get_by_ids_sync`.
+        """
+        return self.bulk_get_by_ids_sync(team_ids)
+
+    async def get_by_id(self, team_id: str) -> Optional[Team]:
+        """Get team by ID.
+
+        Delegates to :meth:`get_by_id_sync`.
+        """
+        return self.get_by_id_sync(team_id)
+
+    async def get_by_name(self, name: str) -> Optional[Team]:
+        """Get team by name.
+
+        Delegates to :meth:`get_by_name_sync`.
+        """
+        return self.get_by_name_sync(name)
+
+    async def list_all(self) -> List[Team]:
+        """List all teams.
+
+        Delegates to :meth:`list_all_sync`.
+        """
+        return self.list_all_sync()
+
+    async def list_all_json(self) -> bytes:
+        """List all teams as a JSON array.
+
+        Delegates to :meth:`list_all_json_sync`.
+        """
+        return self.list_all_json_sync()
+
+    async def list_all_versioned(self) -> Tuple[int, List[Team]]:
+        """List all teams together with the revision they reflect.
+
+        Delegates to :meth:`list_all_versioned_sync`.
+        """
+        return self.list_all_versioned_sync()
+
+    async def get_by_member(self, member_id: str) -> List[Team]:
+        """List teams that include a member.
+
+        Delegates to :meth:`get_by_member_sync`.
+        """
+        return self.get_by_member_sync(member_id)
+
+    async def update(self, team_id: str, team_data: TeamUpdate) -> Team:
+        """Update an existing team.
+
+        Delegates to :meth:`update_sync`.
+        """
+        return self.update_sync(team_id, team_data)
+
+    async def delete(self, team_id: str) -> bool:
+        """Delete a team.
+
+        Delegates to :meth:`delete_sync`.
+        """
+        return self.delete_sync(team_id)
+
+    async def exists_by_name(self, name: str) -> bool:
+        """Check if a team with given name exists.
+
+        Delegates to :meth:`exists_by_name_sync`.
+        """
+        return self.exists_by_name_sync(name)
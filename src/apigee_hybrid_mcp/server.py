@@ -25,29 +25,122 @@ Example Usage:
 """
 
 import asyncio
-import json
-from typing import Any, Dict, List
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
-
-from apigee_hybrid_mcp.api.client import ApigeeClient
-from apigee_hybrid_mcp.config import get_settings
+from pydantic import BaseModel, ConfigDict, create_model
+from pydantic import ValidationError as PydanticValidationError
+
+from apigee_hybrid_mcp.api.client import ApigeeClient, close_shared_session, get_shared_client
+from apigee_hybrid_mcp.config import Settings, get_settings
+from apigee_hybrid_mcp.error_handlers import format_error_response, map_repository_error
+from apigee_hybrid_mcp.exceptions import (
+    AppError,
+    ExternalServiceError,
+    InvalidParameterError,
+    MissingParameterError,
+    ResourceNotFoundError,
+)
+from apigee_hybrid_mcp.exceptions import TimeoutError as AppTimeoutError
+from apigee_hybrid_mcp.models.team import team_create_validate, team_update_validate
 from apigee_hybrid_mcp.repository.team_repository import (
     InMemoryTeamRepository,
+    TeamAlreadyExistsError,
+    TeamNotFoundError,
+    TeamRepository,
 )
+from apigee_hybrid_mcp.utils.cache import TTLCache
 from apigee_hybrid_mcp.utils.logging import configure_logging, get_logger
 from apigee_hybrid_mcp.validation import ParameterValidator
 
 # Initialize logger
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
+    """Manage resources that live for the whole server lifetime.
+
+    The shared HTTP session and API client are created lazily on the first
+    tool call and closed here when the server shuts down.
+
+    Args:
+        server: The MCP server instance
+
+    Yields:
+        Empty lifespan context
+    """
+    try:
+        yield {}
+    finally:
+        await close_shared_session()
+
+
 # Initialize MCP server
-app = Server("apigee-hybrid-mcp")
+app = Server("apigee-hybrid-mcp", lifespan=server_lifespan)
 
 # Initialize team repository (singleton for this server instance)
-team_repository = InMemoryTeamRepository()
+team_repository: TeamRepository = InMemoryTeamRepository()
+
+# Read-only tools whose responses may be cached, and tools that change state
+# (and therefore invalidate every cached response)
+_CACHEABLE_TOOL_PREFIXES = ("list-", "get-")
+_UNCACHED_TOOLS = frozenset({"get-debug-session-data"})
+_MUTATING_TOOL_PREFIXES = ("create-", "update-", "delete-", "deploy-", "undeploy-")
+
+# Tool responses keyed by (tool name, canonical JSON arguments); created on first use
+_response_cache: Optional[TTLCache[List[TextContent]]] = None
+
+# Oversized response bodies kept for fetch-cached-response, keyed by response id
+STORED_RESPONSE_LIMIT = 64  # Maximum number of stored response bodies
+STORED_RESPONSE_TTL = 900  # Seconds a stored response body stays available
+_stored_responses: TTLCache[str] = TTLCache(STORED_RESPONSE_LIMIT, STORED_RESPONSE_TTL)
+
+# Set when the current tool call stored a body instead of returning it inline;
+# such results are not cached because the body outlives neither store limit
+_response_stored: ContextVar[bool] = ContextVar("response_stored", default=False)
+
+
+# Schema fragments shared by many tool definitions. Each is referenced by
+# every tool that takes the parameter rather than rebuilt per tool.
+_STRING_ITEMS: Dict[str, Any] = {"type": "string"}
+_ORGANIZATION_PARAM: Dict[str, Any] = {"type": "string", "description": "Organization ID"}
+_ENVIRONMENT_PARAM: Dict[str, Any] = {"type": "string", "description": "Environment name"}
+_PROXY_PARAM: Dict[str, Any] = {"type": "string", "description": "API proxy name"}
+_REVISION_PARAM: Dict[str, Any] = {"type": "string", "description": "Revision number"}
+_DEPLOY_REVISION_PARAM: Dict[str, Any] = {
+    "type": "string",
+    "description": "Revision number to deploy",
+}
+_DEVELOPER_PARAM: Dict[str, Any] = {"type": "string", "description": "Developer email or ID"}
+_SHARED_FLOW_PARAM: Dict[str, Any] = {"type": "string", "description": "Shared flow name"}
+_KEYSTORE_PARAM: Dict[str, Any] = {"type": "string", "description": "Keystore name"}
+_TEAM_ID_PARAM: Dict[str, Any] = {"type": "string", "description": "Team ID"}
+_EXPAND_PARAM: Dict[str, Any] = {"type": "boolean", "description": "Include detailed information"}
+_INCLUDE_REVISIONS_PARAM: Dict[str, Any] = {
+    "type": "boolean",
+    "description": "Include revision details",
+}
 
 
 def create_tool_definition(
@@ -82,6 +175,34 @@ def create_tool_definition(
     )
 
 
+# Google API system parameter that disables indentation of response JSON
+_COMPACT_QUERY: Dict[str, Any] = {"prettyPrint": "false"}
+
+# Shared query parameters for boolean tool flags; never mutated
+_EXPAND_QUERY: Dict[str, Any] = {"expand": "true"}
+_INCLUDE_REVISIONS_QUERY: Dict[str, Any] = {"includeRevisions": "true"}
+_OVERRIDE_QUERY: Dict[str, Any] = {"override": "true"}
+
+
+@lru_cache(maxsize=1)
+def _response_json_options() -> int:
+    """Return the orjson options used to render tool responses.
+
+    Responses are indented only when ``pretty_json`` is enabled, or when it
+    is unset and stdout is a terminal. MCP clients read stdout through a
+    pipe, so they get compact JSON by default. Resolved on first use.
+
+    Returns:
+        orjson option flags
+    """
+    pretty = get_settings().pretty_json
+    if pretty is None:
+        pretty = sys.stdout.isatty()
+    if pretty:
+        return orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+    return orjson.OPT_NON_STR_KEYS
+
+
 def format_api_response(
     data: Dict[str, Any],
     operation: str,
@@ -89,7 +210,13 @@ def format_api_response(
     """Format API response data for MCP text content.
 
     Transforms API response dictionaries into MCP-compatible text content.
-    Uses JSON formatting for readability.
+    The data is serialized with orjson, indented or compact depending on the
+    ``pretty_json`` setting. Values that are not natively JSON serializable
+    are rendered with ``str``.
+
+    JSON longer than ``large_response_threshold`` characters is not inlined;
+    it is kept in memory for :data:`STORED_RESPONSE_TTL` seconds and the
+    response names the id to pass to ``fetch-cached-response``.
 
     Args:
         data: API response data dictionary
@@ -103,14 +230,72 @@ def format_api_response(
         >>> content = format_api_response(response, "Get Organization")
         >>> print(content[0].text)
         Operation: Get Organization
-        {
-          "name": "org-1",
-          "displayName": "Organization 1"
-        }
+        <BLANKLINE>
+        {"name":"org-1","displayName":"Organization 1"}
+    """
+    formatted_json = orjson.dumps(data, default=str, option=_response_json_options()).decode()
+    return _json_response(formatted_json, operation)
+
+
+def format_api_response_raw(body: bytes, operation: str) -> List[TextContent]:
+    """Format an unparsed API response body for MCP text content.
+
+    Used for responses passed through as the API returned them, which saves
+    parsing the JSON only to serialize it again. Request the body with
+    :func:`_passthrough_params` so its formatting follows ``pretty_json``.
+
+    Args:
+        body: Raw JSON response body (empty for no content)
+        operation: Description of the operation performed
+
+    Returns:
+        List[TextContent]: Formatted response for MCP client
+    """
+    return _json_response(body.decode() if body else "{}", operation)
+
+
+def _passthrough_params(params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Add the query parameter that asks Google APIs for compact JSON.
+
+    Google APIs indent JSON with two spaces unless ``prettyPrint=false`` is
+    passed, so passthrough bodies match :func:`format_api_response` output
+    either way.
+
+    Args:
+        params: Query parameters for the request
+
+    Returns:
+        Query parameters to send
+    """
+    if _response_json_options() & orjson.OPT_INDENT_2:
+        return params
+    return {**params, **_COMPACT_QUERY} if params else _COMPACT_QUERY
+
+
+def _json_response(formatted_json: str, operation: str) -> List[TextContent]:
+    """Wrap serialized response JSON in MCP text content.
+
+    Args:
+        formatted_json: Response JSON text
+        operation: Description of the operation performed
+
+    Returns:
+        List[TextContent]: Response content, with oversized JSON replaced by
+        a reference to the stored body
     """
-    formatted_json = json.dumps(data, indent=2)
+    threshold = get_settings().large_response_threshold
+    if threshold and len(formatted_json) > threshold:
+        response_id = uuid.uuid4().hex
+        _stored_responses.set(response_id, formatted_json)
+        _response_stored.set(True)
+        formatted_json = (
+            f"Large response ({len(formatted_json)} characters) stored as "
+            f"apigee-mcp://responses/{response_id}. Read it in pages with "
+            f'fetch-cached-response using response_id "{response_id}".'
+        )
     text = f"Operation: {operation}\n\n{formatted_json}"
-    return [TextContent(type="text", text=text)]
+    # Response text is generated here, so skip re-validating it
+    return [TextContent.model_construct(type="text", text=text)]
 
 
 def handle_api_error(error: Exception, operation: str) -> List[TextContent]:
@@ -137,12 +322,398 @@ def handle_api_error(error: Exception, operation: str) -> List[TextContent]:
     return format_error_response(error, operation, include_traceback=False)
 
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
-    """List all available MCP tools for Apigee Hybrid.
+class _ToolSpec(NamedTuple):
+    """Static definition of one tool.
+
+    Shared parameter fragments are referenced by name; tool-specific ones are
+    written inline.
+    """
+
+    name: str
+    description: str
+    properties: Dict[str, Dict[str, Any]]
+    required: Tuple[str, ...]
+
+
+_TOOL_SPECS: Tuple[_ToolSpec, ...] = (
+    # Organizations API
+    _ToolSpec(
+        "list-organizations",
+        "List all Apigee organizations accessible by the authenticated user",
+        {},
+        (),
+    ),
+    _ToolSpec(
+        "get-organization",
+        "Get details of a specific Apigee organization",
+        {"organization": {"type": "string", "description": "Organization ID or name"}},
+        ("organization",),
+    ),
+    # Environments API
+    _ToolSpec(
+        "list-environments",
+        "List all environments in an Apigee organization",
+        {"organization": _ORGANIZATION_PARAM},
+        ("organization",),
+    ),
+    _ToolSpec(
+        "get-environment",
+        "Get details of a specific environment",
+        {"organization": _ORGANIZATION_PARAM, "environment": _ENVIRONMENT_PARAM},
+        ("organization", "environment"),
+    ),
+    _ToolSpec(
+        "create-environment",
+        "Create a new environment in an organization",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "name": {"type": "string", "description": "Environment name"},
+            "displayName": {"type": "string", "description": "Display name for the environment"},
+            "description": {"type": "string", "description": "Environment description"},
+            "type": {
+                "type": "string",
+                "enum": ["PRODUCTION", "NON_PRODUCTION"],
+                "description": "Environment type",
+            },
+        },
+        ("organization", "name"),
+    ),
+    # API Proxies API
+    _ToolSpec(
+        "list-api-proxies",
+        "List all API proxies in an organization",
+        {"organization": _ORGANIZATION_PARAM, "includeRevisions": _INCLUDE_REVISIONS_PARAM},
+        ("organization",),
+    ),
+    _ToolSpec(
+        "get-api-proxy",
+        "Get details of a specific API proxy including all revisions",
+        {"organization": _ORGANIZATION_PARAM, "proxy": _PROXY_PARAM},
+        ("organization", "proxy"),
+    ),
+    _ToolSpec(
+        "get-api-proxy-revision",
+        "Get details of a specific API proxy revision",
+        {"organization": _ORGANIZATION_PARAM, "proxy": _PROXY_PARAM, "revision": _REVISION_PARAM},
+        ("organization", "proxy", "revision"),
+    ),
+    _ToolSpec(
+        "deploy-api-proxy",
+        "Deploy an API proxy revision to an environment",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "proxy": _PROXY_PARAM,
+            "revision": _DEPLOY_REVISION_PARAM,
+            "override": {"type": "boolean", "description": "Override existing deployment"},
+        },
+        ("organization", "environment", "proxy", "revision"),
+    ),
+    _ToolSpec(
+        "undeploy-api-proxy",
+        "Undeploy an API proxy revision from an environment",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "proxy": _PROXY_PARAM,
+            "revision": {"type": "string", "description": "Revision number to undeploy"},
+        },
+        ("organization", "environment", "proxy", "revision"),
+    ),
+    # Developers API
+    _ToolSpec(
+        "list-developers",
+        "List all developers in an organization",
+        {"organization": _ORGANIZATION_PARAM, "expand": _EXPAND_PARAM},
+        ("organization",),
+    ),
+    _ToolSpec(
+        "get-developer",
+        "Get details of a specific developer",
+        {"organization": _ORGANIZATION_PARAM, "developer": _DEVELOPER_PARAM},
+        ("organization", "developer"),
+    ),
+    _ToolSpec(
+        "create-developer",
+        "Create a new developer in an organization",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "email": {"type": "string", "description": "Developer email (required, unique)"},
+            "firstName": {"type": "string", "description": "First name"},
+            "lastName": {"type": "string", "description": "Last name"},
+            "userName": {"type": "string", "description": "Username"},
+        },
+        ("organization", "email", "firstName", "lastName"),
+    ),
+    # Developer Apps API
+    _ToolSpec(
+        "list-developer-apps",
+        "List all apps for a specific developer",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "developer": _DEVELOPER_PARAM,
+            "expand": {"type": "boolean", "description": "Include app details"},
+        },
+        ("organization", "developer"),
+    ),
+    _ToolSpec(
+        "get-developer-app",
+        "Get details of a developer app including credentials",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "developer": _DEVELOPER_PARAM,
+            "app": {"type": "string", "description": "App name"},
+        },
+        ("organization", "developer", "app"),
+    ),
+    _ToolSpec(
+        "create-developer-app",
+        "Create a new developer app with API product associations",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "developer": _DEVELOPER_PARAM,
+            "name": {"type": "string", "description": "App name"},
+            "apiProducts": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "List of API product names",
+            },
+            "callbackUrl": {"type": "string", "description": "OAuth callback URL"},
+        },
+        ("organization", "developer", "name"),
+    ),
+    # API Products API
+    _ToolSpec(
+        "list-api-products",
+        "List all API products in an organization",
+        {"organization": _ORGANIZATION_PARAM, "expand": _EXPAND_PARAM},
+        ("organization",),
+    ),
+    _ToolSpec(
+        "get-api-product",
+        "Get details of a specific API product",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "product": {"type": "string", "description": "API product name"},
+        },
+        ("organization", "product"),
+    ),
+    _ToolSpec(
+        "create-api-product",
+        "Create a new API product with quotas and rate limits",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "name": {"type": "string", "description": "Product name (required, immutable)"},
+            "displayName": {"type": "string", "description": "Display name"},
+            "description": {"type": "string", "description": "Product description"},
+            "approvalType": {
+                "type": "string",
+                "enum": ["auto", "manual"],
+                "description": "Approval type for apps",
+            },
+            "proxies": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "List of API proxy names",
+            },
+            "environments": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "List of environment names",
+            },
+            "quota": {"type": "string", "description": "Quota limit"},
+            "quotaInterval": {"type": "string", "description": "Quota interval"},
+            "quotaTimeUnit": {
+                "type": "string",
+                "enum": ["minute", "hour", "day", "month"],
+                "description": "Quota time unit",
+            },
+        },
+        ("organization", "name"),
+    ),
+    # Shared Flows API
+    _ToolSpec(
+        "list-shared-flows",
+        "List all shared flows in an organization",
+        {"organization": _ORGANIZATION_PARAM, "includeRevisions": _INCLUDE_REVISIONS_PARAM},
+        ("organization",),
+    ),
+    _ToolSpec(
+        "get-shared-flow",
+        "Get details of a specific shared flow",
+        {"organization": _ORGANIZATION_PARAM, "sharedFlow": _SHARED_FLOW_PARAM},
+        ("organization", "sharedFlow"),
+    ),
+    _ToolSpec(
+        "deploy-shared-flow",
+        "Deploy a shared flow revision to an environment",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "sharedFlow": _SHARED_FLOW_PARAM,
+            "revision": _DEPLOY_REVISION_PARAM,
+        },
+        ("organization", "environment", "sharedFlow", "revision"),
+    ),
+    # Keystores API
+    _ToolSpec(
+        "list-keystores",
+        "List all keystores in an environment",
+        {"organization": _ORGANIZATION_PARAM, "environment": _ENVIRONMENT_PARAM},
+        ("organization", "environment"),
+    ),
+    _ToolSpec(
+        "get-keystore",
+        "Get details of a specific keystore including aliases",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "keystore": _KEYSTORE_PARAM,
+        },
+        ("organization", "environment", "keystore"),
+    ),
+    _ToolSpec(
+        "list-keystore-aliases",
+        "List all aliases (certificates) in a keystore",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "keystore": _KEYSTORE_PARAM,
+        },
+        ("organization", "environment", "keystore"),
+    ),
+    _ToolSpec(
+        "get-keystore-alias",
+        "Get details of a specific keystore alias (certificate)",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "keystore": _KEYSTORE_PARAM,
+            "alias": {"type": "string", "description": "Alias name"},
+        },
+        ("organization", "environment", "keystore", "alias"),
+    ),
+    # Companies (Teams) API
+    _ToolSpec(
+        "list-teams",
+        "List all teams",
+        {},
+        (),
+    ),
+    _ToolSpec(
+        "get-team",
+        "Get details of a specific team",
+        {"team_id": _TEAM_ID_PARAM},
+        ("team_id",),
+    ),
+    _ToolSpec(
+        "create-team",
+        "Create a new team",
+        {
+            "name": {
+                "type": "string",
+                "description": "Team name (unique, alphanumeric with hyphens/underscores)",
+            },
+            "description": {"type": "string", "description": "Team description"},
+            "members": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "List of team member identifiers (emails or user IDs)",
+            },
+        },
+        ("name",),
+    ),
+    _ToolSpec(
+        "update-team",
+        "Update an existing team",
+        {
+            "team_id": _TEAM_ID_PARAM,
+            "description": {"type": "string", "description": "Updated team description"},
+            "members": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "Updated list of team members",
+            },
+        },
+        ("team_id",),
+    ),
+    _ToolSpec(
+        "delete-team",
+        "Delete a team",
+        {"team_id": _TEAM_ID_PARAM},
+        ("team_id",),
+    ),
+    # Debug Sessions (Trace) API
+    _ToolSpec(
+        "create-debug-session",
+        "Create a debug session (trace) for an API proxy",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "proxy": _PROXY_PARAM,
+            "revision": _REVISION_PARAM,
+            "session": {"type": "string", "description": "Session ID (UUID recommended)"},
+            "timeout": {"type": "integer", "description": "Session timeout in seconds (max 600)"},
+        },
+        ("organization", "environment", "proxy", "revision", "session"),
+    ),
+    _ToolSpec(
+        "get-debug-session-data",
+        "Get captured transaction data from a debug session",
+        {
+            "organization": _ORGANIZATION_PARAM,
+            "environment": _ENVIRONMENT_PARAM,
+            "proxy": _PROXY_PARAM,
+            "revision": _REVISION_PARAM,
+            "session": {"type": "string", "description": "Session ID"},
+        },
+        ("organization", "environment", "proxy", "revision", "session"),
+    ),
+    # Server
+    _ToolSpec(
+        "clear-tool-cache",
+        "Discard cached list/get responses so the next calls fetch fresh data",
+        {},
+        (),
+    ),
+    _ToolSpec(
+        "fetch-cached-response",
+        "Read a page of a large tool response that was stored instead of returned inline",
+        {
+            "response_id": {"type": "string", "description": "Response ID from the tool output"},
+            "offset": {"type": "integer", "description": "Character offset to start from"},
+            "limit": {"type": "integer", "description": "Maximum number of characters to return"},
+        },
+        ("response_id",),
+    ),
+    _ToolSpec(
+        "batch-read",
+        "Run several list-*/get-* tools concurrently and return all of their results",
+        {
+            "calls": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string", "description": "Name of a list-*/get-* tool"},
+                        "arguments": {"type": "object", "description": "Arguments for the tool"},
+                    },
+                    "required": ["tool"],
+                },
+                "description": "Tool calls to run",
+            },
+        },
+        ("calls",),
+    ),
+)
+
 
-    This handler returns the complete list of tools exposed by the MCP server.
-    Each tool corresponds to one or more Apigee API operations.
+def _build_tools() -> List[Tool]:
+    """Build the definitions of all MCP tools for Apigee Hybrid.
+
+    The tool catalog is static, so this is called once at import time and
+    the result is served by :func:`list_tools`. Each tool corresponds to one
+    or more Apigee API operations.
 
     Returns:
         List[Tool]: All available tools with their definitions
@@ -160,1165 +731,785 @@ async def list_tools() -> List[Tool]:
         - Debug Sessions: Trace and debug API requests
     """
     return [
-        # Organizations API
-        create_tool_definition(
-            name="list-organizations",
-            description="List all Apigee organizations accessible by the authenticated user",
-            parameters={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        create_tool_definition(
-            name="get-organization",
-            description="Get details of a specific Apigee organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID or name",
-                    },
-                },
-                "required": ["organization"],
-            },
-        ),
-        # Environments API
-        create_tool_definition(
-            name="list-environments",
-            description="List all environments in an Apigee organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                },
-                "required": ["organization"],
-            },
-        ),
-        create_tool_definition(
-            name="get-environment",
-            description="Get details of a specific environment",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                },
-                "required": ["organization", "environment"],
-            },
-        ),
         create_tool_definition(
-            name="create-environment",
-            description="Create a new environment in an organization",
+            name=spec.name,
+            description=spec.description,
             parameters={
                 "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "displayName": {
-                        "type": "string",
-                        "description": "Display name for the environment",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Environment description",
-                    },
-                    "type": {
-                        "type": "string",
-                        "enum": ["PRODUCTION", "NON_PRODUCTION"],
-                        "description": "Environment type",
-                    },
-                },
-                "required": ["organization", "name"],
-            },
-        ),
-        # API Proxies API
-        create_tool_definition(
-            name="list-api-proxies",
-            description="List all API proxies in an organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "includeRevisions": {
-                        "type": "boolean",
-                        "description": "Include revision details",
-                    },
-                },
-                "required": ["organization"],
+                "properties": spec.properties,
+                "required": list(spec.required),
             },
-        ),
-        create_tool_definition(
-            name="get-api-proxy",
-            description="Get details of a specific API proxy including all revisions",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                },
-                "required": ["organization", "proxy"],
-            },
-        ),
-        create_tool_definition(
-            name="get-api-proxy-revision",
-            description="Get details of a specific API proxy revision",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number",
-                    },
-                },
-                "required": ["organization", "proxy", "revision"],
-            },
-        ),
-        create_tool_definition(
-            name="deploy-api-proxy",
-            description="Deploy an API proxy revision to an environment",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number to deploy",
-                    },
-                    "override": {
-                        "type": "boolean",
-                        "description": "Override existing deployment",
-                    },
-                },
-                "required": ["organization", "environment", "proxy", "revision"],
-            },
-        ),
-        create_tool_definition(
-            name="undeploy-api-proxy",
-            description="Undeploy an API proxy revision from an environment",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number to undeploy",
-                    },
-                },
-                "required": ["organization", "environment", "proxy", "revision"],
-            },
-        ),
-        # Developers API
-        create_tool_definition(
-            name="list-developers",
-            description="List all developers in an organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "expand": {
-                        "type": "boolean",
-                        "description": "Include detailed information",
-                    },
-                },
-                "required": ["organization"],
-            },
-        ),
-        create_tool_definition(
-            name="get-developer",
-            description="Get details of a specific developer",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "developer": {
-                        "type": "string",
-                        "description": "Developer email or ID",
-                    },
-                },
-                "required": ["organization", "developer"],
-            },
-        ),
-        create_tool_definition(
-            name="create-developer",
-            description="Create a new developer in an organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Developer email (required, unique)",
-                    },
-                    "firstName": {
-                        "type": "string",
-                        "description": "First name",
-                    },
-                    "lastName": {
-                        "type": "string",
-                        "description": "Last name",
-                    },
-                    "userName": {
-                        "type": "string",
-                        "description": "Username",
-                    },
-                },
-                "required": ["organization", "email", "firstName", "lastName"],
-            },
-        ),
-        # Developer Apps API
-        create_tool_definition(
-            name="list-developer-apps",
-            description="List all apps for a specific developer",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "developer": {
-                        "type": "string",
-                        "description": "Developer email or ID",
-                    },
-                    "expand": {
-                        "type": "boolean",
-                        "description": "Include app details",
-                    },
-                },
-                "required": ["organization", "developer"],
-            },
-        ),
-        create_tool_definition(
-            name="get-developer-app",
-            description="Get details of a developer app including credentials",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "developer": {
-                        "type": "string",
-                        "description": "Developer email or ID",
-                    },
-                    "app": {
-                        "type": "string",
-                        "description": "App name",
-                    },
-                },
-                "required": ["organization", "developer", "app"],
-            },
-        ),
-        create_tool_definition(
-            name="create-developer-app",
-            description="Create a new developer app with API product associations",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "developer": {
-                        "type": "string",
-                        "description": "Developer email or ID",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "App name",
-                    },
-                    "apiProducts": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of API product names",
-                    },
-                    "callbackUrl": {
-                        "type": "string",
-                        "description": "OAuth callback URL",
-                    },
-                },
-                "required": ["organization", "developer", "name"],
-            },
-        ),
-        # API Products API
-        create_tool_definition(
-            name="list-api-products",
-            description="List all API products in an organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "expand": {
-                        "type": "boolean",
-                        "description": "Include detailed information",
-                    },
-                },
-                "required": ["organization"],
-            },
-        ),
-        create_tool_definition(
-            name="get-api-product",
-            description="Get details of a specific API product",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "product": {
-                        "type": "string",
-                        "description": "API product name",
-                    },
-                },
-                "required": ["organization", "product"],
-            },
-        ),
-        create_tool_definition(
-            name="create-api-product",
-            description="Create a new API product with quotas and rate limits",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Product name (required, immutable)",
-                    },
-                    "displayName": {
-                        "type": "string",
-                        "description": "Display name",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Product description",
-                    },
-                    "approvalType": {
-                        "type": "string",
-                        "enum": ["auto", "manual"],
-                        "description": "Approval type for apps",
-                    },
-                    "proxies": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of API proxy names",
-                    },
-                    "environments": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of environment names",
-                    },
-                    "quota": {
-                        "type": "string",
-                        "description": "Quota limit",
-                    },
-                    "quotaInterval": {
-                        "type": "string",
-                        "description": "Quota interval",
-                    },
-                    "quotaTimeUnit": {
-                        "type": "string",
-                        "enum": ["minute", "hour", "day", "month"],
-                        "description": "Quota time unit",
-                    },
-                },
-                "required": ["organization", "name"],
-            },
-        ),
-        # Shared Flows API
-        create_tool_definition(
-            name="list-shared-flows",
-            description="List all shared flows in an organization",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "includeRevisions": {
-                        "type": "boolean",
-                        "description": "Include revision details",
-                    },
-                },
-                "required": ["organization"],
-            },
-        ),
-        create_tool_definition(
-            name="get-shared-flow",
-            description="Get details of a specific shared flow",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "sharedFlow": {
-                        "type": "string",
-                        "description": "Shared flow name",
-                    },
-                },
-                "required": ["organization", "sharedFlow"],
-            },
-        ),
-        create_tool_definition(
-            name="deploy-shared-flow",
-            description="Deploy a shared flow revision to an environment",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "sharedFlow": {
-                        "type": "string",
-                        "description": "Shared flow name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number to deploy",
-                    },
-                },
-                "required": ["organization", "environment", "sharedFlow", "revision"],
-            },
-        ),
-        # Keystores API
-        create_tool_definition(
-            name="list-keystores",
-            description="List all keystores in an environment",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                },
-                "required": ["organization", "environment"],
-            },
-        ),
-        create_tool_definition(
-            name="get-keystore",
-            description="Get details of a specific keystore including aliases",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "keystore": {
-                        "type": "string",
-                        "description": "Keystore name",
-                    },
-                },
-                "required": ["organization", "environment", "keystore"],
-            },
-        ),
-        create_tool_definition(
-            name="list-keystore-aliases",
-            description="List all aliases (certificates) in a keystore",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "keystore": {
-                        "type": "string",
-                        "description": "Keystore name",
-                    },
-                },
-                "required": ["organization", "environment", "keystore"],
-            },
-        ),
-        create_tool_definition(
-            name="get-keystore-alias",
-            description="Get details of a specific keystore alias (certificate)",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "keystore": {
-                        "type": "string",
-                        "description": "Keystore name",
-                    },
-                    "alias": {
-                        "type": "string",
-                        "description": "Alias name",
-                    },
-                },
-                "required": ["organization", "environment", "keystore", "alias"],
-            },
-        ),
-        # Companies (Teams) API
-        create_tool_definition(
-            name="list-teams",
-            description="List all teams",
-            parameters={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        create_tool_definition(
-            name="get-team",
-            description="Get details of a specific team",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "team_id": {
-                        "type": "string",
-                        "description": "Team ID",
-                    },
-                },
-                "required": ["team_id"],
-            },
-        ),
-        create_tool_definition(
-            name="create-team",
-            description="Create a new team",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Team name (unique, alphanumeric with hyphens/underscores)",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Team description",
-                    },
-                    "members": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of team member identifiers (emails or user IDs)",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        create_tool_definition(
-            name="update-team",
-            description="Update an existing team",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "team_id": {
-                        "type": "string",
-                        "description": "Team ID",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Updated team description",
-                    },
-                    "members": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Updated list of team members",
-                    },
-                },
-                "required": ["team_id"],
-            },
-        ),
-        create_tool_definition(
-            name="delete-team",
-            description="Delete a team",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "team_id": {
-                        "type": "string",
-                        "description": "Team ID",
-                    },
-                },
-                "required": ["team_id"],
-            },
-        ),
-        # Debug Sessions (Trace) API
-        create_tool_definition(
-            name="create-debug-session",
-            description="Create a debug session (trace) for an API proxy",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number",
-                    },
-                    "session": {
-                        "type": "string",
-                        "description": "Session ID (UUID recommended)",
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Session timeout in seconds (max 600)",
-                    },
-                },
-                "required": ["organization", "environment", "proxy", "revision", "session"],
-            },
-        ),
-        create_tool_definition(
-            name="get-debug-session-data",
-            description="Get captured transaction data from a debug session",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "organization": {
-                        "type": "string",
-                        "description": "Organization ID",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "description": "Environment name",
-                    },
-                    "proxy": {
-                        "type": "string",
-                        "description": "API proxy name",
-                    },
-                    "revision": {
-                        "type": "string",
-                        "description": "Revision number",
-                    },
-                    "session": {
-                        "type": "string",
-                        "description": "Session ID",
-                    },
-                },
-                "required": ["organization", "environment", "proxy", "revision", "session"],
-            },
-        ),
+        )
+        for spec in _TOOL_SPECS
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle MCP tool calls and route to appropriate Apigee API operations.
+# Tool catalog, built once; it does not change for the lifetime of the process
+_TOOLS: tuple[Tool, ...] = tuple(_build_tools())
+
+# JSON Schema primitive types and the Python types that validate them
+_SCHEMA_TYPES: Dict[str, Any] = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "object": Dict[str, Any],
+}
+
+# Arguments are checked strictly (no coercion) like JSON Schema; unknown keys are allowed
+_ARGUMENT_MODEL_CONFIG = ConfigDict(strict=True, extra="allow")
+
+
+def _schema_annotation(schema: Dict[str, Any]) -> Any:
+    """Translate a parameter schema fragment into a type annotation.
+
+    Args:
+        schema: JSON Schema fragment from a tool spec
+
+    Returns:
+        Type annotation accepting the same values as the fragment
+    """
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+    if schema["type"] == "array":
+        item_type = _schema_annotation(schema["items"])
+        return List[item_type]  # type: ignore[valid-type]
+    return _SCHEMA_TYPES[schema["type"]]
+
+
+def _build_argument_models() -> Dict[str, Type[BaseModel]]:
+    """Build a pydantic model per tool that validates its call arguments.
+
+    The models are derived from :data:`_TOOL_SPECS`, so they accept exactly
+    what each tool's input schema describes, but validate in pydantic-core
+    instead of re-interpreting the JSON Schema on every call.
+
+    Returns:
+        Mapping of tool name to its argument model
+    """
+    models: Dict[str, Type[BaseModel]] = {}
+    for spec in _TOOL_SPECS:
+        fields: Dict[str, Any] = {
+            param: (_schema_annotation(schema), ... if param in spec.required else None)
+            for param, schema in spec.properties.items()
+        }
+        models[spec.name] = create_model(
+            f"{spec.name}-arguments", __config__=_ARGUMENT_MODEL_CONFIG, **fields
+        )
+    return models
+
+
+_ARGUMENT_MODELS = _build_argument_models()
+
+
+def _validate_arguments(name: str, arguments: Dict[str, Any]) -> None:
+    """Validate tool call arguments against the tool's argument model.
+
+    Args:
+        name: Tool name
+        arguments: Tool arguments dictionary
+
+    Raises:
+        MissingParameterError: If a required argument is absent
+        InvalidParameterError: If an argument has the wrong type or value
+    """
+    model = _ARGUMENT_MODELS.get(name)
+    if model is None:
+        return
+    try:
+        model.model_validate(arguments)
+    except PydanticValidationError as e:
+        error = e.errors()[0]
+        parameter = ".".join(str(part) for part in error["loc"])
+        if error["type"] == "missing":
+            raise MissingParameterError(parameter=parameter) from e
+        raise InvalidParameterError(
+            parameter=parameter, value=error["input"], reason=error["msg"]
+        ) from e
+
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """List all available MCP tools for Apigee Hybrid.
+
+    Returns:
+        List[Tool]: All available tools with their definitions, taken from
+        the catalog built at import time
+    """
+    return list(_TOOLS)
 
-    This is the main tool call handler that routes requests to the appropriate
-    API functions based on the tool name. It manages the API client lifecycle
-    and error handling.
+
+# Tool handlers. Each receives the API client for the call and the validated
+# arguments, and returns the formatted response or raises on failure.
+_ToolHandler = Callable[[ApigeeClient, Dict[str, Any]], Awaitable[List[TextContent]]]
+
+
+# Organizations API
+async def _get_organization(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific Apigee organization."""
+    org = arguments.get("organization", client.settings.apigee_organization)
+    body = await client.get_raw(f"organizations/{org}", params=_passthrough_params())
+    return format_api_response_raw(body, "Get Organization")
+
+
+# Environments API
+async def _list_environments(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all environments in an Apigee organization."""
+    body = await client.get_raw("environments", params=_passthrough_params())
+    return format_api_response_raw(body, "List Environments")
+
+
+async def _get_environment(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific environment."""
+    env = arguments["environment"]
+    body = await client.get_raw(f"environments/{env}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get Environment: {env}")
+
+
+async def _create_environment(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Create a new environment in an organization."""
+    env_data = {
+        "name": arguments["name"],
+        "displayName": arguments.get("displayName", arguments["name"]),
+        "description": arguments.get("description", ""),
+        "type": arguments.get("type", "NON_PRODUCTION"),
+    }
+    data = await client.post("environments", json_data=env_data)
+    return format_api_response(data, "Create Environment")
+
+
+# API Proxies API
+async def _list_api_proxies(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all API proxies in an organization."""
+    params = _INCLUDE_REVISIONS_QUERY if arguments.get("includeRevisions") else None
+    body = await client.get_raw("apis", params=_passthrough_params(params))
+    return format_api_response_raw(body, "List API Proxies")
+
+
+async def _get_api_proxy(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific API proxy including all revisions."""
+    proxy = arguments["proxy"]
+    body = await client.get_raw(f"apis/{proxy}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get API Proxy: {proxy}")
+
+
+async def _get_api_proxy_revision(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Get details of a specific API proxy revision."""
+    proxy = arguments["proxy"]
+    revision = arguments["revision"]
+    body = await client.get_raw(f"apis/{proxy}/revisions/{revision}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get API Proxy Revision: {proxy} (rev {revision})")
+
+
+async def _deploy_api_proxy(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Deploy an API proxy revision to an environment."""
+    env = arguments["environment"]
+    proxy = arguments["proxy"]
+    revision = arguments["revision"]
+    params = _OVERRIDE_QUERY if arguments.get("override") else None
+    data = await client.post(
+        f"environments/{env}/apis/{proxy}/revisions/{revision}/deployments",
+        params=params,
+    )
+    return format_api_response(data, f"Deploy API Proxy: {proxy} rev {revision} to {env}")
+
+
+async def _undeploy_api_proxy(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Undeploy an API proxy revision from an environment."""
+    env = arguments["environment"]
+    proxy = arguments["proxy"]
+    revision = arguments["revision"]
+    data = await client.delete(f"environments/{env}/apis/{proxy}/revisions/{revision}/deployments")
+    return format_api_response(data, f"Undeploy API Proxy: {proxy} rev {revision} from {env}")
+
+
+# Developers API
+async def _list_developers(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all developers in an organization."""
+    params = _EXPAND_QUERY if arguments.get("expand") else None
+    body = await client.get_raw("developers", params=_passthrough_params(params))
+    return format_api_response_raw(body, "List Developers")
+
+
+async def _get_developer(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific developer."""
+    developer = arguments["developer"]
+    body = await client.get_raw(f"developers/{developer}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get Developer: {developer}")
+
+
+async def _create_developer(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Create a new developer in an organization."""
+    dev_data = {
+        "email": arguments["email"],
+        "firstName": arguments["firstName"],
+        "lastName": arguments["lastName"],
+        "userName": arguments.get("userName", arguments["email"].split("@")[0]),
+    }
+    data = await client.post("developers", json_data=dev_data)
+    return format_api_response(data, "Create Developer")
+
+
+# Developer Apps API
+async def _list_developer_apps(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """List all apps for a specific developer."""
+    developer = arguments["developer"]
+    params = _EXPAND_QUERY if arguments.get("expand") else None
+    body = await client.get_raw(f"developers/{developer}/apps", params=_passthrough_params(params))
+    return format_api_response_raw(body, f"List Developer Apps: {developer}")
+
+
+async def _get_developer_app(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a developer app including credentials."""
+    developer = arguments["developer"]
+    app = arguments["app"]
+    body = await client.get_raw(f"developers/{developer}/apps/{app}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get Developer App: {app}")
+
+
+async def _create_developer_app(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Create a new developer app with API product associations."""
+    developer = arguments["developer"]
+    app_data = {
+        "name": arguments["name"],
+        "apiProducts": arguments.get("apiProducts", []),
+    }
+    if "callbackUrl" in arguments:
+        app_data["callbackUrl"] = arguments["callbackUrl"]
+    data = await client.post(f"developers/{developer}/apps", json_data=app_data)
+    return format_api_response(data, "Create Developer App")
+
+
+# API Products API
+async def _list_api_products(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all API products in an organization."""
+    params = _EXPAND_QUERY if arguments.get("expand") else None
+    body = await client.get_raw("apiproducts", params=_passthrough_params(params))
+    return format_api_response_raw(body, "List API Products")
+
+
+async def _get_api_product(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific API product."""
+    product = arguments["product"]
+    body = await client.get_raw(f"apiproducts/{product}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get API Product: {product}")
+
+
+async def _create_api_product(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Create a new API product with quotas and rate limits."""
+    product_data = {
+        "name": arguments["name"],
+        "displayName": arguments.get("displayName", arguments["name"]),
+        "description": arguments.get("description", ""),
+        "approvalType": arguments.get("approvalType", "auto"),
+        "proxies": arguments.get("proxies", []),
+        "environments": arguments.get("environments", []),
+        "apiResources": ["/**"],
+    }
+    if "quota" in arguments:
+        product_data["quota"] = arguments["quota"]
+        product_data["quotaInterval"] = arguments.get("quotaInterval", "1")
+        product_data["quotaTimeUnit"] = arguments.get("quotaTimeUnit", "day")
+    data = await client.post("apiproducts", json_data=product_data)
+    return format_api_response(data, "Create API Product")
+
+
+# Shared Flows API
+async def _list_shared_flows(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all shared flows in an organization."""
+    params = _INCLUDE_REVISIONS_QUERY if arguments.get("includeRevisions") else None
+    body = await client.get_raw("sharedflows", params=_passthrough_params(params))
+    return format_api_response_raw(body, "List Shared Flows")
+
+
+async def _get_shared_flow(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific shared flow."""
+    sharedflow = arguments["sharedFlow"]
+    body = await client.get_raw(f"sharedflows/{sharedflow}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get Shared Flow: {sharedflow}")
+
+
+async def _deploy_shared_flow(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Deploy a shared flow revision to an environment."""
+    env = arguments["environment"]
+    sharedflow = arguments["sharedFlow"]
+    revision = arguments["revision"]
+    data = await client.post(
+        f"environments/{env}/sharedflows/{sharedflow}/revisions/{revision}/deployments"
+    )
+    return format_api_response(data, f"Deploy Shared Flow: {sharedflow} rev {revision} to {env}")
+
+
+# Keystores API
+async def _list_keystores(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all keystores in an environment."""
+    env = arguments["environment"]
+    body = await client.get_raw(f"environments/{env}/keystores", params=_passthrough_params())
+    return format_api_response_raw(body, f"List Keystores in {env}")
+
+
+async def _get_keystore(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific keystore including aliases."""
+    env = arguments["environment"]
+    keystore = arguments["keystore"]
+    body = await client.get_raw(
+        f"environments/{env}/keystores/{keystore}", params=_passthrough_params()
+    )
+    return format_api_response_raw(body, f"Get Keystore: {keystore}")
+
+
+async def _list_keystore_aliases(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """List all aliases (certificates) in a keystore."""
+    env = arguments["environment"]
+    keystore = arguments["keystore"]
+    body = await client.get_raw(
+        f"environments/{env}/keystores/{keystore}/aliases", params=_passthrough_params()
+    )
+    return format_api_response_raw(body, f"List Keystore Aliases: {keystore}")
+
+
+async def _get_keystore_alias(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific keystore alias (certificate)."""
+    env = arguments["environment"]
+    keystore = arguments["keystore"]
+    alias = arguments["alias"]
+    body = await client.get_raw(
+        f"environments/{env}/keystores/{keystore}/aliases/{alias}", params=_passthrough_params()
+    )
+    return format_api_response_raw(body, f"Get Keystore Alias: {alias}")
+
+
+# Companies (Teams) API
+async def _list_companies(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all companies in an organization."""
+    params = _EXPAND_QUERY if arguments.get("expand") else None
+    body = await client.get_raw("companies", params=_passthrough_params(params))
+    return format_api_response_raw(body, "List Companies")
+
+
+async def _get_company(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific company."""
+    company = arguments["company"]
+    body = await client.get_raw(f"companies/{company}", params=_passthrough_params())
+    return format_api_response_raw(body, f"Get Company: {company}")
+
+
+async def _create_company(client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Create a new company in an organization."""
+    company_data = {
+        "name": arguments["name"],
+        "displayName": arguments.get("displayName", arguments["name"]),
+    }
+    data = await client.post("companies", json_data=company_data)
+    return format_api_response(data, "Create Company")
+
+
+# Teams API (custom implementation for Apigee Hybrid)
+async def _list_teams(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """List all teams.
+
+    Compact output wraps the repository's cached JSON encoding without
+    decoding it; indented output is serialized from the teams.
+    """
+    try:
+        if _response_json_options() & orjson.OPT_INDENT_2:
+            teams = await team_repository.list_all()
+            teams_data = [team.to_dict() for team in teams]
+            return format_api_response({"teams": teams_data}, "List Teams")
+        teams_json = await team_repository.list_all_json()
+        return format_api_response_raw(b'{"teams":' + teams_json + b"}", "List Teams")
+    except Exception as e:
+        raise map_repository_error(e) from e
+
+
+async def _get_team(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get details of a specific team."""
+    try:
+        team_id = ParameterValidator.validate_non_empty_string(arguments.get("team_id"), "team_id")
+        team = await team_repository.get_by_id(team_id)
+        if not team:
+            raise ResourceNotFoundError(
+                resource_type="team",
+                resource_id=team_id,
+            )
+        return format_api_response(team.to_dict(), f"Get Team: {team_id}")
+    except (AppError, TeamNotFoundError) as e:
+        raise map_repository_error(e) from e
+
+
+async def _create_team(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Create a new team."""
+    try:
+        # Validate required parameters
+        name_val = ParameterValidator.validate_non_empty_string(arguments.get("name"), "name")
+
+        # Create team data with validation via Pydantic
+        team_data = team_create_validate(
+            {
+                "name": name_val,
+                "description": arguments.get("description"),
+                "members": arguments.get("members", []),
+            }
+        )
+
+        team = await team_repository.create(team_data)
+        logger.info(
+            "team_created",
+            team_id=team.id,
+            team_name=team.name,
+        )
+        return format_api_response(team.to_dict(), "Create Team")
+    except (AppError, TeamAlreadyExistsError) as e:
+        raise map_repository_error(e) from e
+    except ValueError as e:
+        # Pydantic validation errors
+        raise InvalidParameterError(
+            parameter="team_data",
+            value="",
+            reason=str(e),
+        ) from e
+
+
+async def _update_team(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Update an existing team."""
+    try:
+        team_id = ParameterValidator.validate_non_empty_string(arguments.get("team_id"), "team_id")
+
+        # Create update data
+        update_data = team_update_validate(
+            {
+                "description": arguments.get("description"),
+                "members": arguments.get("members"),
+            }
+        )
+
+        team = await team_repository.update(team_id, update_data)
+        logger.info(
+            "team_updated",
+            team_id=team.id,
+            team_name=team.name,
+        )
+        return format_api_response(team.to_dict(), f"Update Team: {team_id}")
+    except (AppError, TeamNotFoundError) as e:
+        raise map_repository_error(e) from e
+    except ValueError as e:
+        raise InvalidParameterError(
+            parameter="team_data",
+            value="",
+            reason=str(e),
+        ) from e
+
+
+async def _delete_team(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Delete a team."""
+    try:
+        team_id = ParameterValidator.validate_non_empty_string(arguments.get("team_id"), "team_id")
+        await team_repository.delete(team_id)
+        logger.info("team_deleted", team_id=team_id)
+        return format_api_response(
+            {"success": True, "team_id": team_id},
+            f"Delete Team: {team_id}",
+        )
+    except (AppError, TeamNotFoundError) as e:
+        raise map_repository_error(e) from e
+
+
+# Debug Sessions (Trace) API
+async def _create_debug_session(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Create a debug session (trace) for an API proxy."""
+    env = arguments["environment"]
+    proxy = arguments["proxy"]
+    revision = arguments["revision"]
+    session = arguments["session"]
+    params = {"session": session}
+    if "timeout" in arguments:
+        params["timeout"] = str(arguments["timeout"])
+    data = await client.post(
+        f"environments/{env}/apis/{proxy}/revisions/{revision}/debugsessions",
+        params=params,
+    )
+    return format_api_response(data, f"Create Debug Session: {session}")
+
+
+async def _get_debug_session_data(
+    client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Get captured transaction data from a debug session."""
+    env = arguments["environment"]
+    proxy = arguments["proxy"]
+    revision = arguments["revision"]
+    session = arguments["session"]
+    body = await client.get_raw(
+        f"environments/{env}/apis/{proxy}/revisions/{revision}/debugsessions/{session}/data",
+        params=_passthrough_params(),
+    )
+    return format_api_response_raw(body, f"Get Debug Session Data: {session}")
+
+
+# Server
+async def _fetch_cached_response(
+    _client: ApigeeClient, arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Read a page of a large tool response that was stored instead of returned inline."""
+    response_id = arguments["response_id"]
+    body = _stored_responses.get(response_id)
+    if body is None:
+        raise ResourceNotFoundError(resource_type="stored response", resource_id=response_id)
+    offset = max(arguments.get("offset", 0), 0)
+    limit = arguments.get("limit") or get_settings().large_response_threshold or len(body)
+    page = body[offset : offset + max(limit, 1)]
+    end = offset + len(page)
+    text = (
+        f"Operation: Fetch Cached Response: {response_id} "
+        f"(characters {offset}-{end} of {len(body)})\n\n{page}"
+    )
+    return [TextContent.model_construct(type="text", text=text)]
+
+
+async def _batch_read(_client: ApigeeClient, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Run several read-only tools concurrently and return all of their results."""
+    calls = arguments["calls"]
+    for index, call in enumerate(calls):
+        tool = call.get("tool")
+        if not isinstance(tool, str) or not tool.startswith(_CACHEABLE_TOOL_PREFIXES):
+            raise InvalidParameterError(
+                parameter=f"calls.{index}.tool",
+                value=tool,
+                reason="must be the name of a list-* or get-* tool",
+            )
+    # Each call goes through call_tool, so it is validated, cached and
+    # reports its own errors without failing the rest of the batch
+    results = await asyncio.gather(
+        *(call_tool(call["tool"], call.get("arguments") or {}) for call in calls)
+    )
+    return [content for result in results for content in result]
+
+
+_TOOL_HANDLERS: Dict[str, _ToolHandler] = {
+    "get-organization": _get_organization,
+    "list-environments": _list_environments,
+    "get-environment": _get_environment,
+    "create-environment": _create_environment,
+    "list-api-proxies": _list_api_proxies,
+    "get-api-proxy": _get_api_proxy,
+    "get-api-proxy-revision": _get_api_proxy_revision,
+    "deploy-api-proxy": _deploy_api_proxy,
+    "undeploy-api-proxy": _undeploy_api_proxy,
+    "list-developers": _list_developers,
+    "get-developer": _get_developer,
+    "create-developer": _create_developer,
+    "list-developer-apps": _list_developer_apps,
+    "get-developer-app": _get_developer_app,
+    "create-developer-app": _create_developer_app,
+    "list-api-products": _list_api_products,
+    "get-api-product": _get_api_product,
+    "create-api-product": _create_api_product,
+    "list-shared-flows": _list_shared_flows,
+    "get-shared-flow": _get_shared_flow,
+    "deploy-shared-flow": _deploy_shared_flow,
+    "list-keystores": _list_keystores,
+    "get-keystore": _get_keystore,
+    "list-keystore-aliases": _list_keystore_aliases,
+    "get-keystore-alias": _get_keystore_alias,
+    "list-companies": _list_companies,
+    "get-company": _get_company,
+    "create-company": _create_company,
+    "list-teams": _list_teams,
+    "get-team": _get_team,
+    "create-team": _create_team,
+    "update-team": _update_team,
+    "delete-team": _delete_team,
+    "create-debug-session": _create_debug_session,
+    "get-debug-session-data": _get_debug_session_data,
+    "fetch-cached-response": _fetch_cached_response,
+    "batch-read": _batch_read,
+}
+
+
+async def _dispatch_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Route a tool call to the appropriate Apigee API operation.
 
     Args:
         name: Tool name (as defined in list_tools)
         arguments: Tool arguments dictionary (validated against input schema)
 
     Returns:
-        List[TextContent]: Formatted API response or error message
+        List[TextContent]: Formatted API response
 
     Raises:
         ValueError: If tool name is not recognized
+        Exception: Any API, repository or validation error; formatted by
+            :func:`call_tool`
+    """
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return await handler(get_shared_client(get_settings()), arguments)
+
+
+def _get_response_cache(settings: Settings) -> TTLCache[List[TextContent]]:
+    """Return the process-wide tool response cache, creating it on first use.
+
+    Args:
+        settings: Application settings providing the cache size and TTL
+
+    Returns:
+        The shared response cache
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = TTLCache(
+            settings.tool_cache_size,
+            settings.tool_cache_ttl,
+            stale_ttl=settings.tool_cache_stale_ttl,
+        )
+    return _response_cache
+
+
+def _is_upstream_outage(error: AppError) -> bool:
+    """Tell whether an error means the Apigee API is unavailable.
+
+    Timeouts, transport failures and an open circuit carry no upstream
+    status; HTTP errors count only when Apigee answered with a 5xx. Client
+    errors such as 403 or 429 are also mapped to ExternalServiceError but
+    must not be hidden behind stale data.
+
+    Args:
+        error: Error raised by a tool call
+
+    Returns:
+        True if an expired cached response may be served instead
+    """
+    if isinstance(error, AppTimeoutError):
+        return True
+    status = error.details.get("status")
+    return status is None or status >= 500
+
+
+def _stale_response(cached: List[TextContent], error: AppError) -> List[TextContent]:
+    """Return a cached response marked as stale after an upstream failure.
+
+    Args:
+        cached: Expired cached response
+        error: Error that prevented a fresh response
+
+    Returns:
+        List[TextContent]: The cached content followed by a staleness notice
+    """
+    notice = (
+        f"Stale: served from cache because the Apigee API request failed "
+        f"({error.code}, Correlation ID: {error.correlation_id})"
+    )
+    return [*cached, TextContent.model_construct(type="text", text=notice)]
+
+
+# Arguments are validated by _validate_arguments rather than by the framework's
+# per-call JSON Schema check
+@app.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle MCP tool calls and route to appropriate Apigee API operations.
+
+    This is the main tool call handler. Arguments are validated against the
+    tool's argument model first. Successful responses of read-only tools
+    (``list-*``/``get-*``) are cached for ``tool_cache_ttl`` seconds, keyed
+    by tool name and arguments; any state-changing tool clears the cache so
+    later reads see its effect. If a cached read has expired and the Apigee
+    API fails or times out, the expired response is returned for up to
+    ``tool_cache_stale_ttl`` seconds, marked as stale.
+
+    Args:
+        name: Tool name (as defined in list_tools)
+        arguments: Tool arguments dictionary (validated against input schema)
+
+    Returns:
+        List[TextContent]: Formatted API response or error message
 
     Implementation Notes:
-        - Uses async context manager for API client lifecycle
-        - All errors are caught and formatted consistently
+        - Uses the process-wide API client so connections, tokens and circuit
+          breaker state are reused across calls
+        - All errors are caught and formatted consistently; errors are never cached
         - Logging is performed for all operations
         - API client handles retries and circuit breaking
     """
     settings = get_settings()
-
+    cache = _get_response_cache(settings)
+
+    if name == "clear-tool-cache":
+        cleared = len(cache)
+        cache.clear()
+        return format_api_response({"cleared": cleared}, "Clear Tool Cache")
+
+    key = None
+    if (
+        settings.tool_cache_ttl > 0
+        and name.startswith(_CACHEABLE_TOOL_PREFIXES)
+        and name not in _UNCACHED_TOOLS
+    ):
+        try:
+            key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        except TypeError:
+            # Arguments orjson cannot encode (e.g. huge integers) are not cached
+            key = None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug("tool_cache_hit", tool=name)
+            return list(cached)
+        logger.debug("tool_cache_miss", tool=name)
+
+    # A mutation that clears the cache while this call runs makes its result stale
+    generation = cache.generation
+    stored_token = _response_stored.set(False)
     try:
-        async with ApigeeClient(settings) as client:
-            # Organizations API
-            if name == "get-organization":
-                org = arguments.get("organization", settings.apigee_organization)
-                data = await client.get(f"organizations/{org}")
-                return format_api_response(data, "Get Organization")
-
-            # Environments API
-            elif name == "list-environments":
-                org = arguments.get("organization", settings.apigee_organization)
-                data = await client.get("environments")
-                return format_api_response(data, "List Environments")
-
-            elif name == "get-environment":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                data = await client.get(f"environments/{env}")
-                return format_api_response(data, f"Get Environment: {env}")
-
-            elif name == "create-environment":
-                org = arguments.get("organization", settings.apigee_organization)
-                env_data = {
-                    "name": arguments["name"],
-                    "displayName": arguments.get("displayName", arguments["name"]),
-                    "description": arguments.get("description", ""),
-                    "type": arguments.get("type", "NON_PRODUCTION"),
-                }
-                data = await client.post("environments", json_data=env_data)
-                return format_api_response(data, "Create Environment")
-
-            # API Proxies API
-            elif name == "list-api-proxies":
-                org = arguments.get("organization", settings.apigee_organization)
-                params = {}
-                if arguments.get("includeRevisions"):
-                    params["includeRevisions"] = "true"
-                data = await client.get("apis", params=params)
-                return format_api_response(data, "List API Proxies")
-
-            elif name == "get-api-proxy":
-                org = arguments.get("organization", settings.apigee_organization)
-                proxy = arguments["proxy"]
-                data = await client.get(f"apis/{proxy}")
-                return format_api_response(data, f"Get API Proxy: {proxy}")
-
-            elif name == "get-api-proxy-revision":
-                org = arguments.get("organization", settings.apigee_organization)
-                proxy = arguments["proxy"]
-                revision = arguments["revision"]
-                data = await client.get(f"apis/{proxy}/revisions/{revision}")
-                return format_api_response(
-                    data, f"Get API Proxy Revision: {proxy} (rev {revision})"
-                )
-
-            elif name == "deploy-api-proxy":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                proxy = arguments["proxy"]
-                revision = arguments["revision"]
-                params = {}
-                if arguments.get("override"):
-                    params["override"] = "true"
-                data = await client.post(
-                    f"environments/{env}/apis/{proxy}/revisions/{revision}/deployments",
-                    params=params,
-                )
-                return format_api_response(
-                    data, f"Deploy API Proxy: {proxy} rev {revision} to {env}"
-                )
-
-            elif name == "undeploy-api-proxy":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                proxy = arguments["proxy"]
-                revision = arguments["revision"]
-                data = await client.delete(
-                    f"environments/{env}/apis/{proxy}/revisions/{revision}/deployments"
-                )
-                return format_api_response(
-                    data, f"Undeploy API Proxy: {proxy} rev {revision} from {env}"
-                )
-
-            # Developers API
-            elif name == "list-developers":
-                org = arguments.get("organization", settings.apigee_organization)
-                params = {}
-                if arguments.get("expand"):
-                    params["expand"] = "true"
-                data = await client.get("developers", params=params)
-                return format_api_response(data, "List Developers")
-
-            elif name == "get-developer":
-                org = arguments.get("organization", settings.apigee_organization)
-                developer = arguments["developer"]
-                data = await client.get(f"developers/{developer}")
-                return format_api_response(data, f"Get Developer: {developer}")
-
-            elif name == "create-developer":
-                org = arguments.get("organization", settings.apigee_organization)
-                dev_data = {
-                    "email": arguments["email"],
-                    "firstName": arguments["firstName"],
-                    "lastName": arguments["lastName"],
-                    "userName": arguments.get("userName", arguments["email"].split("@")[0]),
-                }
-                data = await client.post("developers", json_data=dev_data)
-                return format_api_response(data, "Create Developer")
-
-            # Developer Apps API
-            elif name == "list-developer-apps":
-                org = arguments.get("organization", settings.apigee_organization)
-                developer = arguments["developer"]
-                params = {}
-                if arguments.get("expand"):
-                    params["expand"] = "true"
-                data = await client.get(f"developers/{developer}/apps", params=params)
-                return format_api_response(data, f"List Developer Apps: {developer}")
-
-            elif name == "get-developer-app":
-                org = arguments.get("organization", settings.apigee_organization)
-                developer = arguments["developer"]
-                app = arguments["app"]
-                data = await client.get(f"developers/{developer}/apps/{app}")
-                return format_api_response(data, f"Get Developer App: {app}")
-
-            elif name == "create-developer-app":
-                org = arguments.get("organization", settings.apigee_organization)
-                developer = arguments["developer"]
-                app_data = {
-                    "name": arguments["name"],
-                    "apiProducts": arguments.get("apiProducts", []),
-                }
-                if "callbackUrl" in arguments:
-                    app_data["callbackUrl"] = arguments["callbackUrl"]
-                data = await client.post(f"developers/{developer}/apps", json_data=app_data)
-                return format_api_response(data, "Create Developer App")
-
-            # API Products API
-            elif name == "list-api-products":
-                org = arguments.get("organization", settings.apigee_organization)
-                params = {}
-                if arguments.get("expand"):
-                    params["expand"] = "true"
-                data = await client.get("apiproducts", params=params)
-                return format_api_response(data, "List API Products")
-
-            elif name == "get-api-product":
-                org = arguments.get("organization", settings.apigee_organization)
-                product = arguments["product"]
-                data = await client.get(f"apiproducts/{product}")
-                return format_api_response(data, f"Get API Product: {product}")
-
-            elif name == "create-api-product":
-                org = arguments.get("organization", settings.apigee_organization)
-                product_data = {
-                    "name": arguments["name"],
-                    "displayName": arguments.get("displayName", arguments["name"]),
-                    "description": arguments.get("description", ""),
-                    "approvalType": arguments.get("approvalType", "auto"),
-                    "proxies": arguments.get("proxies", []),
-                    "environments": arguments.get("environments", []),
-                    "apiResources": ["/**"],
-                }
-                if "quota" in arguments:
-                    product_data["quota"] = arguments["quota"]
-                    product_data["quotaInterval"] = arguments.get("quotaInterval", "1")
-                    product_data["quotaTimeUnit"] = arguments.get("quotaTimeUnit", "day")
-                data = await client.post("apiproducts", json_data=product_data)
-                return format_api_response(data, "Create API Product")
-
-            # Shared Flows API
-            elif name == "list-shared-flows":
-                org = arguments.get("organization", settings.apigee_organization)
-                params = {}
-                if arguments.get("includeRevisions"):
-                    params["includeRevisions"] = "true"
-                data = await client.get("sharedflows", params=params)
-                return format_api_response(data, "List Shared Flows")
-
-            elif name == "get-shared-flow":
-                org = arguments.get("organization", settings.apigee_organization)
-                sharedflow = arguments["sharedFlow"]
-                data = await client.get(f"sharedflows/{sharedflow}")
-                return format_api_response(data, f"Get Shared Flow: {sharedflow}")
-
-            elif name == "deploy-shared-flow":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                sharedflow = arguments["sharedFlow"]
-                revision = arguments["revision"]
-                data = await client.post(
-                    f"environments/{env}/sharedflows/{sharedflow}/revisions/{revision}/deployments"
-                )
-                return format_api_response(
-                    data, f"Deploy Shared Flow: {sharedflow} rev {revision} to {env}"
-                )
-
-            # Keystores API
-            elif name == "list-keystores":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                data = await client.get(f"environments/{env}/keystores")
-                return format_api_response(data, f"List Keystores in {env}")
-
-            elif name == "get-keystore":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                keystore = arguments["keystore"]
-                data = await client.get(f"environments/{env}/keystores/{keystore}")
-                return format_api_response(data, f"Get Keystore: {keystore}")
-
-            elif name == "list-keystore-aliases":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                keystore = arguments["keystore"]
-                data = await client.get(f"environments/{env}/keystores/{keystore}/aliases")
-                return format_api_response(data, f"List Keystore Aliases: {keystore}")
-
-            elif name == "get-keystore-alias":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                keystore = arguments["keystore"]
-                alias = arguments["alias"]
-                data = await client.get(f"environments/{env}/keystores/{keystore}/aliases/{alias}")
-                return format_api_response(data, f"Get Keystore Alias: {alias}")
-
-            # Companies (Teams) API
-            elif name == "list-companies":
-                org = arguments.get("organization", settings.apigee_organization)
-                params = {}
-                if arguments.get("expand"):
-                    params["expand"] = "true"
-                data = await client.get("companies", params=params)
-                return format_api_response(data, "List Companies")
-
-            elif name == "get-company":
-                org = arguments.get("organization", settings.apigee_organization)
-                company = arguments["company"]
-                data = await client.get(f"companies/{company}")
-                return format_api_response(data, f"Get Company: {company}")
-
-            elif name == "create-company":
-                org = arguments.get("organization", settings.apigee_organization)
-                company_data = {
-                    "name": arguments["name"],
-                    "displayName": arguments.get("displayName", arguments["name"]),
-                }
-                data = await client.post("companies", json_data=company_data)
-                return format_api_response(data, "Create Company")
-
-            # Teams API (custom implementation for Apigee Hybrid)
-            elif name == "list-teams":
-                try:
-                    teams = await team_repository.list_all()
-                    teams_data = [team.to_dict() for team in teams]
-                    return format_api_response({"teams": teams_data}, "List Teams")
-                except Exception as e:
-                    mapped_error = map_repository_error(e)
-                    return handle_api_error(mapped_error, name)
-
-            elif name == "get-team":
-                try:
-                    team_id = ParameterValidator.validate_non_empty_string(
-                        arguments.get("team_id"), "team_id"
-                    )
-                    team = await team_repository.get_by_id(team_id)
-                    if not team:
-                        from apigee_hybrid_mcp.exceptions import ResourceNotFoundError
-
-                        raise ResourceNotFoundError(
-                            resource_type="team",
-                            resource_id=team_id,
-                        )
-                    return format_api_response(team.to_dict(), f"Get Team: {team_id}")
-                except (AppError, TeamNotFoundError) as e:
-                    mapped_error = map_repository_error(e)
-                    return handle_api_error(mapped_error, name)
-
-            elif name == "create-team":
-                try:
-                    # Validate required parameters
-                    name_val = ParameterValidator.validate_non_empty_string(
-                        arguments.get("name"), "name"
-                    )
-
-                    # Create team data with validation via Pydantic
-                    team_data = TeamCreate(
-                        name=name_val,
-                        description=arguments.get("description"),
-                        members=arguments.get("members", []),
-                    )
-
-                    team = await team_repository.create(team_data)
-                    logger.info(
-                        "team_created",
-                        team_id=team.id,
-                        team_name=team.name,
-                    )
-                    return format_api_response(team.to_dict(), "Create Team")
-                except (AppError, TeamAlreadyExistsError) as e:
-                    mapped_error = map_repository_error(e)
-                    return handle_api_error(mapped_error, name)
-                except ValueError as e:
-                    # Pydantic validation errors
-                    return handle_api_error(
-                        InvalidParameterError(
-                            parameter="team_data",
-                            value="",
-                            reason=str(e),
-                        ),
-                        name,
-                    )
-
-            elif name == "update-team":
-                try:
-                    team_id = ParameterValidator.validate_non_empty_string(
-                        arguments.get("team_id"), "team_id"
-                    )
-
-                    # Create update data
-                    update_data = TeamUpdate(
-                        description=arguments.get("description"),
-                        members=arguments.get("members"),
-                    )
-
-                    team = await team_repository.update(team_id, update_data)
-                    logger.info(
-                        "team_updated",
-                        team_id=team.id,
-                        team_name=team.name,
-                    )
-                    return format_api_response(team.to_dict(), f"Update Team: {team_id}")
-                except (AppError, TeamNotFoundError) as e:
-                    mapped_error = map_repository_error(e)
-                    return handle_api_error(mapped_error, name)
-                except ValueError as e:
-                    return handle_api_error(
-                        InvalidParameterError(
-                            parameter="team_data",
-                            value="",
-                            reason=str(e),
-                        ),
-                        name,
-                    )
-
-            elif name == "delete-team":
-                try:
-                    team_id = ParameterValidator.validate_non_empty_string(
-                        arguments.get("team_id"), "team_id"
-                    )
-                    await team_repository.delete(team_id)
-                    logger.info("team_deleted", team_id=team_id)
-                    return format_api_response(
-                        {"success": True, "team_id": team_id},
-                        f"Delete Team: {team_id}",
-                    )
-                except (AppError, TeamNotFoundError) as e:
-                    mapped_error = map_repository_error(e)
-                    return handle_api_error(mapped_error, name)
-
-            # Debug Sessions (Trace) API
-            elif name == "create-debug-session":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                proxy = arguments["proxy"]
-                revision = arguments["revision"]
-                session = arguments["session"]
-                params = {"session": session}
-                if "timeout" in arguments:
-                    params["timeout"] = str(arguments["timeout"])
-                data = await client.post(
-                    f"environments/{env}/apis/{proxy}/revisions/{revision}/debugsessions",
-                    params=params,
-                )
-                return format_api_response(data, f"Create Debug Session: {session}")
-
-            elif name == "get-debug-session-data":
-                org = arguments.get("organization", settings.apigee_organization)
-                env = arguments["environment"]
-                proxy = arguments["proxy"]
-                revision = arguments["revision"]
-                session = arguments["session"]
-                data = await client.get(
-                    f"environments/{env}/apis/{proxy}/revisions/{revision}/debugsessions/{session}/data"
-                )
-                return format_api_response(data, f"Get Debug Session Data: {session}")
-
-            else:
-                raise ValueError(f"Unknown tool: {name}")
-
+        _validate_arguments(name, arguments)
+        result = await _dispatch_tool(name, arguments)
+    except (ExternalServiceError, AppTimeoutError) as e:
+        # Upstream outage or open circuit: fall back to an expired cached read
+        stale = cache.get_stale(key) if key is not None and _is_upstream_outage(e) else None
+        if stale is None:
+            return handle_api_error(e, name)
+        logger.warning("tool_cache_stale_served", tool=name, error_code=e.code)
+        return _stale_response(stale, e)
     except Exception as e:
         return handle_api_error(e, name)
+    finally:
+        result_stored = _response_stored.get()
+        _response_stored.reset(stored_token)
+        if name.startswith(_MUTATING_TOOL_PREFIXES):
+            cache.clear()
+
+    if key is not None:
+        # Results pointing at a stored body would outlive it in the cache
+        if cache.generation == generation and not result_stored:
+            cache.set(key, result)
+        return list(result)
+    return result
+
+
+def _event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return the uvloop event loop factory when uvloop is installed.
+
+    uvloop is not available on Windows; asyncio's default loop is used there.
+
+    Returns:
+        uvloop's loop constructor, or None for the default event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
 
 
 def main() -> None:
@@ -1342,7 +1533,7 @@ def main() -> None:
         >>> main()
     """
     settings = get_settings()
-    configure_logging(settings.log_level)
+    configure_logging(settings.log_level, settings.log_buffer_size)
 
     logger.info(
         "starting_mcp_server",
@@ -1360,7 +1551,7 @@ def main() -> None:
             )
 
     try:
-        asyncio.run(run_server())
+        asyncio.run(run_server(), loop_factory=_event_loop_factory())
     except KeyboardInterrupt:
         logger.info("server_stopped", reason="keyboard_interrupt")
     except Exception as e:
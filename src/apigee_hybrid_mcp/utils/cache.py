@@ -0,0 +1,101 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Expired entries can be kept for a further ``stale_ttl`` seconds; they
+    are misses for :meth:`get` but still readable through :meth:`get_stale`.
+    :attr:`generation` changes on every :meth:`clear`, so a caller can tell
+    whether the cache was cleared while it was computing a value.
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        stale_ttl: float = 0.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted
+            ttl: Seconds an entry stays valid after it is stored
+            timer: Monotonic clock used for expiry
+            stale_ttl: Seconds past expiry an entry stays readable as stale
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.generation = 0
+        self._timer = timer
+        # key -> (expiry, value), least recently used first
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The value, or None if the key is missing or has expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = self._timer()
+        if expires_at <= now:
+            if expires_at + self.stale_ttl <= now:
+                del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for a key, even if it has expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The value, or None if the key is missing or past its stale window
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at + self.stale_ttl <= self._timer():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and start a new generation."""
+        self._data.clear()
+        self.generation += 1
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._data)
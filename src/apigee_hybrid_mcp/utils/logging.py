@@ -1,25 +1,75 @@
 """Logging configuration for the MCP server."""
 
 import logging
+import logging.handlers
 import sys
 from typing import Any
 
 import structlog
 
+# Dedicated stdlib logger that receives rendered records when buffering is enabled
+BUFFERED_LOGGER_NAME = "apigee_hybrid_mcp.buffered"
 
-def configure_logging(log_level: str = "INFO") -> None:
+
+def _buffered_stdlib_logger(level: int, buffer_size: int) -> logging.Logger:
+    """Create the stdlib logger that buffers rendered structlog records.
+
+    Records are held in a ``MemoryHandler`` and written to stdout when the
+    buffer fills or an ERROR (or higher) record arrives. ``logging.shutdown``
+    flushes any remainder at interpreter exit.
+
+    Args:
+        level: Minimum stdlib level to accept
+        buffer_size: Number of records to hold before writing
+
+    Returns:
+        The configured stdlib logger
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=buffer_size,
+        flushLevel=logging.ERROR,
+        target=stream_handler,
+    )
+
+    buffered = logging.getLogger(BUFFERED_LOGGER_NAME)
+    for handler in buffered.handlers[:]:
+        buffered.removeHandler(handler)
+        handler.close()
+    buffered.addHandler(memory_handler)
+    buffered.setLevel(level)
+    buffered.propagate = False
+    return buffered
+
+
+def configure_logging(log_level: str = "INFO", buffer_size: int = 0) -> None:
     """Configure structured logging for the application.
 
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        buffer_size: Number of log records to buffer before writing them out.
+            0 writes every record immediately.
     """
+    level = getattr(logging, log_level.upper())
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
+    logger_factory: Any
+    if buffer_size > 0:
+        buffered = _buffered_stdlib_logger(level, buffer_size)
+
+        def logger_factory(*args: Any) -> logging.Logger:
+            return buffered
+
+    else:
+        logger_factory = structlog.PrintLoggerFactory()
+
     # Configure structlog
     structlog.configure(
         processors=[
@@ -30,9 +80,9 @@ def configure_logging(log_level: str = "INFO") -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level.upper())),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -1,5 +1,6 @@
 """Resilience utilities including retry logic and circuit breakers."""
 
+import asyncio
 import functools
 import time
 from typing import Any, Callable, Optional, Type, TypeVar
@@ -83,7 +84,11 @@ def with_retry(
 
 
 class RateLimiter:
-    """Simple token bucket rate limiter."""
+    """Simple token bucket rate limiter.
+
+    Use acquire() to reject over-limit work immediately, or wait() to
+    queue until a token becomes available.
+    """
 
     def __init__(self, requests_per_window: int, window_seconds: int):
         """Initialize rate limiter.
@@ -103,7 +108,7 @@ class RateLimiter:
         Returns:
             True if token acquired, False otherwise
         """
-        now = time.time()
+        now = time.monotonic()
         time_passed = now - self.last_update
 
         # Refill tokens based on time passed
@@ -117,3 +122,12 @@ class RateLimiter:
             self.tokens -= 1
             return True
         return False
+
+    async def wait(self) -> None:
+        """Wait until a token is available and consume it.
+
+        Sleeps for exactly the time needed to refill the missing fraction of
+        a token rather than polling, so bursts are smoothed instead of rejected.
+        """
+        while not self.acquire():
+            await asyncio.sleep((1 - self.tokens) * self.window_seconds / self.requests_per_window)
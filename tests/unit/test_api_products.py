@@ -34,8 +34,8 @@ class TestAPIProducts:
         """
         # Arrange
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value='{"apiProduct": [{"name": "basic-product"}, {"name": "premium-product"}]}'
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=b'{"apiProduct": [{"name": "basic-product"}, {"name": "premium-product"}]}'
         )
 
         # Act
@@ -61,8 +61,8 @@ class TestAPIProducts:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_api_product)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_api_product).encode()
         )
 
         # Act
@@ -99,8 +99,8 @@ class TestAPIProducts:
             "quotaTimeUnit": "hour",
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps({**product_data, "createdAt": "2024-01-01T00:00:00Z"})
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps({**product_data, "createdAt": "2024-01-01T00:00:00Z"}).encode()
         )
 
         # Act
@@ -129,8 +129,8 @@ class TestAPIProducts:
             "approvalType": "auto",
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(product_data)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(product_data).encode()
         )
 
         # Act
@@ -157,8 +157,8 @@ class TestAPIProducts:
             "approvalType": "manual",
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(product_data)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(product_data).encode()
         )
 
         # Act
@@ -184,8 +184,8 @@ class TestAPIProducts:
 
         updated_product = {**sample_api_product, "quota": "2000", "displayName": "Updated Product"}
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(updated_product)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(updated_product).encode()
         )
 
         # Act
@@ -213,8 +213,8 @@ class TestAPIProducts:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_api_product)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_api_product).encode()
         )
 
         # Act
@@ -241,8 +241,8 @@ class TestAPIProducts:
             "proxies": ["proxy1", "proxy2", "proxy3"],
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(product_data)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(product_data).encode()
         )
 
         # Act
@@ -274,8 +274,8 @@ class TestAPIProducts:
                 "quotaTimeUnit": time_unit,
             }
             mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-            mock_apigee_client.session.request.return_value.__aenter__.return_value.text = (
-                AsyncMock(return_value=json.dumps(product_data))
+            mock_apigee_client.session.request.return_value.__aenter__.return_value.read = (
+                AsyncMock(return_value=json.dumps(product_data).encode())
             )
 
             # Act
@@ -299,9 +299,10 @@ class TestAPIProducts:
         from apigee_hybrid_mcp.exceptions import ResourceNotFoundError
 
         # Arrange - test 404
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 404
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value='{"error": {"message": "Product not found"}}'
+        mock_response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        mock_response.status = 404
+        mock_response.content.read = AsyncMock(
+            return_value=b'{"error": {"message": "Product not found"}}'
         )
 
         # Act & Assert - expect ResourceNotFoundError instead of ApigeeAPIError
@@ -0,0 +1,78 @@
+"""Unit tests for caching utilities.
+
+Tests cover:
+- TTL expiry
+- LRU eviction
+- Stale reads after expiry
+"""
+
+from apigee_hybrid_mcp.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """Test that stored values are returned before they expire."""
+        cache: TTLCache[str] = TTLCache(maxsize=2, ttl=10)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self) -> None:
+        """Test that entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache: TTLCache[str] = TTLCache(maxsize=2, ttl=10, timer=clock)
+        cache.set("key", "value")
+
+        clock.now = 9.9
+        assert cache.get("key") == "value"
+
+        clock.now = 10.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Test that the least recently read entry is evicted when full."""
+        cache: TTLCache[int] = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_stale_entries_are_kept_for_get_stale(self) -> None:
+        """Test that expired entries are misses but readable within the stale window."""
+        clock = FakeClock()
+        cache: TTLCache[str] = TTLCache(maxsize=2, ttl=10, timer=clock, stale_ttl=5)
+        cache.set("key", "value")
+
+        clock.now = 12.0
+        assert cache.get("key") is None
+        assert cache.get_stale("key") == "value"
+
+        clock.now = 15.0
+        assert cache.get_stale("key") is None
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        """Test that clear removes every entry and starts a new generation."""
+        cache: TTLCache[int] = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        generation = cache.generation
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.generation != generation
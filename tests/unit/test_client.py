@@ -0,0 +1,443 @@
+"""Unit tests for the Apigee API client.
+
+Tests cover:
+- Shared HTTP session lifecycle
+- Session ownership in the async context manager
+- Access token caching
+- Request header construction
+- URL construction
+- HTTP error responses
+- Batched concurrent requests
+- Legacy ApigeeAPIError compatibility
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from apigee_hybrid_mcp.api import client as client_module
+from apigee_hybrid_mcp.api.client import (
+    TOKEN_DEFAULT_LIFETIME,
+    ApigeeClient,
+    close_shared_session,
+    get_shared_client,
+    get_shared_session,
+)
+from apigee_hybrid_mcp.config import Settings
+from apigee_hybrid_mcp.exceptions import AuthenticationError
+
+
+@pytest.mark.asyncio
+class TestSharedSession:
+    """Test suite for the process-wide HTTP session."""
+
+    async def test_shared_session_is_reused(self, test_settings: Settings) -> None:
+        """Test that repeated calls return the same session."""
+        try:
+            first = get_shared_session(test_settings)
+            second = get_shared_session(test_settings)
+            assert first is second
+            assert not first.closed
+        finally:
+            await close_shared_session()
+
+    async def test_shared_session_connector(self, test_settings: Settings) -> None:
+        """Test that the shared session uses an async resolver with DNS caching."""
+        import aiohttp
+
+        try:
+            connector = get_shared_session(test_settings).connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.use_dns_cache
+            assert isinstance(connector._resolver, aiohttp.AsyncResolver)
+        finally:
+            await close_shared_session()
+
+    async def test_close_shared_session(self, test_settings: Settings) -> None:
+        """Test that closing the shared session allows a fresh one to be created."""
+        session = get_shared_session(test_settings)
+        await close_shared_session()
+        assert session.closed
+        assert client_module._shared_session is None
+
+        replacement = get_shared_session(test_settings)
+        try:
+            assert replacement is not session
+        finally:
+            await close_shared_session()
+
+    async def test_shared_client_is_reused(self, test_settings: Settings) -> None:
+        """Test that tool calls share one client bound to the shared session."""
+        try:
+            with patch("apigee_hybrid_mcp.api.client.service_account"):
+                first = get_shared_client(test_settings)
+                second = get_shared_client(test_settings)
+            assert first is second
+            assert first.session is get_shared_session(test_settings)
+        finally:
+            await close_shared_session()
+        assert client_module._shared_client is None
+
+    async def test_shared_client_follows_new_session(self, test_settings: Settings) -> None:
+        """Test that a replaced session gets a new client instead of a closed one."""
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            first = get_shared_client(test_settings)
+            await close_shared_session()
+            try:
+                second = get_shared_client(test_settings)
+                assert second is not first
+                assert second.session is not None and not second.session.closed
+            finally:
+                await close_shared_session()
+
+    async def test_close_shared_session_without_session(self) -> None:
+        """Test that closing is a no-op when no session was created."""
+        await close_shared_session()
+        assert client_module._shared_session is None
+
+    async def test_client_does_not_close_external_session(self, test_settings: Settings) -> None:
+        """Test that an externally owned session stays open after client exit."""
+        external_session = AsyncMock()
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            async with ApigeeClient(test_settings, session=external_session) as client:
+                assert client.session is external_session
+        external_session.close.assert_not_called()
+
+    async def test_client_closes_own_session(self, test_settings: Settings) -> None:
+        """Test that a client without an injected session manages its own."""
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            async with ApigeeClient(test_settings) as client:
+                own_session = client.session
+                assert own_session is not None
+        assert own_session.closed
+
+    async def test_client_has_no_instance_dict(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that client attributes live in slots rather than a per-instance dict."""
+        assert not hasattr(mock_apigee_client, "__dict__")
+
+
+@pytest.mark.asyncio
+class TestTokenCache:
+    """Test suite for access token caching."""
+
+    @staticmethod
+    def _make_client(test_settings: Settings, expires_in: timedelta) -> ApigeeClient:
+        """Create a client whose credentials report the given remaining lifetime."""
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            client = ApigeeClient(test_settings)
+        credentials = MagicMock()
+        credentials.token = "cached-token"
+        credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + expires_in
+        client.credentials = credentials
+        return client
+
+    async def test_token_reused_while_fresh(self, test_settings: Settings) -> None:
+        """Test that a fresh token is served from cache without refreshing."""
+        client = self._make_client(test_settings, timedelta(hours=1))
+
+        assert await client._get_auth_token() == "cached-token"
+        assert await client._get_auth_token() == "cached-token"
+        assert client.credentials.refresh.call_count == 1
+
+    async def test_token_refreshed_within_expiry_margin(self, test_settings: Settings) -> None:
+        """Test that an expired token is refreshed inline on every use."""
+        client = self._make_client(test_settings, timedelta(seconds=30))
+
+        await client._get_auth_token()
+        await client._get_auth_token()
+        assert client.credentials.refresh.call_count == 2
+
+    async def test_stale_token_refreshed_in_background(self, test_settings: Settings) -> None:
+        """Test that a stale token is returned while one background refresh runs."""
+        import asyncio
+
+        client = self._make_client(test_settings, timedelta(minutes=3))
+        await client._get_auth_token()
+        assert client.credentials.refresh.call_count == 1
+
+        client.credentials.token = "rotated-token"
+        client.credentials.expiry += timedelta(hours=1)
+        assert await client._get_auth_token() == "cached-token"
+        assert await client._get_auth_token() == "cached-token"
+        assert client._refresh_task is not None
+
+        await client._refresh_task
+        await asyncio.sleep(0)
+        assert client._refresh_task is None
+        assert client.credentials.refresh.call_count == 2
+        assert await client._get_auth_token() == "rotated-token"
+
+    async def test_token_without_expiry_uses_default_lifetime(
+        self, test_settings: Settings
+    ) -> None:
+        """Test that tokens with unknown expiry are cached for the default lifetime."""
+        client = self._make_client(test_settings, timedelta(hours=1))
+        client.credentials.expiry = None
+
+        assert await client._get_auth_token() == "cached-token"
+        assert await client._get_auth_token() == "cached-token"
+        assert client.credentials.refresh.call_count == 1
+        assert client._token_cache is not None
+        remaining = client._token_cache[1] - time.monotonic()
+        assert TOKEN_DEFAULT_LIFETIME - 5 < remaining <= TOKEN_DEFAULT_LIFETIME
+
+    async def test_missing_credentials(self, test_settings: Settings) -> None:
+        """Test that missing credentials raise AuthenticationError."""
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            client = ApigeeClient(test_settings)
+        with pytest.raises(AuthenticationError):
+            await client._get_auth_token()
+
+    async def test_concurrent_requests_share_one_refresh(self, test_settings: Settings) -> None:
+        """Test that concurrent cache misses trigger a single refresh."""
+        import asyncio
+
+        client = self._make_client(test_settings, timedelta(hours=1))
+
+        tokens = await asyncio.gather(*(client._get_auth_token() for _ in range(10)))
+        assert set(tokens) == {"cached-token"}
+        assert client.credentials.refresh.call_count == 1
+
+    async def test_refresh_failure(self, test_settings: Settings) -> None:
+        """Test that refresh errors are wrapped in AuthenticationError."""
+        client = self._make_client(test_settings, timedelta(hours=1))
+        client.credentials.refresh.side_effect = RuntimeError("network down")
+
+        with pytest.raises(AuthenticationError, match="Failed to refresh"):
+            await client._get_auth_token()
+
+
+@pytest.mark.asyncio
+class TestRequestHeaders:
+    """Test suite for request header construction."""
+
+    async def test_authorization_header_sent(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that requests carry the bearer token and JSON content type."""
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b"{}")
+
+        await mock_apigee_client.get("environments")
+
+        headers = mock_apigee_client.session.request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer mock-token-12345"
+        assert headers["Content-Type"] == "application/json"
+
+    async def test_extra_headers_do_not_leak(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that per-request headers do not modify the shared template."""
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b"{}")
+
+        await mock_apigee_client._request("GET", "environments", headers={"X-Trace": "1"})
+        assert mock_apigee_client.session.request.call_args.kwargs["headers"]["X-Trace"] == "1"
+
+        await mock_apigee_client.get("environments")
+        assert "X-Trace" not in mock_apigee_client.session.request.call_args.kwargs["headers"]
+
+    async def test_json_body_serialized_to_bytes(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that request bodies are sent as pre-serialized JSON bytes."""
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b'{"name": "dev"}')
+
+        result = await mock_apigee_client.post("environments", json_data={"name": "dev"})
+
+        assert result == {"name": "dev"}
+        assert mock_apigee_client.session.request.call_args.kwargs["data"] == b'{"name":"dev"}'
+
+
+class TestBuildUrl:
+    """Test suite for API URL construction."""
+
+    @pytest.fixture
+    def client(self, test_settings: Settings) -> ApigeeClient:
+        """Provide a client without credentials."""
+        with patch("apigee_hybrid_mcp.api.client.service_account"):
+            return ApigeeClient(test_settings)
+
+    def test_relative_path_gets_org_prefix(self, client: ApigeeClient) -> None:
+        """Test that relative paths are scoped to the configured organization."""
+        assert (
+            client._build_url("apis/weather")
+            == "https://apigee.googleapis.com/v1/organizations/test-org/apis/weather"
+        )
+
+    def test_leading_slash_stripped(self, client: ApigeeClient) -> None:
+        """Test that a leading slash does not produce a double slash."""
+        assert (
+            client._build_url("/environments")
+            == "https://apigee.googleapis.com/v1/organizations/test-org/environments"
+        )
+
+    def test_organization_path_not_prefixed(self, client: ApigeeClient) -> None:
+        """Test that explicit organization paths are used as-is."""
+        assert (
+            client._build_url("organizations/other-org")
+            == "https://apigee.googleapis.com/v1/organizations/other-org"
+        )
+
+
+@pytest.mark.asyncio
+class TestErrorResponses:
+    """Test suite for HTTP error response handling."""
+
+    async def test_error_body_read_is_bounded(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that only a prefix of large error bodies is read."""
+        from apigee_hybrid_mcp.api.client import MAX_RESPONSE_LOG_LENGTH
+        from apigee_hybrid_mcp.exceptions import ExternalServiceError
+
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 500
+        response.content.read = AsyncMock(return_value=b"x" * MAX_RESPONSE_LOG_LENGTH)
+        response.read = AsyncMock()
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await mock_apigee_client.get("environments")
+
+        response.content.read.assert_awaited_once_with(MAX_RESPONSE_LOG_LENGTH)
+        response.read.assert_not_awaited()
+        assert exc_info.value.status == 500
+
+    async def test_error_detail_truncated(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that error details carry only a short prefix of the body."""
+        from apigee_hybrid_mcp.api.client import MAX_RESPONSE_DETAIL_LENGTH
+        from apigee_hybrid_mcp.exceptions import ResourceNotFoundError
+
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 404
+        response.content.read = AsyncMock(side_effect=[b"y" * 400, b""])
+
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            await mock_apigee_client.get("apis/missing")
+        assert exc_info.value.details["response"] == "y" * MAX_RESPONSE_DETAIL_LENGTH
+
+    async def test_error_body_read_across_chunks(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that an error body arriving in several chunks is read in full."""
+        from apigee_hybrid_mcp.exceptions import ResourceNotFoundError
+
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 404
+        response.content.read = AsyncMock(side_effect=[b'{"error":', b'"not found"}', b""])
+
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            await mock_apigee_client.get("apis/missing")
+        assert exc_info.value.details["response"] == '{"error":"not found"}'
+
+    async def test_client_error_mapped(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that transport errors are wrapped in ExternalServiceError."""
+        import aiohttp
+
+        from apigee_hybrid_mcp.exceptions import ExternalServiceError
+
+        mock_apigee_client.session.request.side_effect = aiohttp.ClientConnectionError("reset")
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await mock_apigee_client.get("environments")
+        assert exc_info.value.details["error_type"] == "ClientConnectionError"
+
+    async def test_timeout_mapped(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that request timeouts are wrapped in the application TimeoutError."""
+        import asyncio
+
+        from apigee_hybrid_mcp.exceptions import TimeoutError as AppTimeoutError
+
+        mock_apigee_client.session.request.side_effect = asyncio.TimeoutError()
+
+        with pytest.raises(AppTimeoutError):
+            await mock_apigee_client.get("environments")
+
+    async def test_invalid_json_mapped(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that an unparseable success body is wrapped in ExternalServiceError."""
+        from apigee_hybrid_mcp.exceptions import ExternalServiceError
+
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b"<html>")
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await mock_apigee_client.get("environments")
+        assert exc_info.value.details["error_type"] == "JSONDecodeError"
+
+
+@pytest.mark.asyncio
+class TestRawResponses:
+    """Test suite for unparsed response bodies."""
+
+    async def test_get_raw_returns_body_bytes(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that get_raw returns the body exactly as received."""
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b'{"name": "prod"}')
+
+        body = await mock_apigee_client.get_raw("environments/prod", params={"a": "1"})
+
+        assert body == b'{"name": "prod"}'
+        assert mock_apigee_client.session.request.call_args.kwargs["params"] == {"a": "1"}
+
+    async def test_empty_body_parses_to_empty_dict(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that parsed requests still treat an empty body as an empty object."""
+        response = mock_apigee_client.session.request.return_value.__aenter__.return_value
+        response.status = 200
+        response.read = AsyncMock(return_value=b"")
+
+        assert await mock_apigee_client.get("environments") == {}
+        assert await mock_apigee_client.get_raw("environments") == b""
+
+
+@pytest.mark.asyncio
+class TestBatchGet:
+    """Test suite for concurrent batched GET requests."""
+
+    async def test_batch_get_preserves_order(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that results are returned in the order of the requested paths."""
+        import asyncio
+
+        async def fake_get(path: str) -> dict:
+            await asyncio.sleep(0.01 if path.endswith("a") else 0)
+            return {"path": path}
+
+        with patch.object(ApigeeClient, "get", side_effect=fake_get):
+            results = await mock_apigee_client.batch_get(["apis/a", "apis/b", "apis/c"])
+
+        assert [r["path"] for r in results] == ["apis/a", "apis/b", "apis/c"]
+
+    async def test_batch_get_bounds_concurrency(self, mock_apigee_client: ApigeeClient) -> None:
+        """Test that no more than the given number of requests run at once."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(path: str) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        with patch.object(ApigeeClient, "get", side_effect=fake_get):
+            await mock_apigee_client.batch_get([f"apis/{i}" for i in range(10)], concurrency=3)
+
+        assert peak == 3
+
+
+class TestLegacyApigeeAPIError:
+    """Test suite for the deprecated ApigeeAPIError shim."""
+
+    def test_is_app_error(self) -> None:
+        """Test that the legacy error participates in AppError handling."""
+        from apigee_hybrid_mcp.api.client import ApigeeAPIError
+        from apigee_hybrid_mcp.exceptions import AppError
+
+        error = ApigeeAPIError("boom", status_code=503, response_body="{}")
+
+        assert isinstance(error, AppError)
+        assert error.message == "boom"
+        assert error.status_code == 503
+        assert error.response_body == "{}"
+        assert error.status == 503
+        assert error.code == "APIGEE_API_ERROR"
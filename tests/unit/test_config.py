@@ -0,0 +1,46 @@
+"""Unit tests for configuration management.
+
+Tests cover:
+- Settings caching
+- Settings immutability
+- Derived URL prefixes
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from apigee_hybrid_mcp.config import Settings, get_settings
+
+
+class TestSettings:
+    """Test suite for Settings and get_settings."""
+
+    def test_get_settings_is_cached(self) -> None:
+        """Test that get_settings returns the same instance on repeated calls."""
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is get_settings()
+        finally:
+            get_settings.cache_clear()
+
+    def test_settings_are_frozen(self, test_settings: Settings) -> None:
+        """Test that settings cannot be modified after creation."""
+        with pytest.raises(ValidationError):
+            test_settings.apigee_organization = "other-org"
+
+    def test_settings_are_hashable(self, test_settings: Settings) -> None:
+        """Test that frozen settings can be used as cache keys."""
+        assert hash(test_settings) == hash(test_settings)
+
+    def test_url_prefixes(self) -> None:
+        """Test that derived URL prefixes normalize trailing slashes."""
+        settings = Settings(
+            apigee_organization="test-org",
+            apigee_api_base_url="https://apigee.googleapis.com/v1/",
+        )
+        assert settings.api_base_prefix == "https://apigee.googleapis.com/v1/"
+        assert (
+            settings.organization_prefix
+            == "https://apigee.googleapis.com/v1/organizations/test-org/"
+        )
+        assert settings.organization_prefix is settings.organization_prefix
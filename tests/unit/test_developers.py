@@ -33,8 +33,8 @@ class TestDevelopers:
             "developer": [sample_developer, {**sample_developer, "email": "dev2@example.com"}]
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(expected_response)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(expected_response).encode()
         )
 
         # Act
@@ -60,8 +60,8 @@ class TestDevelopers:
         }
         expected_response = {**developer_data, "developerId": "dev-new", "status": "active"}
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(expected_response)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(expected_response).encode()
         )
 
         # Act
@@ -7,6 +7,9 @@ Tests cover:
 - External API error handling
 """
 
+import logging
+from unittest.mock import MagicMock, patch
+
 from apigee_hybrid_mcp.error_handlers import (
     create_validation_error_response,
     format_error_response,
@@ -47,6 +50,41 @@ class TestFormatErrorResponse:
         assert "must be valid email" in text
         assert error.correlation_id in text
 
+    def test_format_app_error_logs_at_status_level(self) -> None:
+        """Test that client errors log as warnings and server errors as errors."""
+        with patch("apigee_hybrid_mcp.error_handlers.logger") as mock_logger:
+            mock_logger.is_enabled_for.return_value = True
+            format_error_response(AuthenticationError(), "op")
+            format_error_response(ExternalServiceError(service="apigee"), "op")
+
+        levels = [call.args[0] for call in mock_logger.log.call_args_list]
+        assert levels == [logging.WARNING, logging.ERROR]
+
+    def test_format_app_error_skips_filtered_log(self) -> None:
+        """Test that no log record is built when the level is filtered out."""
+        mock_logger = MagicMock()
+        mock_logger.is_enabled_for.return_value = False
+        with (
+            patch("apigee_hybrid_mcp.error_handlers.logger", mock_logger),
+            patch("apigee_hybrid_mcp.error_handlers.redact_sensitive_fields") as redact,
+        ):
+            response = format_error_response(AuthenticationError(), "op")
+
+        assert "AUTHENTICATION_ERROR" in response[0].text
+        mock_logger.log.assert_not_called()
+        redact.assert_not_called()
+
+    def test_format_generic_exception_skips_filtered_log(self) -> None:
+        """Test that unexpected errors are not logged when ERROR is filtered out."""
+        mock_logger = MagicMock()
+        mock_logger.is_enabled_for.return_value = False
+        with patch("apigee_hybrid_mcp.error_handlers.logger", mock_logger):
+            response = format_error_response(ValueError("boom"), "op")
+
+        assert "Unexpected Error in op" in response[0].text
+        mock_logger.is_enabled_for.assert_called_once_with(logging.ERROR)
+        mock_logger.error.assert_not_called()
+
     def test_format_authentication_error(self) -> None:
         """Test formatting of AuthenticationError."""
         error = AuthenticationError(message="Invalid token")
@@ -80,6 +118,19 @@ class TestFormatErrorResponse:
         text = response[0].text
         assert "Stack Trace" in text or "Traceback" in text
 
+    def test_format_traceback_uses_the_error_itself(self) -> None:
+        """Test that the stack trace is taken from the error, not sys.exc_info."""
+        try:
+            raise RuntimeError("raised error")
+        except RuntimeError as exc:
+            error = exc
+
+        response = format_error_response(error, "test-operation", include_traceback=True)
+
+        text = response[0].text
+        assert text.count("RuntimeError: raised error") == 1
+        assert "NoneType: None" not in text
+
     def test_format_error_with_details(self) -> None:
         """Test formatting error with detailed information."""
         error = ResourceNotFoundError(
@@ -94,6 +145,17 @@ class TestFormatErrorResponse:
         assert "team-123" in text
         assert "searched_in" in text or "database" in text
 
+    def test_format_error_with_nested_details(self) -> None:
+        """Test that nested details are indented per level."""
+        error = AppError(
+            message="Nested",
+            details={"outer": {"inner": {"leaf": 1}, "empty": {}}, "items": [1, "two"]},
+        )
+        response = format_error_response(error, "test-operation")
+
+        text = response[0].text
+        assert "outer:\n  inner:\n    leaf: 1\n  empty:\n  (none)\nitems: [1, two]" in text
+
 
 class TestHandleExternalApiError:
     """Test suite for handle_external_api_error function."""
@@ -251,6 +313,17 @@ class TestErrorResponseStructure:
         assert isinstance(response[0], TextContent)
         assert response[0].type == "text"
 
+    def test_error_response_serializes_like_validated_content(self) -> None:
+        """Test that constructed content dumps the same as a validated instance."""
+        from mcp.types import TextContent
+
+        response = format_error_response(AppError(message="Test"), "test")
+
+        expected = TextContent(type="text", text=response[0].text)
+        assert response[0].model_dump(mode="json", exclude_unset=True) == expected.model_dump(
+            mode="json", exclude_unset=True
+        )
+
 
 class TestMultipleErrorScenarios:
     """Test various error scenarios."""
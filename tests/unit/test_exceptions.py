@@ -57,6 +57,12 @@ class TestAppError:
         error2 = AppError(message="Error 2")
         assert error1.correlation_id != error2.correlation_id
 
+    def test_app_error_correlation_id_format(self) -> None:
+        """Test that generated correlation IDs are 32-character hex tokens."""
+        error = AppError(message="Error")
+        assert len(error.correlation_id) == 32
+        int(error.correlation_id, 16)
+
     def test_app_error_to_dict(self) -> None:
         """Test serialization to dictionary."""
         error = AppError(
@@ -113,6 +119,22 @@ class TestValidationError:
         assert error.details["parameter"] == "email"
         assert error.details["reason"] == "must be valid email format"
 
+    def test_invalid_parameter_error_does_not_mutate_details(self) -> None:
+        """Test that caller-supplied details are merged without being modified."""
+        details = {"hint": "use name@example.com", "parameter": "ignored"}
+        error = InvalidParameterError(
+            parameter="email",
+            value="invalid",
+            reason="bad format",
+            details=details,
+        )
+        assert details == {"hint": "use name@example.com", "parameter": "ignored"}
+        assert error.details == {
+            "hint": "use name@example.com",
+            "parameter": "email",
+            "reason": "bad format",
+        }
+
     def test_missing_parameter_error(self) -> None:
         """Test MissingParameterError initialization."""
         error = MissingParameterError(parameter="organization")
@@ -30,8 +30,8 @@ class TestKeystoreManagement:
 
         keystores_response = {"keystores": ["tls-keystore", "truststore"]}
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(keystores_response)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(keystores_response).encode()
         )
 
         # Act
@@ -51,8 +51,8 @@ class TestKeystoreManagement:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_keystore)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_keystore).encode()
         )
 
         # Act
@@ -73,8 +73,8 @@ class TestKeystoreManagement:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_keystore_alias)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_keystore_alias).encode()
         )
 
         # Act
@@ -0,0 +1,61 @@
+"""Unit tests for logging configuration.
+
+Tests cover:
+- Buffered log output
+- Immediate flush on errors
+"""
+
+import logging
+from typing import Iterator
+
+import pytest
+import structlog
+
+from apigee_hybrid_mcp.utils.logging import BUFFERED_LOGGER_NAME, configure_logging, get_logger
+
+
+@pytest.fixture
+def reset_logging() -> Iterator[None]:
+    """Restore default structlog configuration and drop buffered handlers."""
+    yield
+    buffered = logging.getLogger(BUFFERED_LOGGER_NAME)
+    for handler in buffered.handlers[:]:
+        buffered.removeHandler(handler)
+        handler.close()
+    structlog.reset_defaults()
+
+
+@pytest.mark.usefixtures("reset_logging")
+class TestConfigureLogging:
+    """Test suite for configure_logging."""
+
+    def test_buffered_records_wait_for_capacity(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that buffered records are written once the buffer fills."""
+        configure_logging("INFO", buffer_size=2)
+        log = get_logger("test")
+
+        log.info("first_event")
+        assert "first_event" not in capsys.readouterr().out
+
+        log.info("second_event")
+        out = capsys.readouterr().out
+        assert "first_event" in out
+        assert "second_event" in out
+
+    def test_error_flushes_buffer(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that an error record flushes pending records immediately."""
+        configure_logging("INFO", buffer_size=100)
+        log = get_logger("test")
+
+        log.warning("pending_event")
+        log.error("failure_event")
+
+        out = capsys.readouterr().out
+        assert out.index("pending_event") < out.index("failure_event")
+
+    def test_unbuffered_by_default(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that records are written immediately without a buffer size."""
+        configure_logging("INFO")
+        get_logger("test").info("immediate_event")
+
+        assert "immediate_event" in capsys.readouterr().out
@@ -35,8 +35,8 @@ class TestProxyLifecycle:
             "deployStartTime": "2024-01-01T00:00:00Z",
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(deployment_response)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(deployment_response).encode()
         )
 
         # Act
@@ -64,8 +64,8 @@ class TestProxyLifecycle:
             "state": "undeployed",
         }
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(undeploy_response)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(undeploy_response).encode()
         )
 
         # Act
@@ -0,0 +1,45 @@
+"""Unit tests for resilience utilities.
+
+Tests cover:
+- Token bucket rate limiting
+- Waiting for rate limit slots
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from apigee_hybrid_mcp.utils.resilience import RateLimiter
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter."""
+
+    def test_acquire_within_limit(self) -> None:
+        """Test that requests within the limit are allowed."""
+        limiter = RateLimiter(requests_per_window=3, window_seconds=60)
+        assert all(limiter.acquire() for _ in range(3))
+
+    def test_acquire_over_limit(self) -> None:
+        """Test that requests over the limit are rejected."""
+        limiter = RateLimiter(requests_per_window=2, window_seconds=60)
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.acquire() is False
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_immediately_with_tokens(self) -> None:
+        """Test that wait does not sleep when a token is available."""
+        limiter = RateLimiter(requests_per_window=1, window_seconds=60)
+        with patch("apigee_hybrid_mcp.utils.resilience.asyncio.sleep", new=AsyncMock()) as sleep:
+            await limiter.wait()
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wait_sleeps_until_token_refills(self) -> None:
+        """Test that wait sleeps for the refill time instead of rejecting."""
+        limiter = RateLimiter(requests_per_window=10, window_seconds=1)
+        while limiter.acquire():
+            pass
+
+        await limiter.wait()
+        assert limiter.tokens < 1
@@ -0,0 +1,624 @@
+"""Unit tests for the MCP server module.
+
+Tests cover:
+- API response formatting
+- Passthrough of raw API responses
+- Compact or indented response JSON
+- Tool catalog listing
+- Tool response caching
+- Stale responses on upstream failure
+- Tool argument validation
+- Tool dispatch
+- Large response storage
+- Batched read tools
+- Event loop selection
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Iterator, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from mcp.types import TextContent
+
+from apigee_hybrid_mcp import server
+from apigee_hybrid_mcp.config import Settings
+from apigee_hybrid_mcp.exceptions import ExternalServiceError, ResourceNotFoundError
+from apigee_hybrid_mcp.exceptions import TimeoutError as AppTimeoutError
+from apigee_hybrid_mcp.models.team import TeamCreate
+from apigee_hybrid_mcp.repository.team_repository import InMemoryTeamRepository
+from apigee_hybrid_mcp.server import (
+    _TOOLS,
+    call_tool,
+    format_api_response,
+    format_api_response_raw,
+    list_tools,
+)
+from apigee_hybrid_mcp.utils.cache import TTLCache
+
+
+class TestFormatApiResponse:
+    """Test suite for format_api_response function."""
+
+    def test_format_api_response_layout(self) -> None:
+        """Test that responses carry the operation header and compact JSON."""
+        with patch.object(server, "_response_json_options", return_value=orjson.OPT_NON_STR_KEYS):
+            response = format_api_response({"name": "org-1", "tags": ["a"]}, "Get Organization")
+
+        assert len(response) == 1
+        assert response[0].text == 'Operation: Get Organization\n\n{"name":"org-1","tags":["a"]}'
+
+    def test_format_api_response_pretty(self) -> None:
+        """Test that JSON is indented when pretty output is enabled."""
+        with patch.object(
+            server,
+            "_response_json_options",
+            return_value=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+        ):
+            response = format_api_response({"name": "org-1", "tags": ["a"]}, "Get Organization")
+
+        assert len(response) == 1
+        expected_body = '{\n  "name": "org-1",\n  "tags": [\n    "a"\n  ]\n}'
+        assert response[0].text == f"Operation: Get Organization\n\n{expected_body}"
+
+    def test_format_api_response_round_trips(self) -> None:
+        """Test that the JSON body parses back to the original data."""
+        data = {"proxies": [{"name": "p1", "revision": ["1", "2"]}], "count": 1}
+        response = format_api_response(data, "List API Proxies")
+
+        body = response[0].text.split("\n\n", 1)[1]
+        assert json.loads(body) == data
+
+    def test_format_api_response_non_json_values(self) -> None:
+        """Test that non-string keys and non-JSON values are still rendered."""
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        response = format_api_response({1: "one", "at": stamp, "quota": Decimal("1.5")}, "Op")
+
+        body = json.loads(response[0].text.split("\n\n", 1)[1])
+        assert body == {"1": "one", "at": "2024-01-01T00:00:00+00:00", "quota": "1.5"}
+
+    def test_format_api_response_serializes_like_validated_content(self) -> None:
+        """Test that constructed content dumps the same as a validated instance."""
+        response = format_api_response({"name": "org-1"}, "Get Organization")
+
+        expected = TextContent(type="text", text=response[0].text)
+        assert isinstance(response[0], TextContent)
+        assert response[0].model_dump(mode="json", exclude_unset=True) == expected.model_dump(
+            mode="json", exclude_unset=True
+        )
+
+
+class TestListTools:
+    """Test suite for the list_tools handler."""
+
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_catalog(self) -> None:
+        """Test that every call serves the same prebuilt tool definitions."""
+        first = await list_tools()
+        second = await list_tools()
+
+        assert [tool.name for tool in first] == [tool.name for tool in _TOOLS]
+        assert all(a is b for a, b in zip(first, second))
+
+    @pytest.mark.asyncio
+    async def test_list_tools_result_is_a_copy(self) -> None:
+        """Test that mutating a returned list does not change the catalog."""
+        tools = await list_tools()
+        tools.clear()
+
+        assert len(await list_tools()) == len(_TOOLS) > 0
+
+    def test_tools_share_common_parameter_schemas(self) -> None:
+        """Test that repeated parameters reference one shared schema object."""
+        org_schemas = {
+            id(tool.inputSchema["properties"]["organization"])
+            for tool in _TOOLS
+            if "organization" in tool.inputSchema.get("properties", {})
+            and tool.name != "get-organization"
+        }
+
+        assert len(org_schemas) == 1
+
+    def test_tool_specs_required_params_are_declared(self) -> None:
+        """Test that every required parameter has a schema in its tool."""
+        for tool in _TOOLS:
+            schema = tool.inputSchema
+            assert schema["type"] == "object"
+            assert set(schema["required"]) <= set(schema["properties"]), tool.name
+
+    def test_tool_names_are_unique(self) -> None:
+        """Test that the spec table does not declare a tool twice."""
+        names = [tool.name for tool in _TOOLS]
+        assert len(names) == len(set(names))
+
+
+@pytest.fixture
+def response_cache() -> Iterator[None]:
+    """Give each test an empty tool response cache."""
+    server._response_cache = None
+    yield
+    server._response_cache = None
+
+
+@pytest.mark.usefixtures("response_cache")
+class TestCallToolCache:
+    """Test suite for tool response caching in call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_read_tool_responses_are_cached(self) -> None:
+        """Test that repeated reads with equal arguments dispatch once."""
+        content = format_api_response({"name": "prod"}, "Get Environment: prod")
+        with patch.object(server, "_dispatch_tool", AsyncMock(return_value=content)) as dispatch:
+            first = await call_tool("get-environment", {"organization": "o", "environment": "p"})
+            second = await call_tool("get-environment", {"environment": "p", "organization": "o"})
+            await call_tool("get-environment", {"organization": "o", "environment": "q"})
+
+        assert first == second == content
+        assert dispatch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_and_misses_are_logged(self) -> None:
+        """Test that cache lookups are logged at debug level."""
+        content = format_api_response({}, "List Teams")
+        with (
+            patch.object(server, "_dispatch_tool", AsyncMock(return_value=content)),
+            patch.object(server, "logger") as mock_logger,
+        ):
+            await call_tool("list-teams", {})
+            await call_tool("list-teams", {})
+
+        events = [call.args[0] for call in mock_logger.debug.call_args_list]
+        assert events == ["tool_cache_miss", "tool_cache_hit"]
+
+    @pytest.mark.asyncio
+    async def test_unencodable_arguments_skip_the_cache(self) -> None:
+        """Test that arguments orjson rejects are dispatched uncached, not raised."""
+        content = format_api_response({}, "Get Team")
+        dispatch = AsyncMock(return_value=content)
+        arguments = {"team_id": "t-1", "extra": 2**70}
+        with patch.object(server, "_dispatch_tool", dispatch):
+            first = await call_tool("get-team", arguments)
+            await call_tool("get-team", arguments)
+
+        assert first == content
+        assert dispatch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_mutation_is_not_cached(self) -> None:
+        """Test that a read in flight when the cache is cleared does not store its result."""
+        content = format_api_response({"teams": []}, "List Teams")
+        calls: list[str] = []
+
+        async def dispatch(name: str, arguments: dict) -> list:
+            calls.append(name)
+            if calls == ["list-teams"]:
+                # A write completes while the first read is still running
+                await call_tool("delete-team", {"team_id": "t-1"})
+            return content
+
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            await call_tool("list-teams", {})
+
+        assert calls == ["list-teams", "delete-team", "list-teams"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        """Test that failed reads are retried on the next call."""
+        dispatch = AsyncMock(side_effect=ValueError("boom"))
+        with patch.object(server, "_dispatch_tool", dispatch):
+            response = await call_tool("list-teams", {})
+            await call_tool("list-teams", {})
+
+        assert "boom" in response[0].text
+        assert dispatch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mutating_tool_clears_cache(self) -> None:
+        """Test that a state-changing tool invalidates cached reads."""
+        dispatch = AsyncMock(return_value=format_api_response({}, "op"))
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            await call_tool("create-team", {"name": "team-a"})
+            await call_tool("list-teams", {})
+
+        assert dispatch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_clear_tool_cache(self) -> None:
+        """Test that the clear-tool-cache tool empties the cache."""
+        dispatch = AsyncMock(return_value=format_api_response({}, "op"))
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            response = await call_tool("clear-tool-cache", {})
+            await call_tool("list-teams", {})
+
+        assert json.loads(response[0].text.split("\n\n", 1)[1]) == {"cleared": 1}
+        assert dispatch.await_count == 2
+
+
+@pytest.mark.usefixtures("response_cache")
+class TestStaleResponses:
+    """Test suite for serving expired reads while the Apigee API is failing."""
+
+    @pytest.fixture
+    def clock(self) -> Iterator[list[float]]:
+        """Install a manually advanced cache clock with a 100 second stale window."""
+        now = [0.0]
+        server._response_cache = TTLCache(10, ttl=60, timer=lambda: now[0], stale_ttl=100)
+        yield now
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ExternalServiceError(service="apigee_api", status=503, details={"status": 503}),
+            ExternalServiceError(service="apigee_api", details={"error_type": "ClientError"}),
+            AppTimeoutError(operation="GET teams", timeout_seconds=30),
+        ],
+        ids=["5xx", "transport", "timeout"],
+    )
+    async def test_stale_response_served_on_upstream_failure(
+        self, clock: list[float], error: ExternalServiceError | AppTimeoutError
+    ) -> None:
+        """Test that an expired read is returned with a notice when Apigee fails."""
+        content = format_api_response({"teams": []}, "List Teams")
+        dispatch = AsyncMock(side_effect=[content, error])
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            clock[0] = 90.0
+            response = await call_tool("list-teams", {})
+
+        assert response[0] == content[0]
+        assert response[1].text.startswith("Stale: served from cache")
+        assert error.code in response[1].text
+
+    @pytest.mark.asyncio
+    async def test_error_returned_past_stale_window(self, clock: list[float]) -> None:
+        """Test that entries past the stale window are not served."""
+        content = format_api_response({}, "List Teams")
+        dispatch = AsyncMock(side_effect=[content, ExternalServiceError(service="apigee_api")])
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            clock[0] = 160.0
+            response = await call_tool("list-teams", {})
+
+        assert len(response) == 1
+        assert "EXTERNAL_SERVICE_ERROR" in response[0].text
+
+    @pytest.mark.asyncio
+    async def test_upstream_client_errors_are_not_masked(self, clock: list[float]) -> None:
+        """Test that a 4xx from Apigee mapped to ExternalServiceError is reported."""
+        content = format_api_response({}, "List Teams")
+        forbidden = ExternalServiceError(service="apigee_api", details={"status": 403})
+        dispatch = AsyncMock(side_effect=[content, forbidden])
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("list-teams", {})
+            clock[0] = 90.0
+            response = await call_tool("list-teams", {})
+
+        assert len(response) == 1
+        assert "EXTERNAL_SERVICE_ERROR" in response[0].text
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_masked(self, clock: list[float]) -> None:
+        """Test that non-upstream errors are reported even with a stale entry."""
+        content = format_api_response({}, "Get Team")
+        dispatch = AsyncMock(side_effect=[content, ResourceNotFoundError("team", "t-1")])
+        with patch.object(server, "_dispatch_tool", dispatch):
+            await call_tool("get-team", {"team_id": "t-1"})
+            clock[0] = 90.0
+            response = await call_tool("get-team", {"team_id": "t-1"})
+
+        assert len(response) == 1
+        assert "RESOURCE_NOT_FOUND" in response[0].text
+
+
+@pytest.mark.usefixtures("response_cache")
+class TestCallToolArgumentValidation:
+    """Test suite for tool argument validation in call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_missing_required_argument(self) -> None:
+        """Test that a missing required argument is rejected before dispatch."""
+        with patch.object(server, "_dispatch_tool", AsyncMock()) as dispatch:
+            response = await call_tool("get-environment", {"organization": "org"})
+
+        assert "MISSING_PARAMETER" in response[0].text
+        assert "environment" in response[0].text
+        dispatch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wrong_argument_type(self) -> None:
+        """Test that arguments are not coerced to the schema type."""
+        with patch.object(server, "_dispatch_tool", AsyncMock()) as dispatch:
+            response = await call_tool(
+                "get-api-proxy-revision", {"organization": "org", "proxy": "p", "revision": 1}
+            )
+
+        assert "INVALID_PARAMETER" in response[0].text
+        assert "revision" in response[0].text
+        dispatch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_enum_and_array_arguments(self) -> None:
+        """Test that enum values and array item types are enforced."""
+        with patch.object(server, "_dispatch_tool", AsyncMock()) as dispatch:
+            bad_enum = await call_tool(
+                "create-environment", {"organization": "org", "name": "e", "type": "STAGING"}
+            )
+            bad_items = await call_tool("create-team", {"name": "team-a", "members": [1]})
+
+        assert "INVALID_PARAMETER" in bad_enum[0].text
+        assert "members.0" in bad_items[0].text
+        dispatch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_valid_arguments_are_dispatched(self) -> None:
+        """Test that valid arguments, including unknown extras, reach the dispatcher."""
+        arguments = {"organization": "org", "environment": "e", "note": 1}
+        content = format_api_response({}, "op")
+        with patch.object(server, "_dispatch_tool", AsyncMock(return_value=content)) as dispatch:
+            response = await call_tool("list-keystores", arguments)
+
+        assert response == content
+        dispatch.assert_awaited_once_with("list-keystores", arguments)
+
+    def test_every_tool_has_an_argument_model(self) -> None:
+        """Test that argument models are built for the whole catalog."""
+        assert set(server._ARGUMENT_MODELS) == {tool.name for tool in _TOOLS}
+
+
+class TestDispatchTool:
+    """Test suite for routing tool calls to their handlers."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_routes_to_handler(self) -> None:
+        """Test that a tool call reaches its handler with the shared client."""
+        client = MagicMock()
+        client.get_raw = AsyncMock(return_value=b'{"name":"prod"}')
+
+        with (
+            patch.object(server, "get_shared_client", return_value=client),
+            patch.object(server, "_response_json_options", return_value=orjson.OPT_NON_STR_KEYS),
+        ):
+            response = await server._dispatch_tool(
+                "get-environment", {"organization": "org", "environment": "prod"}
+            )
+
+        client.get_raw.assert_awaited_once_with(
+            "environments/prod", params={"prettyPrint": "false"}
+        )
+        assert response[0].text == 'Operation: Get Environment: prod\n\n{"name":"prod"}'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("arguments", "params"),
+        [
+            ({"expand": True}, {"expand": "true", "prettyPrint": "false"}),
+            ({"expand": False}, {"prettyPrint": "false"}),
+            ({}, {"prettyPrint": "false"}),
+        ],
+    )
+    async def test_dispatch_flag_query_params(self, arguments: dict, params: dict) -> None:
+        """Test that boolean flags map to query parameters without altering the shared ones."""
+        client = MagicMock()
+        client.get_raw = AsyncMock(return_value=b"{}")
+
+        with (
+            patch.object(server, "get_shared_client", return_value=client),
+            patch.object(server, "_response_json_options", return_value=orjson.OPT_NON_STR_KEYS),
+        ):
+            await server._dispatch_tool("list-developers", {"organization": "org", **arguments})
+
+        client.get_raw.assert_awaited_once_with("developers", params=params)
+        assert server._EXPAND_QUERY == {"expand": "true"}
+        assert server._COMPACT_QUERY == {"prettyPrint": "false"}
+
+    @pytest.mark.asyncio
+    async def test_dispatch_unknown_tool(self) -> None:
+        """Test that unknown tool names are rejected."""
+        with pytest.raises(ValueError, match="Unknown tool: no-such-tool"):
+            await server._dispatch_tool("no-such-tool", {})
+
+
+class TestPassthroughResponses:
+    """Test suite for returning API response bodies without re-encoding."""
+
+    def test_format_api_response_raw(self) -> None:
+        """Test that the body is wrapped as returned by the API."""
+        response = format_api_response_raw(b'{"name":"org-1"}', "Get Organization")
+
+        assert response[0].text == 'Operation: Get Organization\n\n{"name":"org-1"}'
+
+    def test_format_api_response_raw_empty_body(self) -> None:
+        """Test that an empty body is rendered as an empty object."""
+        response = format_api_response_raw(b"", "Delete")
+
+        assert response[0].text == "Operation: Delete\n\n{}"
+
+    @pytest.mark.parametrize(
+        ("options", "params", "expected"),
+        [
+            (orjson.OPT_NON_STR_KEYS, None, {"prettyPrint": "false"}),
+            (orjson.OPT_NON_STR_KEYS, {"count": 5}, {"count": 5, "prettyPrint": "false"}),
+            (orjson.OPT_INDENT_2, {"count": 5}, {"count": 5}),
+            (orjson.OPT_INDENT_2, None, None),
+        ],
+    )
+    def test_passthrough_params(
+        self, options: int, params: Optional[dict], expected: Optional[dict]
+    ) -> None:
+        """Test that compact JSON is requested unless responses are indented."""
+        with patch.object(server, "_response_json_options", return_value=options):
+            assert server._passthrough_params(params) == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [orjson.OPT_NON_STR_KEYS, orjson.OPT_INDENT_2])
+    async def test_list_teams_wraps_cached_json(self, options: int) -> None:
+        """Test that listed teams match the repository whether compact or indented."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="team-a", members=["a@example.com"]))
+        with (
+            patch.object(server, "team_repository", repo),
+            patch.object(server, "_response_json_options", return_value=options),
+        ):
+            response = await server._list_teams(MagicMock(), {})
+
+        body = response[0].text.split("\n\n", 1)[1]
+        assert json.loads(body) == {"teams": [json.loads(orjson.dumps(team.to_dict()))]}
+        assert ("\n" in body) is bool(options & orjson.OPT_INDENT_2)
+
+
+class TestResponseJsonOptions:
+    """Test suite for choosing indented or compact response JSON."""
+
+    @pytest.mark.parametrize(
+        ("pretty_json", "isatty", "indented"),
+        [(True, False, True), (False, True, False), (None, True, True), (None, False, False)],
+    )
+    def test_response_json_options(
+        self, pretty_json: Optional[bool], isatty: bool, indented: bool
+    ) -> None:
+        """Test that the setting wins and an unset setting follows the terminal."""
+        server._response_json_options.cache_clear()
+        try:
+            with (
+                patch.object(
+                    server, "get_settings", return_value=Settings(pretty_json=pretty_json)
+                ),
+                patch.object(server.sys.stdout, "isatty", return_value=isatty),
+            ):
+                options = server._response_json_options()
+        finally:
+            server._response_json_options.cache_clear()
+
+        assert bool(options & orjson.OPT_INDENT_2) is indented
+
+
+@pytest.mark.usefixtures("response_cache")
+class TestLargeResponses:
+    """Test suite for storing oversized responses for paged retrieval."""
+
+    def test_small_response_is_inlined(self) -> None:
+        """Test that responses under the threshold are returned as-is."""
+        with patch.object(
+            server, "get_settings", return_value=Settings(large_response_threshold=100)
+        ):
+            response = format_api_response({"name": "org-1"}, "Op")
+
+        assert "org-1" in response[0].text
+
+    @pytest.mark.asyncio
+    async def test_large_response_is_stored_and_paged(self) -> None:
+        """Test that oversized JSON is replaced by an id readable in pages."""
+        data = {"proxies": [f"proxy-{i}" for i in range(20)]}
+        settings = Settings(large_response_threshold=50)
+        with patch.object(server, "get_settings", return_value=settings):
+            response = format_api_response(data, "List API Proxies")
+            response_id = response[0].text.rsplit('"', 2)[1]
+
+            first = await server._fetch_cached_response(MagicMock(), {"response_id": response_id})
+            rest = await server._fetch_cached_response(
+                MagicMock(), {"response_id": response_id, "offset": 50, "limit": 10_000}
+            )
+
+        assert "proxy-0" not in response[0].text
+        assert f"apigee-mcp://responses/{response_id}" in response[0].text
+        pages = [page[0].text.split("\n\n", 1)[1] for page in (first, rest)]
+        assert len(pages[0]) == 50
+        assert json.loads("".join(pages)) == data
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("response_cache")
+    async def test_stored_response_is_not_cached(self) -> None:
+        """Test that a pointer result is re-fetched instead of served from the tool cache."""
+        data = {"teams": [f"team-{i}" for i in range(20)]}
+        handler = AsyncMock(side_effect=lambda *_: format_api_response(data, "List Teams"))
+        settings = Settings(large_response_threshold=50)
+        with (
+            patch.dict(server._TOOL_HANDLERS, {"list-teams": handler}),
+            patch.object(server, "get_shared_client"),
+            patch.object(server, "get_settings", return_value=settings),
+        ):
+            await call_tool("list-teams", {})
+            for _ in range(server.STORED_RESPONSE_LIMIT + 6):
+                format_api_response(data, "List API Proxies")
+            response = await call_tool("list-teams", {})
+            response_id = response[0].text.rsplit('"', 2)[1]
+            page = await server._fetch_cached_response(
+                MagicMock(), {"response_id": response_id, "limit": 10_000}
+            )
+
+        assert handler.await_count == 2
+        assert json.loads(page[0].text.split("\n\n", 1)[1]) == data
+
+    @pytest.mark.asyncio
+    async def test_fetch_unknown_response(self) -> None:
+        """Test that an unknown or expired response id is reported as not found."""
+        with patch.object(server, "get_shared_client"):
+            response = await call_tool("fetch-cached-response", {"response_id": "missing"})
+
+        assert "RESOURCE_NOT_FOUND" in response[0].text
+
+
+@pytest.mark.usefixtures("response_cache")
+class TestBatchRead:
+    """Test suite for running several read tools in one call."""
+
+    @pytest.mark.asyncio
+    async def test_batch_read_returns_each_result(self) -> None:
+        """Test that every call's content is returned in call order."""
+        handlers = {
+            "list-teams": AsyncMock(return_value=format_api_response({}, "List Teams")),
+            "get-team": AsyncMock(side_effect=ResourceNotFoundError("team", "t-1")),
+        }
+        with (
+            patch.dict(server._TOOL_HANDLERS, handlers),
+            patch.object(server, "get_shared_client"),
+        ):
+            response = await call_tool(
+                "batch-read",
+                {
+                    "calls": [
+                        {"tool": "list-teams"},
+                        {"tool": "get-team", "arguments": {"team_id": "t-1"}},
+                    ]
+                },
+            )
+
+        assert len(response) == 2
+        assert response[0].text.startswith("Operation: List Teams")
+        assert "RESOURCE_NOT_FOUND" in response[1].text
+        handlers["get-team"].assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_read_rejects_mutating_tools(self) -> None:
+        """Test that only list-*/get-* tools may be batched."""
+        handler = AsyncMock()
+        with patch.dict(server._TOOL_HANDLERS, {"delete-team": handler}):
+            response = await call_tool(
+                "batch-read", {"calls": [{"tool": "delete-team", "arguments": {"team_id": "t"}}]}
+            )
+
+        assert "INVALID_PARAMETER" in response[0].text
+        assert "calls.0.tool" in response[0].text
+        handler.assert_not_awaited()
+
+
+class TestEventLoopFactory:
+    """Test suite for choosing the event loop implementation."""
+
+    def test_uvloop_used_when_installed(self) -> None:
+        """Test that uvloop's loop constructor is returned when importable."""
+        uvloop = MagicMock()
+        with patch.dict("sys.modules", {"uvloop": uvloop}):
+            assert server._event_loop_factory() is uvloop.new_event_loop
+
+    def test_default_loop_without_uvloop(self) -> None:
+        """Test that the default loop is used when uvloop is missing."""
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert server._event_loop_factory() is None
@@ -10,8 +10,12 @@ Tests cover:
 - Error handling
 """
 
+import json
+
 import pytest
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pydantic import ValidationError
 
 from apigee_hybrid_mcp.models.team import Team, TeamCreate, TeamUpdate
 from apigee_hybrid_mcp.repository.team_repository import (
@@ -54,16 +58,16 @@ class TestTeamModel:
 
     def test_team_name_validation_hyphen_edges(self) -> None:
         """Test team name validation rejects hyphens at edges."""
-        with pytest.raises(ValueError, match="cannot start or end with hyphen"):
+        with pytest.raises(ValueError, match="should match pattern"):
             TeamCreate(name="-invalid")
-        with pytest.raises(ValueError, match="cannot start or end with hyphen"):
+        with pytest.raises(ValueError, match="should match pattern"):
             TeamCreate(name="invalid-")
 
     def test_team_name_validation_underscore_edges(self) -> None:
         """Test team name validation rejects underscores at edges."""
-        with pytest.raises(ValueError, match="cannot start or end with underscore"):
+        with pytest.raises(ValueError, match="should match pattern"):
             TeamCreate(name="_invalid")
-        with pytest.raises(ValueError, match="cannot start or end with underscore"):
+        with pytest.raises(ValueError, match="should match pattern"):
             TeamCreate(name="invalid_")
 
     def test_team_members_validation_duplicates(self) -> None:
@@ -98,6 +102,27 @@ class TestTeamModel:
         assert "created_at" in team_dict
         assert "updated_at" in team_dict
 
+    def test_team_is_frozen(self) -> None:
+        """Test that stored teams cannot be modified in place."""
+        team = Team(id="team-123", name="test-team")
+        with pytest.raises(ValidationError):
+            team.description = "changed"
+
+    def test_team_to_dict_refreshes_timestamps_after_copy(self) -> None:
+        """Test that cached ISO timestamps follow updated values."""
+        team = Team(
+            id="team-123",
+            name="test-team",
+            created_at=datetime(2024, 1, 1, 0, 0, 0),
+            updated_at=datetime(2024, 1, 2, 0, 0, 0),
+        )
+        assert team.to_dict()["updated_at"] == "2024-01-02T00:00:00"
+
+        updated = team.model_copy(update={"updated_at": datetime(2024, 1, 3, 0, 0, 0)})
+        assert updated.to_dict()["updated_at"] == "2024-01-03T00:00:00"
+        assert updated.to_dict()["created_at"] == "2024-01-01T00:00:00"
+        assert team.to_dict()["updated_at"] == "2024-01-02T00:00:00"
+
 
 @pytest.mark.asyncio
 class TestInMemoryTeamRepository:
@@ -162,6 +187,17 @@ class TestInMemoryTeamRepository:
         assert team is not None
         assert team.name == "engineering"
 
+    async def test_get_by_name_after_update(self) -> None:
+        """Test that name lookups return the latest version of a team."""
+        repo = InMemoryTeamRepository()
+        created = await repo.create(TeamCreate(name="engineering"))
+        await repo.update(created.id, TeamUpdate(description="Updated"))
+
+        team = await repo.get_by_name("engineering")
+
+        assert team is not None
+        assert team.description == "Updated"
+
     async def test_get_by_name_not_found(self) -> None:
         """Test getting a non-existent team by name returns None."""
         repo = InMemoryTeamRepository()
@@ -193,6 +229,42 @@ class TestInMemoryTeamRepository:
         assert "team2" in team_names
         assert "team3" in team_names
 
+    async def test_list_all_keeps_creation_order_after_update(self) -> None:
+        """Test that updating a team does not move it in the listing."""
+        repo = InMemoryTeamRepository()
+        first = await repo.create(TeamCreate(name="team1"))
+        await repo.create(TeamCreate(name="team2"))
+        await repo.update(first.id, TeamUpdate(description="Updated"))
+        await repo.create(TeamCreate(name="team3"))
+
+        teams = await repo.list_all()
+
+        assert [t.name for t in teams] == ["team1", "team2", "team3"]
+
+    async def test_list_all_reflects_writes(self) -> None:
+        """Test that the cached listing is refreshed after each write."""
+        repo = InMemoryTeamRepository()
+        team = await repo.create(TeamCreate(name="team1"))
+        assert [t.description for t in await repo.list_all()] == [None]
+
+        await repo.update(team.id, TeamUpdate(description="Updated"))
+        assert [t.description for t in await repo.list_all()] == ["Updated"]
+
+        await repo.create(TeamCreate(name="team2"))
+        assert len(await repo.list_all()) == 2
+
+        await repo.delete(team.id)
+        assert [t.name for t in await repo.list_all()] == ["team2"]
+
+    async def test_list_all_returns_independent_lists(self) -> None:
+        """Test that mutating a returned list does not affect later calls."""
+        repo = InMemoryTeamRepository()
+        await repo.create(TeamCreate(name="team1"))
+
+        (await repo.list_all()).clear()
+
+        assert len(await repo.list_all()) == 1
+
     async def test_update_team_success(self) -> None:
         """Test updating a team successfully."""
         repo = InMemoryTeamRepository()
@@ -272,6 +344,15 @@ class TestInMemoryTeamRepository:
 
         assert exists is False
 
+    async def test_bulk_operations(self) -> None:
+        """Test the async bulk create and lookup API."""
+        repo = InMemoryTeamRepository()
+
+        teams = await repo.bulk_create([TeamCreate(name="team1"), TeamCreate(name="team2")])
+        found = await repo.bulk_get_by_ids([teams[1].id, "missing"])
+
+        assert found == {teams[1].id: teams[1]}
+
     async def test_team_immutability(self) -> None:
         """Test that team name cannot be changed after creation."""
         repo = InMemoryTeamRepository()
@@ -283,3 +364,202 @@ class TestInMemoryTeamRepository:
 
         # Name should remain unchanged
         assert updated_team.name == created_team.name
+
+
+class TestInMemoryTeamRepositorySync:
+    """Test suite for the synchronous InMemoryTeamRepository API."""
+
+    def test_sync_round_trip(self) -> None:
+        """Test that the sync variants share state with the async API."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="engineering"))
+
+        assert repo.get_by_id_sync(team.id) is team
+        assert repo.get_by_name_sync("engineering") is team
+        assert repo.exists_by_name_sync("engineering") is True
+        assert repo.list_all_sync() == [team]
+
+        updated = repo.update_sync(team.id, TeamUpdate(description="Updated"))
+        assert updated.description == "Updated"
+
+        assert repo.delete_sync(team.id) is True
+        assert repo.list_all_sync() == []
+
+    def test_sync_errors(self) -> None:
+        """Test that the sync variants raise the same errors."""
+        repo = InMemoryTeamRepository()
+        repo.create_sync(TeamCreate(name="engineering"))
+
+        with pytest.raises(TeamAlreadyExistsError):
+            repo.create_sync(TeamCreate(name="engineering"))
+        with pytest.raises(TeamNotFoundError):
+            repo.update_sync("missing", TeamUpdate(description="x"))
+
+    def test_ids_are_uuid_hex_by_default(self) -> None:
+        """Test that generated IDs are 32-character UUID hex strings."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="engineering"))
+
+        assert len(team.id) == 32
+        int(team.id, 16)
+
+    def test_counter_ids(self) -> None:
+        """Test that counter IDs are sequential when UUIDs are disabled."""
+        repo = InMemoryTeamRepository(use_uuid=False)
+
+        first = repo.create_sync(TeamCreate(name="team1"))
+        second = repo.create_sync(TeamCreate(name="team2"))
+
+        assert (first.id, second.id) == ("team-1", "team-2")
+
+    def test_members_are_not_shared_with_caller_input(self) -> None:
+        """Test that stored members are independent of the caller's lists."""
+        repo = InMemoryTeamRepository()
+        members = ["a@example.com"]
+        team = repo.create_sync(TeamCreate(name="engineering", members=members))
+        members.append("b@example.com")
+
+        new_members = ["c@example.com"]
+        updated = repo.update_sync(team.id, TeamUpdate(members=new_members))
+        new_members.append("d@example.com")
+
+        assert team.members == ["a@example.com"]
+        assert updated.members == ["c@example.com"]
+
+    def test_timestamps_come_from_now_hook(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that create and update stamp teams through the _now hook."""
+        repo = InMemoryTeamRepository()
+        fixed = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        monkeypatch.setattr(repo, "_now", lambda: fixed)
+
+        team = repo.create_sync(TeamCreate(name="engineering"))
+        updated = repo.update_sync(team.id, TeamUpdate(description="Updated"))
+
+        assert team.created_at == team.updated_at == fixed
+        assert updated.updated_at == fixed
+
+    def test_get_by_member_tracks_writes(self) -> None:
+        """Test that the member index follows create, update and delete."""
+        repo = InMemoryTeamRepository()
+        alpha = repo.create_sync(TeamCreate(name="alpha", members=["a@x.com", "b@x.com"]))
+        beta = repo.create_sync(TeamCreate(name="beta", members=["b@x.com"]))
+
+        assert [t.name for t in repo.get_by_member_sync("b@x.com")] == ["alpha", "beta"]
+        assert [t.name for t in repo.get_by_member_sync("a@x.com")] == ["alpha"]
+        assert repo.get_by_member_sync("nobody@x.com") == []
+
+        repo.update_sync(alpha.id, TeamUpdate(members=["c@x.com"]))
+        assert repo.get_by_member_sync("a@x.com") == []
+        assert [t.name for t in repo.get_by_member_sync("b@x.com")] == ["beta"]
+        assert repo.get_by_member_sync("c@x.com")[0].members == ["c@x.com"]
+
+        repo.update_sync(alpha.id, TeamUpdate(description="Members unchanged"))
+        assert repo.get_by_member_sync("c@x.com")[0].description == "Members unchanged"
+
+        repo.delete_sync(beta.id)
+        assert repo.get_by_member_sync("b@x.com") == []
+
+    def test_reads_skip_teams_removed_mid_write(self) -> None:
+        """Test that index entries whose team is already gone are skipped, not raised."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="alpha", members=["a@x.com"]))
+        # State between a writer's two index updates during delete
+        del repo._teams[team.id]
+
+        assert repo.get_by_member_sync("a@x.com") == []
+        assert repo.bulk_get_by_ids_sync([team.id]) == {}
+
+    def test_bulk_create(self) -> None:
+        """Test that bulk_create stores every team with one shared timestamp."""
+        repo = InMemoryTeamRepository()
+
+        teams = repo.bulk_create_sync([TeamCreate(name="team1"), TeamCreate(name="team2")])
+
+        assert [t.name for t in teams] == ["team1", "team2"]
+        assert teams[0].created_at == teams[1].created_at
+        assert repo.list_all_sync() == teams
+        assert repo.get_by_name_sync("team2") is teams[1]
+
+    def test_bulk_create_duplicate_leaves_repository_unchanged(self) -> None:
+        """Test that a duplicate name aborts the whole batch."""
+        repo = InMemoryTeamRepository()
+        repo.create_sync(TeamCreate(name="existing"))
+
+        with pytest.raises(TeamAlreadyExistsError, match="existing"):
+            repo.bulk_create_sync([TeamCreate(name="fresh"), TeamCreate(name="existing")])
+        with pytest.raises(TeamAlreadyExistsError, match="twice"):
+            repo.bulk_create_sync([TeamCreate(name="twice"), TeamCreate(name="twice")])
+
+        assert [t.name for t in repo.list_all_sync()] == ["existing"]
+
+    def test_bulk_get_by_ids_skips_missing(self) -> None:
+        """Test that bulk_get_by_ids returns only the teams that exist."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="team1"))
+
+        assert repo.bulk_get_by_ids_sync([team.id, "missing"]) == {team.id: team}
+
+    def test_names_are_case_insensitive(self) -> None:
+        """Test that name lookups and duplicate checks ignore case."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="Admins"))
+
+        assert team.name == "Admins"
+        assert repo.get_by_name_sync("admins") is team
+        assert repo.exists_by_name_sync("ADMINS") is True
+        with pytest.raises(TeamAlreadyExistsError):
+            repo.create_sync(TeamCreate(name="admins"))
+
+        repo.delete_sync(team.id)
+        assert repo.exists_by_name_sync("Admins") is False
+
+    def test_revision_advances_on_writes_only(self) -> None:
+        """Test that reads leave the revision alone and writes advance it."""
+        repo = InMemoryTeamRepository()
+        assert repo.list_all_versioned_sync() == (0, [])
+
+        team = repo.create_sync(TeamCreate(name="team1"))
+        repo.get_by_id_sync(team.id)
+        repo.list_all_sync()
+        assert repo.revision == 1
+
+        repo.update_sync(team.id, TeamUpdate(description="Updated"))
+        repo.bulk_create_sync([TeamCreate(name="team2"), TeamCreate(name="team3")])
+        repo.delete_sync(team.id)
+        repo.delete_sync("missing")
+
+        revision, teams = repo.list_all_versioned_sync()
+        assert revision == 4
+        assert [t.name for t in teams] == ["team2", "team3"]
+
+    def test_concurrent_writers_from_threads(self) -> None:
+        """Test that writers on several threads keep the indices consistent."""
+        repo = InMemoryTeamRepository(use_uuid=False)
+
+        def create_team(index: int) -> None:
+            repo.create_sync(TeamCreate(name=f"team-{index:03d}", members=["shared@x.com"]))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(create_team, range(200)))
+
+        assert repo.revision == 200
+        assert len(repo.list_all_sync()) == 200
+        assert len({t.id for t in repo.list_all_sync()}) == 200
+        assert len(repo.get_by_member_sync("shared@x.com")) == 200
+
+    def test_list_all_json_is_cached_until_write(self) -> None:
+        """Test that the JSON listing is reused and refreshed after writes."""
+        repo = InMemoryTeamRepository()
+        team = repo.create_sync(TeamCreate(name="team1"))
+
+        encoded = repo.list_all_json_sync()
+        assert json.loads(encoded) == [team.to_dict()]
+        assert repo.list_all_json_sync() is encoded
+
+        repo.update_sync(team.id, TeamUpdate(description="Updated"))
+        assert json.loads(repo.list_all_json_sync())[0]["description"] == "Updated"
+
+    def test_repository_error_messages(self) -> None:
+        """Test that repository errors still render readable messages."""
+        assert str(TeamNotFoundError("team-1")) == "Team not found: team-1"
+        assert str(TeamAlreadyExistsError("alpha")) == "Team already exists: alpha"
@@ -28,8 +28,8 @@ class TestDebugSessions:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_debug_session)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_debug_session).encode()
         )
 
         # Act
@@ -52,8 +52,8 @@ class TestDebugSessions:
         import json
 
         mock_apigee_client.session.request.return_value.__aenter__.return_value.status = 200
-        mock_apigee_client.session.request.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value=json.dumps(sample_trace_data)
+        mock_apigee_client.session.request.return_value.__aenter__.return_value.read = AsyncMock(
+            return_value=json.dumps(sample_trace_data).encode()
         )
 
         # Act